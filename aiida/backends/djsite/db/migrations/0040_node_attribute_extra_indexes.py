@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida_core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+# pylint: disable=invalid-name,too-few-public-methods
+"""
+Add expression indexes for the attributes and extras of nodes that are frequently filtered on
+"""
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+from __future__ import absolute_import
+
+# Remove when https://github.com/PyCQA/pylint/issues/1931 is fixed
+# pylint: disable=no-name-in-module,import-error
+from django.db import migrations
+from aiida.backends.djsite.db.migrations import upgrade_schema_version
+
+REVISION = '1.0.40'
+DOWN_REVISION = '1.0.39'
+
+# Name of the index and the field and key of the value that it indexes
+INDEXES = (
+    ('db_dbnode_extras_aiida_hash_btree', 'extras', '_aiida_hash'),
+    ('db_dbnode_attributes_process_state_btree', 'attributes', 'process_state'),
+    ('db_dbnode_attributes_exit_status_btree', 'attributes', 'exit_status'),
+    ('db_dbnode_attributes_md5_btree', 'attributes', 'md5'),
+)
+
+
+class Migration(migrations.Migration):
+    """Add expression indexes for the attributes and extras of nodes that are frequently filtered on"""
+
+    dependencies = [
+        ('db', '0039_reset_hash'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            """CREATE INDEX {} ON db_dbnode USING btree (({} #> '{{{}}}'::text[]));""".format(name, field, key),
+            reverse_sql="""DROP INDEX {};""".format(name)) for name, field, key in INDEXES
+    ] + [upgrade_schema_version(REVISION, DOWN_REVISION)]
@@ -210,3 +210,9 @@ def delete_nodes_and_connections_django(pks_to_delete):  # pylint: disable=inval
         models.DbLink.objects.filter(Q(input__in=pks_to_delete) | Q(output__in=pks_to_delete)).delete()
         # now delete nodes
         models.DbNode.objects.filter(pk__in=pks_to_delete).delete()
+
+
+def close_thread_session_django():
+    """Close the database connection of the current thread, which Django opens for every thread that uses it."""
+    from django.db import connection
+    connection.close()
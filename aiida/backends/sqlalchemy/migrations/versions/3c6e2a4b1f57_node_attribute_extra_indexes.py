@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida_core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+# pylint: disable=invalid-name,no-member
+"""Add expression indexes for the attributes and extras of nodes that are frequently filtered on
+
+Revision ID: 3c6e2a4b1f57
+Revises: e797afa09270
+Create Date: 2019-07-15 10:12:41.381209
+
+"""
+from __future__ import division
+from __future__ import print_function
+from __future__ import absolute_import
+from alembic import op
+
+# Remove when https://github.com/PyCQA/pylint/issues/1931 is fixed
+# pylint: disable=no-name-in-module,import-error
+from sqlalchemy.sql import text
+
+# revision identifiers, used by Alembic.
+revision = '3c6e2a4b1f57'
+down_revision = 'e797afa09270'
+branch_labels = None
+depends_on = None
+
+# Name of the index and the field and key of the value that it indexes
+INDEXES = (
+    ('db_dbnode_extras_aiida_hash_btree', 'extras', '_aiida_hash'),
+    ('db_dbnode_attributes_process_state_btree', 'attributes', 'process_state'),
+    ('db_dbnode_attributes_exit_status_btree', 'attributes', 'exit_status'),
+    ('db_dbnode_attributes_md5_btree', 'attributes', 'md5'),
+)
+
+
+def upgrade():
+    """Create the expression indexes."""
+    conn = op.get_bind()
+
+    for name, field, key in INDEXES:
+        statement = text("""CREATE INDEX {} ON db_dbnode USING btree (({} #> '{{{}}}'::text[]));""".format(
+            name, field, key))
+        conn.execute(statement)
+
+
+def downgrade():
+    """Drop the expression indexes."""
+    conn = op.get_bind()
+
+    for name, _, _ in INDEXES:
+        conn.execute(text("""DROP INDEX {};""".format(name)))
@@ -76,25 +76,37 @@ class Model(object):
         """
         Emulate the behavior of Django's save() method
 
+        Within an enclosing transaction the session is only flushed, since a commit would end that transaction.
+
         :param commit: whether to do a commit or just add to the session
         :return: the SQLAlchemy instance
         """
         sess = get_scoped_session()
         sess.add(self)
         if commit:
-            sess.commit()
+            _commit_unless_nested(sess)
         return self
 
     def delete(self, commit=True):
         """
         Emulate the behavior of Django's delete() method
 
+        Within an enclosing transaction the session is only flushed, since a commit would end that transaction.
+
         :param commit: whether to do a commit or just remover from the session
         """
         sess = get_scoped_session()
         sess.delete(self)
         if commit:
-            sess.commit()
+            _commit_unless_nested(sess)
+
+
+def _commit_unless_nested(session):
+    """Commit the session, unless it is within a nested transaction in which case it is only flushed."""
+    if session.transaction.nested:
+        session.flush()
+    else:
+        session.commit()
 
 
 Base = declarative_base(cls=Model, name='Model')
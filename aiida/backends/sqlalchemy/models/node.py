@@ -11,7 +11,7 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import absolute_import
 
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index, text
 from sqlalchemy.orm import relationship, backref
 from sqlalchemy.schema import Column
 from sqlalchemy.types import Integer, String, DateTime, Text
@@ -81,6 +81,14 @@ class DbNode(Base):
         passive_deletes=True
     )
 
+    # Expression indexes on the values of attributes and extras that are frequently filtered on
+    __table_args__ = (
+        Index('db_dbnode_extras_aiida_hash_btree', text("(extras #> '{_aiida_hash}'::text[])")),
+        Index('db_dbnode_attributes_process_state_btree', text("(attributes #> '{process_state}'::text[])")),
+        Index('db_dbnode_attributes_exit_status_btree', text("(attributes #> '{exit_status}'::text[])")),
+        Index('db_dbnode_attributes_md5_btree', text("(attributes #> '{md5}'::text[])")),
+    )
+
     def __init__(self, *args, **kwargs):
         super(DbNode, self).__init__(*args, **kwargs)
         # The behavior of an unstored Node instance should be that all its attributes should be initialized in
@@ -473,3 +473,11 @@ def delete_nodes_and_connections_sqla(pks_to_delete):
         raise e
     finally:
         session.close()
+
+
+def close_thread_session_sqla():
+    """Close the scoped session of the current thread and discard it, such that its connection is returned."""
+    from aiida.backends import sqlalchemy as sa
+
+    if sa.SCOPED_SESSION_CLASS is not None:
+        sa.SCOPED_SESSION_CLASS.remove()
@@ -86,6 +86,7 @@ DB_TEST_LIST = {
         'dataclasses': ['aiida.backends.tests.test_dataclasses'],
         'dbimporters': ['aiida.backends.tests.test_dbimporters'],
         'engine.daemon.client': ['aiida.backends.tests.engine.daemon.test_client'],
+        'engine.daemon.execmanager': ['aiida.backends.tests.engine.daemon.test_execmanager'],
         'engine.calc_job': ['aiida.backends.tests.engine.test_calc_job'],
         'engine.calcfunctions': ['aiida.backends.tests.engine.test_calcfunctions'],
         'engine.class_loader': ['aiida.backends.tests.engine.test_class_loader'],
@@ -111,7 +112,9 @@ DB_TEST_LIST = {
         'manage.configuration.migrations.': ['aiida.backends.tests.manage.configuration.migrations.test_migrations'],
         'manage.configuration.options.': ['aiida.backends.tests.manage.configuration.test_options'],
         'manage.configuration.profile.': ['aiida.backends.tests.manage.configuration.test_profile'],
+        'manage.database.indexes': ['aiida.backends.tests.manage.database.test_indexes'],
         'manage.external.postgres': ['aiida.backends.tests.manage.external.test_postgres'],
+        'manage.external.rmq': ['aiida.backends.tests.manage.external.test_rmq'],
         'nodes': ['aiida.backends.tests.test_nodes'],
         'orm.authinfos': ['aiida.backends.tests.orm.test_authinfos'],
         'orm.comments': ['aiida.backends.tests.orm.test_comments'],
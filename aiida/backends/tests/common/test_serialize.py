@@ -123,3 +123,57 @@ class TestSerialize(AiidaTestCase):
         deserialized = serialize.deserialize(serialized)
 
         self.assertEqual(attribute_dict, deserialized)
+
+
+class TestSerializeCheckpoint(AiidaTestCase):
+    """Tests for the checkpoint codecs."""
+
+    def setUp(self):
+        super(TestSerializeCheckpoint, self).setUp()
+        if serialize.msgpack is None:
+            self.skipTest('the `msgpack` package is not installed')
+
+    def test_msgpack_round_trip(self):
+        """Test the msgpack codec with nodes, groups, computers and types that msgpack does not support natively."""
+        import datetime
+        from aiida.common.extendeddicts import AttributeDict
+
+        node = orm.Data().store()
+        group = orm.Group(label='test_msgpack_round_trip').store()
+        date = datetime.datetime(2019, 6, 1, 12, 0)
+
+        data = {
+            'node': node,
+            'group': group,
+            'computer': self.computer,
+            'tuple': (1, 'a'),
+            ('Si',): [1.5, None, True],
+            'ctx': AttributeDict({'nested': {'a': 2}, 'date': date}),
+        }
+
+        checkpoint = serialize.serialize_checkpoint(data, codec='msgpack')
+        deserialized = serialize.deserialize_checkpoint(checkpoint)
+
+        self.assertTrue(checkpoint.startswith('msgpack:'))
+        self.assertEqual(deserialized['node'].uuid, node.uuid)
+        self.assertEqual(deserialized['group'].uuid, group.uuid)
+        self.assertEqual(deserialized['computer'].uuid, self.computer.uuid)  # pylint: disable=no-member
+        self.assertEqual(deserialized['tuple'], (1, 'a'))
+        self.assertEqual(deserialized[('Si',)], [1.5, None, True])
+        self.assertIsInstance(deserialized['ctx'], AttributeDict)
+        self.assertEqual(deserialized['ctx'], data['ctx'])
+
+    def test_yaml_checkpoint_fallback(self):
+        """Test that checkpoints written as yaml are read regardless of the codec."""
+        node = orm.Data().store()
+        data = {'node': node, 'list': [1, 2]}
+
+        for checkpoint in [serialize.serialize(data), serialize.serialize_checkpoint(data, codec='yaml')]:
+            deserialized = serialize.deserialize_checkpoint(checkpoint)
+            self.assertEqual(deserialized['node'].uuid, node.uuid)
+            self.assertEqual(deserialized['list'], [1, 2])
+
+    def test_unknown_codec(self):
+        """Test that an unknown codec raises."""
+        with self.assertRaises(ValueError):
+            serialize.serialize_checkpoint({}, codec='unknown')
@@ -0,0 +1,324 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida_core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Unit tests for the transport operations of the `execmanager` module."""
+from __future__ import division
+from __future__ import print_function
+from __future__ import absolute_import
+
+import functools
+import io
+import os
+import shutil
+import stat
+import tempfile
+
+import mock
+
+from aiida.backends.testbase import AiidaTestCase
+from aiida.engine.daemon import execmanager
+from aiida.transports.plugins.local import LocalTransport
+
+
+class TestUploadFiles(AiidaTestCase):
+    """Tests for the upload of the files of a calculation to its working directory with `_upload_files`."""
+
+    def setUp(self):
+        super(TestUploadFiles, self).setUp()
+        self.local = tempfile.mkdtemp()
+        self.workdir = tempfile.mkdtemp()
+        self.transport = LocalTransport()
+        self.transport.open()
+
+        os.mkdir(os.path.join(self.local, 'code'))
+        os.mkdir(os.path.join(self.local, 'input'))
+        os.mkdir(os.path.join(self.local, 'input', 'sub'))
+
+        self.write_file(os.path.join(self.local, 'code', 'run.sh'), '#!/bin/bash\n')
+        self.write_file(os.path.join(self.local, 'input', 'aiida.in'), 'input')
+        self.write_file(os.path.join(self.local, 'input', 'sub', 'nested.in'), 'nested')
+
+        self.code_files = [(os.path.join(self.local, 'code', 'run.sh'), 'run.sh')]
+        self.executables = ['run.sh']
+        self.input_files = [
+            (os.path.join(self.local, 'input', 'aiida.in'), 'aiida.in'),
+            (os.path.join(self.local, 'input', 'sub'), 'sub'),
+        ]
+
+    def tearDown(self):
+        self.transport.close()
+        shutil.rmtree(self.local)
+        shutil.rmtree(self.workdir)
+        super(TestUploadFiles, self).tearDown()
+
+    @staticmethod
+    def write_file(filepath, content):
+        with io.open(filepath, 'w', encoding='utf8') as handle:
+            handle.write(content)
+
+    def read_file(self, relpath):
+        with io.open(os.path.join(self.workdir, relpath), 'rb') as handle:
+            return handle.read()
+
+    def upload(self, archive):
+        """Upload the files of the test to the working directory, including a single object of the local copy list."""
+        local_copy_handles = [(io.BytesIO(b'\x00binary\xff'), 'local_copy.bin')]
+        execmanager._upload_files(  # pylint: disable=protected-access
+            self.transport, 1, self.workdir, self.code_files, self.executables, self.input_files, local_copy_handles,
+            archive=archive)
+
+    def assert_uploaded(self):
+        """Assert that all files were uploaded to the working directory and that no archive was left behind."""
+        self.assertEqual(self.read_file('run.sh'), b'#!/bin/bash\n')
+        self.assertEqual(self.read_file('aiida.in'), b'input')
+        self.assertEqual(self.read_file(os.path.join('sub', 'nested.in')), b'nested')
+        self.assertEqual(self.read_file('local_copy.bin'), b'\x00binary\xff')
+        self.assertTrue(os.stat(os.path.join(self.workdir, 'run.sh')).st_mode & stat.S_IXUSR)
+        self.assertFalse(os.path.exists(os.path.join(self.workdir, execmanager.UPLOAD_ARCHIVE_NAME)))
+
+    def test_upload_archive(self):
+        """Test that with `archive=True` all files are transferred as a single archive and unpacked remotely."""
+        with mock.patch.object(self.transport, 'putfile', wraps=self.transport.putfile) as putfile, \
+                mock.patch.object(self.transport, 'put') as put, \
+                mock.patch.object(self.transport, 'put_object_from_filelike') as put_object_from_filelike:
+            self.upload(archive=True)
+
+        putfile.assert_called_once()
+        self.assertEqual(putfile.call_args[0][1], os.path.join(self.workdir, execmanager.UPLOAD_ARCHIVE_NAME))
+        put.assert_not_called()
+        put_object_from_filelike.assert_not_called()
+        self.assert_uploaded()
+
+    def test_upload_archive_fallback(self):
+        """Test that if unpacking the archive fails, the files are uploaded one by one instead."""
+        exec_command_wait = self.transport.exec_command_wait
+
+        def failing_tar(command, **kwargs):
+            if 'tar -xf' in command:
+                return 2, '', 'tar: not available'
+            return exec_command_wait(command, **kwargs)
+
+        with mock.patch.object(self.transport, 'exec_command_wait', side_effect=failing_tar) as mocked:
+            self.upload(archive=True)
+
+        # The unpacking was attempted and the uploaded archive was removed afterwards
+        self.assertTrue(any('tar -xf' in call[0][0] for call in mocked.call_args_list))
+        self.assert_uploaded()
+
+    def test_upload_without_archive(self):
+        """Test that with `archive=False` the files are uploaded one by one without running any remote command."""
+        with mock.patch.object(self.transport, 'exec_command_wait') as mocked:
+            self.upload(archive=False)
+
+        mocked.assert_not_called()
+        self.assert_uploaded()
+
+
+class TestRetrieveFilesFromList(AiidaTestCase):
+    """Tests for the retrieval of files from the working directory of a calculation with `retrieve_files_from_list`."""
+
+    retrieve_list = [
+        'aiida.out',
+        'missing.out',
+        ['sub/*.dat', '.', 1],
+        ['sub/*/*.dat', 'nested', 2],
+        ['sub/deep/c.dat', 'flat', 0],
+        'sub',
+    ]
+
+    def setUp(self):
+        super(TestRetrieveFilesFromList, self).setUp()
+        self.workdir = tempfile.mkdtemp()
+        self.folders = []
+        self.transport = LocalTransport()
+        self.transport.open()
+
+        os.makedirs(os.path.join(self.workdir, 'sub', 'deep'))
+
+        for relpath, content in [('aiida.out', 'output'), ('sub/a.dat', 'a'), ('sub/b.dat', 'b'),
+                                 ('sub/deep/c.dat', 'c')]:
+            with io.open(os.path.join(self.workdir, relpath), 'w', encoding='utf8') as handle:
+                handle.write(content)
+
+    def tearDown(self):
+        self.transport.close()
+        for folder in [self.workdir] + self.folders:
+            shutil.rmtree(folder)
+        super(TestRetrieveFilesFromList, self).tearDown()
+
+    def retrieve(self, archive, retrieve_list=None, archive_max_size=0):
+        """Retrieve the files of the retrieve list into a new temporary folder and return its content.
+
+        :return: dictionary of the relative paths of all files in the folder onto their content
+        """
+        folder = tempfile.mkdtemp()
+        self.folders.append(folder)
+
+        retrieve_list = retrieve_list or self.retrieve_list
+        execmanager._retrieve_files_from_list(  # pylint: disable=protected-access
+            1, self.transport, self.workdir, folder, retrieve_list, archive=archive, archive_max_size=archive_max_size)
+
+        content = {}
+        for root, _, filenames in os.walk(folder):
+            for filename in filenames:
+                filepath = os.path.join(root, filename)
+                with io.open(filepath, 'r', encoding='utf8') as handle:
+                    content[os.path.relpath(filepath, folder)] = handle.read()
+
+        return content
+
+    def test_retrieve_one_by_one(self):
+        """Test the retrieval of plain entries, of patterns with different depths and of a folder."""
+        self.assertEqual(
+            self.retrieve(archive=False), {
+                'aiida.out': 'output',
+                'a.dat': 'a',
+                'b.dat': 'b',
+                os.path.join('nested', 'deep', 'c.dat'): 'c',
+                'flat': 'c',
+                os.path.join('sub', 'a.dat'): 'a',
+                os.path.join('sub', 'b.dat'): 'b',
+                os.path.join('sub', 'deep', 'c.dat'): 'c',
+            })
+
+    def test_retrieve_files_from_list(self):
+        """Test that the public function retrieves the files relative to the working directory of the calculation."""
+        folder = tempfile.mkdtemp()
+        self.folders.append(folder)
+        calculation = mock.Mock(pk=1, get_remote_workdir=mock.Mock(return_value=self.workdir))
+
+        execmanager.retrieve_files_from_list(calculation, self.transport, folder, ['aiida.out'])
+
+        with io.open(os.path.join(folder, 'aiida.out'), 'r', encoding='utf8') as handle:
+            self.assertEqual(handle.read(), 'output')
+
+    def test_retrieve_archive(self):
+        """Test that the retrieval through an archive uses a single transfer and gives the same result."""
+        expected = self.retrieve(archive=False)
+
+        with mock.patch.object(self.transport, 'get') as get:
+            self.assertEqual(self.retrieve(archive=True), expected)
+
+        get.assert_not_called()
+        self.assertFalse(os.path.exists(os.path.join(self.workdir, execmanager.RETRIEVE_ARCHIVE_NAME)))
+
+    def test_retrieve_archive_absolute_path(self):
+        """Test that entries with absolute paths are retrieved one by one when using the archive."""
+        retrieve_list = [os.path.join(self.workdir, 'aiida.out'), ['sub/*.dat', '.', 1]]
+        expected = self.retrieve(archive=False, retrieve_list=retrieve_list)
+
+        with mock.patch.object(self.transport, 'get', wraps=self.transport.get) as get:
+            self.assertEqual(self.retrieve(archive=True, retrieve_list=retrieve_list), expected)
+
+        get.assert_called_once()
+        self.assertEqual(get.call_args[0][0], os.path.join(self.workdir, 'aiida.out'))
+
+    def test_retrieve_archive_fallback(self):
+        """Test that if the archive cannot be created, the files are retrieved one by one instead."""
+        expected = self.retrieve(archive=False)
+        exec_command_wait = self.transport.exec_command_wait
+
+        def failing_tar(command, **kwargs):
+            if 'tar -czhf' in command:
+                return 2, '', 'tar: not available'
+            return exec_command_wait(command, **kwargs)
+
+        with mock.patch.object(self.transport, 'exec_command_wait', side_effect=failing_tar), \
+                mock.patch.object(self.transport, 'getfile') as getfile:
+            self.assertEqual(self.retrieve(archive=True), expected)
+
+        getfile.assert_not_called()
+
+    def test_retrieve_archive_unsafe_member(self):
+        """Test that an archive with a member outside of the sandbox is not extracted but the files are retrieved one
+        by one instead."""
+        import tarfile
+
+        expected = self.retrieve(archive=False)
+        escaped = os.path.join(os.path.dirname(self.workdir), 'escaped.txt')
+
+        def malicious_getfile(remotepath, localpath, *args, **kwargs):  # pylint: disable=unused-argument
+            with tarfile.open(localpath, mode='w:gz') as archive:
+                info = tarfile.TarInfo(name='../escaped.txt')
+                info.size = 0
+                archive.addfile(info, io.BytesIO())
+
+        with mock.patch.object(self.transport, 'getfile', side_effect=malicious_getfile):
+            self.assertEqual(self.retrieve(archive=True), expected)
+
+        # The sandbox folder in which the archive is extracted is a temporary directory just like the working directory
+        self.assertFalse(os.path.exists(escaped))
+
+    def test_get_unsafe_archive_member(self):
+        """Test the detection of archive members that would be extracted outside of the target folder."""
+        import tarfile
+
+        def member(name, kind=tarfile.REGTYPE, linkname=''):
+            info = tarfile.TarInfo(name=name)
+            info.type = kind
+            info.linkname = linkname
+            return info
+
+        get_unsafe = execmanager._get_unsafe_archive_member  # pylint: disable=protected-access
+
+        safe = [
+            member('aiida.out'),
+            member('./sub', tarfile.DIRTYPE),
+            member('sub/a.dat'),
+            member('link', tarfile.SYMTYPE, 'sub/a.dat'),
+            member('hard', tarfile.LNKTYPE, 'sub/a.dat'),
+        ]
+        self.assertIsNone(get_unsafe(safe))
+
+        for unsafe in [
+            [member('/etc/passwd')],
+            [member('../escaped')],
+            [member('sub/../../escaped')],
+            [member('link', tarfile.SYMTYPE, '/etc')],
+            [member('link', tarfile.SYMTYPE, '../..')],
+            [member('sub/link', tarfile.SYMTYPE, '../../escaped')],
+            [member('dirlink', tarfile.SYMTYPE, 'sub'), member('dirlink/escaped')],
+            [member('dirlink', tarfile.SYMTYPE, 'sub'), member('dirlink')],
+            [member('dirlink', tarfile.SYMTYPE, 'sub'), member('other', tarfile.SYMTYPE, 'dirlink/a.dat')],
+            [member('hard', tarfile.LNKTYPE, '../escaped')],
+            [member('device', tarfile.CHRTYPE)],
+            [member('fifo', tarfile.FIFOTYPE)],
+        ]:
+            self.assertIs(get_unsafe(safe + unsafe), unsafe[-1])
+
+
+class TestLogTransportSteps(AiidaTestCase):
+    """Tests for the passing of the logger extra of a calculation to the transport that executes its steps."""
+
+    def test_logger_extra(self):
+        """Test that the logger extra is set before each step and that results and exceptions are passed on."""
+        transport = LocalTransport()
+        logger_extra = {'objpk': 1}
+        calls = []
+
+        def step(name):
+            calls.append((name, transport._logger_extra))  # pylint: disable=protected-access
+            # Simulate the operation of another calculation that shares the transport
+            transport.set_logger_extra({'objpk': 2})
+            if name == 'fail':
+                raise IOError(name)
+            return name
+
+        def steps():
+            result = yield functools.partial(step, 'first')
+            self.assertEqual(result, 'first')
+            try:
+                yield functools.partial(step, 'fail')
+            except IOError:
+                yield functools.partial(step, 'last')
+
+        execmanager.execute_transport_steps(
+            execmanager._log_transport_steps(transport, logger_extra, steps()))  # pylint: disable=protected-access
+
+        self.assertEqual(calls, [('first', logger_extra), ('fail', logger_extra), ('last', logger_extra)])
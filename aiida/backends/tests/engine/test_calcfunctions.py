@@ -12,12 +12,17 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import absolute_import
 
+import threading
+
+import mock
+
 from aiida.backends.testbase import AiidaTestCase
 from aiida.common import exceptions
 from aiida.common.links import LinkType
-from aiida.engine import calcfunction, Process
+from aiida.engine import calcfunction, batched_provenance, utils, Process
+from aiida.engine.processes import functions
 from aiida.manage.caching import enable_caching
-from aiida.orm import Int, CalcFunctionNode
+from aiida.orm import load_node, Int, CalcFunctionNode, Node
 
 
 class TestCalcFunction(AiidaTestCase):
@@ -130,3 +135,76 @@ class TestCalcFunction(AiidaTestCase):
         # The node of the outermost `calcfunction` should have a single `CREATE` link and no `CALL_CALC` links
         self.assertEqual(len(node.get_outgoing(link_type=LinkType.CREATE).all()), 1)
         self.assertEqual(len(node.get_outgoing(link_type=LinkType.CALL_CALC).all()), 0)
+
+    def test_calcfunction_batched_provenance(self):
+        """Verify that calcfunctions run within a `batched_provenance` block store the same provenance."""
+        with batched_provenance():
+            results = [self.test_calcfunction.run_get_node(Int(value)) for value in range(5)]
+
+        for value, (result, node) in enumerate(results):
+            self.assertEqual(result.value, value + 1)
+            self.assertTrue(node.is_finished_ok)
+            loaded = load_node(node.pk)
+            self.assertEqual(len(loaded.get_incoming(link_type=LinkType.INPUT_CALC).all()), 1)
+            self.assertEqual(loaded.get_outgoing(link_type=LinkType.CREATE).one().node.uuid, result.uuid)
+
+    def test_calcfunction_batched_provenance_store_many(self):  # pylint: disable=invalid-name
+        """Verify that within a `batched_provenance` block the node is stored in bulk together with its inputs."""
+        data = Int(1)
+
+        store_many = Node.Collection.store_many
+
+        with mock.patch.object(Node.Collection, 'store_many', autospec=True, side_effect=store_many) as mocked:
+            with batched_provenance():
+                _, node = self.test_calcfunction.run_get_node(data)
+
+        # The first call stores the process with its inputs, the second one its outputs
+        _, nodes = mocked.call_args_list[0][0]
+        self.assertEqual([entry.uuid for entry in nodes], [data.uuid, node.uuid])
+        self.assertEqual(load_node(node.pk).get_incoming(link_type=LinkType.INPUT_CALC).one().node.uuid, data.uuid)
+
+    def test_calcfunction_batched_provenance_caching(self):  # pylint: disable=invalid-name
+        """Verify that within a `batched_provenance` block the node is stored by itself if caching is enabled."""
+        store_many = Node.Collection.store_many
+
+        with mock.patch.object(Node.Collection, 'store_many', autospec=True, side_effect=store_many) as mocked:
+            with enable_caching(CalcFunctionNode):
+                with batched_provenance():
+                    _, node = self.test_calcfunction.run_get_node(Int(1))
+
+        for call in mocked.call_args_list:
+            _, nodes = call[0]
+            self.assertNotIn(node.uuid, [entry.uuid for entry in nodes])
+
+    def test_batched_provenance_thread_local(self):
+        """Verify that a `batched_provenance` block only applies to the thread that opened it."""
+        runners = []
+
+        with batched_provenance():
+            # pylint: disable=protected-access
+            thread = threading.Thread(target=lambda: runners.append(functions._get_batched_runners()))
+            thread.start()
+            thread.join()
+            self.assertIsNotNone(functions._get_batched_runners())
+
+        self.assertEqual(runners, [None])
+        self.assertIsNone(functions._get_batched_runners())  # pylint: disable=protected-access
+
+    def test_calcfunction_batched_provenance_rollback(self):  # pylint: disable=invalid-name
+        """Verify that the provenance stored within a `batched_provenance` block is rolled back upon an exception."""
+        # Make sure the state change timestamp is written within the block, since writing a setting should not commit
+        utils._PROCESS_STATE_CHANGE_WRITTEN.clear()  # pylint: disable=protected-access
+        utils._PROCESS_STATE_CHANGE_PENDING.clear()  # pylint: disable=protected-access
+        timestamp = utils.get_process_state_change_timestamp('calculation')
+        uuids = []
+
+        with self.assertRaises(RuntimeError):
+            with batched_provenance():
+                _, node = self.test_calcfunction.run_get_node(self.default_int)
+                uuids.append(node.uuid)
+                raise RuntimeError
+
+        with self.assertRaises(exceptions.NotExistent):
+            load_node(uuids[0])
+
+        self.assertEqual(utils.get_process_state_change_timestamp('calculation'), timestamp)
@@ -49,3 +49,24 @@ class TestWf(AiidaTestCase):
         calc_node = runner.run_until_complete(gen.with_timeout(self.TIMEOUT, future))
 
         self.assertEqual(process.node.pk, calc_node.pk)
+
+    def test_calculation_watcher_polling(self):
+        """Verify that the watcher notifies the callbacks of multiple processes, including already terminated ones."""
+        runner = get_manager().get_runner()
+        terminated = test_processes.DummyProcess()
+        runner.run(terminated)
+        pending = [test_processes.DummyProcess() for _ in range(3)]
+
+        watcher = processes.futures.CalculationWatcher(loop=runner.loop, poll_interval=0)
+        notified = []
+
+        for process in [terminated] + pending:
+            watcher.add_callback(process.pid, notified.append)
+
+        for process in pending:
+            runner.run(process)
+
+        runner.run_until_complete(gen.with_timeout(self.TIMEOUT, gen.sleep(0.1)))
+        watcher.close()
+
+        self.assertEqual(sorted(notified), sorted(process.pid for process in [terminated] + pending))
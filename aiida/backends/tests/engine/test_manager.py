@@ -12,13 +12,20 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import absolute_import
 
+import shutil
+import tempfile
 import time
 
+import mock
 import tornado
+from tornado import gen
 
-from aiida.orm import AuthInfo, User
+from aiida.common.exceptions import RemoteOperationError
+from aiida.orm import AuthInfo, Computer, User
 from aiida.backends.testbase import AiidaTestCase
-from aiida.engine.processes.calcjobs.manager import JobManager, JobsList
+from aiida.engine.processes.calcjobs.manager import JobManager, JobsList, SharedJobsCache
+from aiida.schedulers import SchedulerError
+from aiida.schedulers.datastructures import JobInfo, JobState
 from aiida.engine.transports import TransportQueue
 
 
@@ -50,6 +57,16 @@ class TestJobManager(AiidaTestCase):
         with self.manager.request_job_info_update(self.auth_info, job_id=1) as request:
             self.assertIsInstance(request, tornado.concurrent.Future)
 
+    def test_request_job_submission(self):
+        """Test the `JobManager.request_job_submission` method."""
+        with self.manager.request_job_submission(self.auth_info, '/tmp/workdir', '_aiidasubmit.sh') as request:
+            self.assertIsInstance(request, tornado.concurrent.Future)
+
+    def test_request_job_kill(self):
+        """Test the `JobManager.request_job_kill` method."""
+        with self.manager.request_job_kill(self.auth_info, job_id=1) as request:
+            self.assertIsInstance(request, tornado.concurrent.Future)
+
 
 class TestJobsList(AiidaTestCase):
     """Test the `aiida.engine.processes.calcjobs.manager.JobsList` class."""
@@ -71,6 +88,127 @@ class TestJobsList(AiidaTestCase):
         minimum_poll_interval = self.auth_info.computer.get_minimum_job_poll_interval()
         self.assertEqual(self.jobs_list.get_minimum_update_interval(), minimum_poll_interval)
 
+    def test_get_update_interval(self):
+        """Test that the update interval adapts to the job states only if a maximum interval is defined."""
+        computer = self.auth_info.computer
+        minimum_interval = computer.get_minimum_job_poll_interval()
+        jobs_list = JobsList(self.auth_info, self.transport_queue, last_updated=time.time())
+
+        job_info = JobInfo()
+        job_info.job_id = '1'
+        job_info.job_state = JobState.RUNNING
+        job_info.requested_wallclock_time_seconds = 7 * 24 * 3600
+        job_info.wallclock_time_seconds = 0
+
+        with jobs_list.request_job_info_update('1'):
+            jobs_list._jobs_cache = {'1': job_info}  # pylint: disable=protected-access
+            self.assertEqual(jobs_list.get_update_interval(), minimum_interval)
+
+            computer.set_maximum_job_poll_interval(minimum_interval * 100)
+            try:
+                # A running job with a long remaining walltime is polled with the maximum interval
+                self.assertEqual(jobs_list.get_update_interval(), minimum_interval * 100)
+
+                # A job that is close to its requested walltime is polled with the minimum interval
+                job_info.wallclock_time_seconds = job_info.requested_wallclock_time_seconds
+                self.assertEqual(jobs_list.get_update_interval(), minimum_interval)
+
+                # A job that has only just been queued is polled with the minimum interval
+                job_info.job_state = JobState.QUEUED
+                self.assertEqual(jobs_list.get_update_interval(), minimum_interval)
+            finally:
+                computer.set_maximum_job_poll_interval(0.)
+
+    def test_error_backoff(self):
+        """Test that the delay until the next update is doubled for every consecutive failed poll."""
+        minimum_interval = self.auth_info.computer.get_minimum_job_poll_interval()
+        jobs_list = JobsList(self.auth_info, self.transport_queue, last_updated=time.time())
+
+        jobs_list._poll_failures = 3  # pylint: disable=protected-access
+        jobs_list._last_poll_failure = time.time()  # pylint: disable=protected-access
+        delay = jobs_list._get_next_update_delay()  # pylint: disable=protected-access
+        self.assertGreater(delay, minimum_interval * 7)
+        self.assertLessEqual(delay, minimum_interval * 8)
+
+    @staticmethod
+    @gen.coroutine
+    def wait(futures):
+        """Wait for all futures and return their results, where a future that raised is replaced by its exception."""
+        results = []
+        for future in futures:
+            try:
+                results.append((yield future))
+            except Exception as exception:  # pylint: disable=broad-except
+                results.append(exception)
+        raise gen.Return(results)
+
+    def test_submit_batch(self):
+        """Test that pending submissions are submitted with a single call and that failures only affect their job."""
+        scheduler = mock.Mock()
+        failure = SchedulerError('submission failed')
+        scheduler.submit_from_script_many.return_value = ['1', failure, '3']
+
+        with mock.patch.object(Computer, 'get_scheduler', return_value=scheduler), \
+                self.jobs_list.request_job_submission('/scratch/a', 'a.sh') as request_a, \
+                self.jobs_list.request_job_submission('/scratch/b', 'b.sh') as request_b, \
+                self.jobs_list.request_job_submission('/scratch/c', 'c.sh') as request_c:
+            results = self.loop.run_sync(lambda: self.wait([request_a, request_b, request_c]))
+
+        self.assertEqual(results, ['1', failure, '3'])
+        scheduler.submit_from_script_many.assert_called_once_with([('/scratch/a', 'a.sh'), ('/scratch/b', 'b.sh'),
+                                                                   ('/scratch/c', 'c.sh')])
+        scheduler.submit_from_script.assert_not_called()
+
+    def test_submit_single(self):
+        """Test that a single pending submission is submitted without the batched command."""
+        scheduler = mock.Mock()
+        scheduler.submit_from_script.return_value = '1'
+
+        with mock.patch.object(Computer, 'get_scheduler', return_value=scheduler), \
+                self.jobs_list.request_job_submission('/scratch/a', 'a.sh') as request:
+            self.assertEqual(self.loop.run_sync(lambda: request), '1')
+
+        scheduler.submit_from_script.assert_called_once_with('/scratch/a', 'a.sh')
+        scheduler.submit_from_script_many.assert_not_called()
+
+    def test_kill_batch(self):
+        """Test that pending kills are performed with a single call and that failed kills are verified per job."""
+        scheduler = mock.Mock()
+        scheduler.kill_many.return_value = {'1': True, '2': False, '3': False}
+
+        running = JobInfo()
+        running.job_id = '2'
+        running.job_state = JobState.RUNNING
+        scheduler.get_jobs.return_value = {'2': running}
+
+        with mock.patch.object(Computer, 'get_scheduler', return_value=scheduler), \
+                self.jobs_list.request_job_kill('1') as request_1, \
+                self.jobs_list.request_job_kill('2') as request_2, \
+                self.jobs_list.request_job_kill('3') as request_3:
+            results = self.loop.run_sync(lambda: self.wait([request_1, request_2, request_3]))
+
+        # The second job is still running so killing it failed, the third is no longer running so it counts as killed
+        self.assertIs(results[0], True)
+        self.assertIsInstance(results[1], RemoteOperationError)
+        self.assertIs(results[2], True)
+        scheduler.kill_many.assert_called_once_with(['1', '2', '3'])
+        scheduler.get_jobs.assert_called_once_with(jobs=['2', '3'], as_dict=True)
+        scheduler.kill.assert_not_called()
+
+    def test_kill_single(self):
+        """Test that a single pending kill is performed without the batched command and is verified if it failed."""
+        scheduler = mock.Mock()
+        scheduler.kill.return_value = False
+        scheduler.get_jobs.return_value = {}
+
+        with mock.patch.object(Computer, 'get_scheduler', return_value=scheduler), \
+                self.jobs_list.request_job_kill('1') as request:
+            self.assertIs(self.loop.run_sync(lambda: request), True)
+
+        scheduler.kill.assert_called_once_with('1')
+        scheduler.get_jobs.assert_called_once_with(jobs=['1'], as_dict=True)
+        scheduler.kill_many.assert_not_called()
+
     def test_last_updated(self):
         """Test the `JobsList.last_updated` method."""
         jobs_list = JobsList(self.auth_info, self.transport_queue)
@@ -79,3 +217,49 @@ class TestJobsList(AiidaTestCase):
         last_updated = time.time()
         jobs_list = JobsList(self.auth_info, self.transport_queue, last_updated=last_updated)
         self.assertEqual(jobs_list.last_updated, last_updated)
+
+
+class TestSharedJobsCache(AiidaTestCase):
+    """Test the `aiida.engine.processes.calcjobs.manager.SharedJobsCache` class."""
+
+    def setUp(self):
+        super(TestSharedJobsCache, self).setUp()
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        super(TestSharedJobsCache, self).tearDown()
+        shutil.rmtree(self.directory)
+
+    def test_read_write(self):
+        """Test that a jobs list written to the cache can be read back by another instance."""
+        cache = SharedJobsCache(self.directory, 1)
+        self.assertEqual(cache.read(), (None, {}))
+
+        job_info = JobInfo()
+        job_info.job_id = '123'
+        job_info.job_state = JobState.RUNNING
+        timestamp = time.time()
+        cache.write(timestamp, {'123': job_info})
+
+        read_timestamp, jobs = SharedJobsCache(self.directory, 1).read()
+        self.assertEqual(read_timestamp, timestamp)
+        self.assertEqual(list(jobs.keys()), ['123'])
+        self.assertEqual(jobs['123'].job_state, JobState.RUNNING)
+
+        # The cache of another authinfo should be independent
+        self.assertEqual(SharedJobsCache(self.directory, 2).read(), (None, {}))
+
+    def test_lease(self):
+        """Test that the lease can only be held by a single instance at a time."""
+        cache_one = SharedJobsCache(self.directory, 1)
+        cache_two = SharedJobsCache(self.directory, 1)
+
+        self.assertTrue(cache_one.acquire_lease())
+        self.assertTrue(cache_one.has_lease)
+        self.assertFalse(cache_two.acquire_lease())
+        self.assertFalse(cache_two.has_lease)
+
+        cache_one.release_lease()
+        self.assertFalse(cache_one.has_lease)
+        self.assertTrue(cache_two.acquire_lease())
+        cache_two.release_lease()
@@ -11,13 +11,16 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import absolute_import
 
-import six
+import os
+
+import mock
 import plumpy
 
 from aiida.backends.testbase import AiidaTestCase
 from aiida.backends.tests.utils.processes import DummyProcess
 from aiida.engine.persistence import AiiDAPersister
 from aiida.engine import Process, run
+from aiida.manage.database.delete.nodes import delete_nodes
 
 
 class TestProcess(AiidaTestCase):
@@ -61,7 +64,98 @@ class TestAiiDAPersister(AiidaTestCase):
         process = DummyProcess()
 
         self.persister.save_checkpoint(process)
-        self.assertTrue(isinstance(process.node.checkpoint, six.string_types))
+        self.assertEqual(self.persister.get_process_checkpoints(process.pid), [(process.pid, None)])
+
+        self.persister.delete_checkpoint(process.pid)
+        self.assertEqual(self.persister.get_process_checkpoints(process.pid), [])
+
+    def test_checkpoint_not_in_attributes(self):
+        """Test that checkpoints are no longer stored in the attributes of the process node."""
+        process = DummyProcess()
+
+        self.persister.save_checkpoint(process)
+        self.assertIsNone(process.node.checkpoint)
+
+    def test_tagged_checkpoints(self):
+        """Test saving, listing, loading and deleting tagged checkpoints."""
+        process = DummyProcess()
+
+        self.persister.save_checkpoint(process)
+        bundle_saved = self.persister.save_checkpoint(process, tag='tagged')
+
+        checkpoints = self.persister.get_process_checkpoints(process.pid)
+        self.assertEqual(sorted(checkpoints, key=str), [(process.pid, None), (process.pid, 'tagged')])
+        self.assertIn((process.pid, 'tagged'), self.persister.get_checkpoints())
+        self.assertDictEqual(bundle_saved, self.persister.load_checkpoint(process.pid, tag='tagged'))
+
+        self.persister.delete_process_checkpoints(process.pid)
+        self.assertEqual(self.persister.get_process_checkpoints(process.pid), [])
+
+        with self.assertRaises(plumpy.PersistenceError):
+            self.persister.load_checkpoint(process.pid, tag='tagged')
+
+    def test_save_checkpoint_fsync(self):
+        """Test that the checkpoint file and the entries of its directory are synced to disk when saving."""
+        process = DummyProcess()
+
+        with mock.patch.object(os, 'fsync', wraps=os.fsync) as fsync:
+            self.persister.save_checkpoint(process)
+
+        # Once for the temporary file, and for the directory before and after the file is moved in place
+        self.assertEqual(fsync.call_count, 3)
+        self.assertEqual(self.persister.get_process_checkpoints(process.pid), [(process.pid, None)])
+
+    def test_terminated_process_checkpoints(self):
+        """Test that all checkpoints of a process, including the tagged ones, are deleted when it terminates."""
+        process = DummyProcess()
+
+        self.persister.save_checkpoint(process)
+        self.persister.save_checkpoint(process, tag='tagged')
+        run(process)
+
+        self.assertEqual(process.runner.persister.directory, self.persister.directory)
+        self.assertEqual(self.persister.get_process_checkpoints(process.pid), [])
+
+    def test_delete_nodes_checkpoints(self):
+        """Test that deleting the node of a process also deletes all its checkpoints."""
+        process = DummyProcess()
+        other = DummyProcess()
+
+        self.persister.save_checkpoint(process)
+        self.persister.save_checkpoint(process, tag='tagged')
+        self.persister.save_checkpoint(other)
+
+        delete_nodes([process.pid], force=True)
+
+        self.assertEqual(self.persister.get_process_checkpoints(process.pid), [])
+        self.assertEqual(self.persister.get_process_checkpoints(other.pid), [(other.pid, None)])
+        self.persister.delete_process_checkpoints(other.pid)
+
+    def test_load_node_checkpoint(self):
+        """Test that a checkpoint stored in the node attributes by earlier versions can still be loaded."""
+        from aiida.orm.utils import serialize
+
+        process = DummyProcess()
+        bundle_saved = self.persister.save_checkpoint(process)
+        self.persister.delete_checkpoint(process.pid)
+        process.node.set_checkpoint(serialize.serialize(bundle_saved))
+
+        self.assertDictEqual(bundle_saved, self.persister.load_checkpoint(process.node.pk))
 
         self.persister.delete_checkpoint(process.pid)
-        self.assertEquals(process.node.checkpoint, None)
+        self.assertIsNone(process.node.checkpoint)
+
+    def test_load_msgpack_checkpoint(self):
+        """Test that a checkpoint written with the msgpack codec is loaded transparently."""
+        from aiida.orm.utils import serialize
+
+        if serialize.msgpack is None:
+            self.skipTest('the `msgpack` package is not installed')
+
+        process = DummyProcess()
+        bundle_saved = self.persister.save_checkpoint(process)
+        self.persister.delete_checkpoint(process.pid)
+        process.node.set_checkpoint(serialize.serialize_checkpoint(bundle_saved, codec='msgpack'))
+        bundle_loaded = self.persister.load_checkpoint(process.node.pk)
+
+        self.assertDictEqual(bundle_saved, bundle_loaded)
@@ -12,6 +12,7 @@ from __future__ import print_function
 from __future__ import absolute_import
 import threading
 
+import mock
 import plumpy
 from plumpy.utils import AttributesFrozendict
 
@@ -19,8 +20,10 @@ from aiida import orm
 from aiida.backends.testbase import AiidaTestCase
 from aiida.backends.tests.utils import processes as test_processes
 from aiida.common.lang import override
+from aiida.common.links import LinkType
 from aiida.engine import Process, run, run_get_pk, run_get_node
 from aiida.engine.processes.ports import PortNamespace
+from aiida.manage.configuration import get_config, get_config_option
 
 
 class NameSpacedProcess(Process):
@@ -276,3 +279,121 @@ class TestProcess(AiidaTestCase):
         self.assertTrue(node.is_finished)
         self.assertTrue(node.is_finished_ok)
         self.assertEqual(node.exit_status, 0)
+
+    def test_update_outputs_incremental(self):
+        """Test that outputs are linked once and that the linked outputs are tracked by the process."""
+
+        class TestProcess(Process):
+
+            _node_class = orm.WorkflowNode
+
+            @classmethod
+            def define(cls, spec):
+                super(TestProcess, cls).define(spec)
+                spec.outputs.dynamic = True
+                spec.outputs.valid_type = orm.Data
+
+            def run(self):
+                self.out('first', orm.Int(1).store())
+                self.update_outputs()
+                self.out('second', orm.Int(2).store())
+
+        process = TestProcess()
+        run(process)
+
+        outgoing = process.node.get_outgoing(link_type=LinkType.RETURN).all_link_labels()
+        self.assertEqual(sorted(outgoing), ['first', 'second'])
+        self.assertEqual(process._linked_output_labels, set(['first', 'second']))  # pylint: disable=protected-access
+        self.assertFalse(process._has_unlinked_outputs)  # pylint: disable=protected-access
+
+    def test_update_outputs_store_many(self):
+        """Test that unstored outputs are stored with their links in a single bulk insert."""
+
+        class TestProcess(Process):
+
+            _node_class = orm.CalculationNode
+
+            @classmethod
+            def define(cls, spec):
+                super(TestProcess, cls).define(spec)
+                spec.outputs.dynamic = True
+                spec.outputs.valid_type = orm.Data
+
+            def run(self):
+                shared = orm.Int(2)
+                self.out('first', orm.Int(1))
+                self.out('second', shared)
+                self.out('third', shared)
+
+        process = TestProcess()
+
+        collection = orm.Node.Collection
+        with mock.patch.object(collection, 'store_many', autospec=True, side_effect=collection.store_many) as mocked:
+            run(process)
+
+        mocked.assert_called_once()
+        self.assertEqual(len(mocked.call_args[0][1]), 2)
+
+        outgoing = process.node.get_outgoing(link_type=LinkType.CREATE)
+        self.assertEqual(sorted(outgoing.all_link_labels()), ['first', 'second', 'third'])
+        self.assertEqual(outgoing.get_node_by_label('second').pk, outgoing.get_node_by_label('third').pk)
+        self.assertEqual(outgoing.get_node_by_label('first').value, 1)
+
+
+class TestProcessTransitionTransaction(AiidaTestCase):
+    """Tests for the transaction in which the database writes of a process state transition are made."""
+
+    option = 'engine.coalesce_transition_writes'
+
+    def setUp(self):
+        super(TestProcessTransitionTransaction, self).setUp()
+        self.assertIsNone(Process.current())
+        self.config = get_config()
+        self.profile_name = self.config.current_profile.name
+        self.config.set_option(self.option, True, scope=self.profile_name)
+
+    def tearDown(self):
+        self.config.unset_option(self.option, scope=self.profile_name)
+        super(TestProcessTransitionTransaction, self).tearDown()
+        self.assertIsNone(Process.current())
+
+    def test_transition_transaction(self):
+        """Test that the writes of a state transition are made in a transaction that is closed after the transition."""
+
+        class TransactionProcess(test_processes.DummyProcess):
+            """Process that records whether it is within the transaction of a state transition."""
+
+            in_transaction = {}
+
+            def run(self):
+                self.in_transaction['run'] = self._transition_transaction is not None
+
+            def on_finish(self, result, successful):
+                self.in_transaction['finish'] = self._transition_transaction is not None
+                super(TransactionProcess, self).on_finish(result, successful)
+
+        process = TransactionProcess()
+        run(process)
+
+        self.assertEqual(TransactionProcess.in_transaction, {'run': False, 'finish': True})
+        self.assertIsNone(process._transition_transaction)  # pylint: disable=protected-access
+        self.assertTrue(orm.load_node(process.pid).is_finished_ok)
+
+    def test_transition_transaction_rollback(self):
+        """Test that the writes of a state transition that fails are rolled back."""
+        process = test_processes.DummyProcess()
+        process_state = orm.load_node(process.pid).process_state
+
+        # Fail the transition after the new state has been written to the node
+        with mock.patch('aiida.engine.utils.set_process_state_change_timestamp', side_effect=RuntimeError):
+            with self.assertRaises(RuntimeError):
+                process.transition_to(plumpy.ProcessState.KILLED, 'killed')
+
+        self.assertIsNone(process._transition_transaction)  # pylint: disable=protected-access
+        self.assertNotEqual(process_state, plumpy.ProcessState.KILLED)
+        self.assertEqual(orm.load_node(process.pid).process_state, process_state)
+
+    def test_disabled_by_default(self):
+        """Test that the writes of a state transition are not made in a single transaction by default."""
+        self.config.unset_option(self.option, scope=self.profile_name)
+        self.assertFalse(get_config_option(self.option))
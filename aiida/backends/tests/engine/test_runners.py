@@ -11,12 +11,22 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import absolute_import
 
+import io
+import threading
+
+import mock
 import plumpy
 
+from aiida import orm
 from aiida.backends.testbase import AiidaTestCase
-from aiida.engine import Process
+from aiida.common.datastructures import CalcJobState
+from aiida.common.links import LinkType
+from aiida.engine import Process, Runner
+from aiida.engine.processes.calcjobs.tasks import task_parse_job
+from aiida.engine.utils import instantiate_process, InterruptableFuture
 from aiida.manage.manager import get_manager
 from aiida.orm import WorkflowNode
+from aiida.plugins import CalculationFactory, ParserFactory
 
 
 class Proc(Process):
@@ -62,3 +72,62 @@ class TestWorkchain(AiidaTestCase):
         loop = self.runner.loop
         loop.call_later(seconds, the_hans_klok_comeback, self.runner.loop)
         loop.start()
+
+
+class TestRunnerParseExecutor(AiidaTestCase):
+    """Tests for the executor in which a runner parses calculation jobs outside of its event loop."""
+
+    def test_disabled_by_default(self):
+        """Without a parse pool size the runner parses in the event loop and has no executor."""
+        with Runner() as runner:
+            self.assertIsNone(runner.parse_executor)
+
+    def test_parse_executor(self):
+        """With a parse pool size the runner exposes an executor that runs functions outside of the event loop."""
+        with Runner(parse_pool_size=2) as runner:
+            self.assertIsNotNone(runner.parse_executor)
+            self.assertEqual(runner.parse_executor.submit(sum, [1, 2, 3]).result(), 6)
+
+    def test_parse_job(self):
+        """Test that the parse task runs the parser of a calculation job in the executor and attaches its outputs."""
+        code = orm.Code(remote_computer_exec=(self.computer, '/bin/true')).store()
+        inputs = {
+            'code': code,
+            'x': orm.Int(1),
+            'y': orm.Int(2),
+            'metadata': {
+                'options': {
+                    'resources': {
+                        'num_machines': 1,
+                        'num_mpiprocs_per_machine': 1
+                    },
+                    'max_wallclock_seconds': 60,
+                }
+            }
+        }
+
+        parser_class = ParserFactory('arithmetic.add')
+        parse = parser_class.parse
+        threads = []
+
+        def record_thread(parser, **kwargs):
+            threads.append(threading.current_thread())
+            return parse(parser, **kwargs)
+
+        with Runner(parse_pool_size=2) as runner:
+            process = instantiate_process(runner, CalculationFactory('arithmetic.add'), **inputs)
+            process.node.set_state(CalcJobState.PARSING)
+
+            retrieved = orm.FolderData()
+            retrieved.put_object_from_filelike(io.StringIO(u'3'), 'aiida.out')
+            retrieved.add_incoming(process.node, link_type=LinkType.CREATE, link_label='retrieved')
+            retrieved.store()
+
+            with mock.patch.object(parser_class, 'parse', autospec=True, side_effect=record_thread):
+                exit_code = runner.loop.run_sync(
+                    lambda: task_parse_job(process, runner.parse_executor, None, InterruptableFuture()))
+
+            self.assertEqual(exit_code.status, 0)
+            self.assertEqual(len(threads), 1)
+            self.assertIsNot(threads[0], threading.current_thread())
+            self.assertEqual(process.outputs['sum'].value, 3)
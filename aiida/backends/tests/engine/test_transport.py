@@ -12,7 +12,7 @@ from __future__ import print_function
 from __future__ import absolute_import
 
 from six.moves import range
-from tornado.gen import coroutine, Return
+from tornado.gen import coroutine, Return, sleep as gen_sleep
 
 from aiida.backends.testbase import AiidaTestCase
 from aiida.engine.transports import TransportQueue
@@ -143,3 +143,189 @@ class TestTransportQueue(AiidaTestCase):
 
         finally:
             transport_class._DEFAULT_SAFE_OPEN_INTERVAL = original_interval
+
+    def test_pooled_transport_reused(self):
+        """Verify that in pooled mode a released transport is kept open and handed out again."""
+        queue = TransportQueue(idle_timeout=10.)
+        loop = queue.loop()
+
+        @coroutine
+        def test():
+            with queue.request_transport(self.authinfo) as request:
+                trans = yield request
+            raise Return(trans)
+
+        try:
+            trans1 = loop.run_sync(lambda: test())
+            self.assertTrue(trans1.is_open)
+            trans2 = loop.run_sync(lambda: test())
+            self.assertIs(trans1, trans2)
+        finally:
+            queue.close()
+
+        self.assertFalse(trans1.is_open)
+
+    def test_pooled_transport_idle_timeout(self):
+        """Verify that a pooled transport is closed once the idle timeout has expired."""
+        queue = TransportQueue(idle_timeout=0.1)
+        loop = queue.loop()
+
+        @coroutine
+        def test():
+            with queue.request_transport(self.authinfo) as request:
+                trans = yield request
+            raise Return(trans)
+
+        trans = loop.run_sync(lambda: test())
+        self.assertTrue(trans.is_open)
+
+        loop.run_sync(lambda: gen_sleep(0.2))
+        self.assertFalse(trans.is_open)
+
+    def test_pooled_transport_reconnect(self):
+        """Verify that a pooled transport that is no longer alive is replaced by a newly opened one."""
+        queue = TransportQueue(idle_timeout=10.)
+        loop = queue.loop()
+
+        @coroutine
+        def test():
+            with queue.request_transport(self.authinfo) as request:
+                trans = yield request
+            raise Return(trans)
+
+        try:
+            trans1 = loop.run_sync(lambda: test())
+            trans1.close()
+            trans2 = loop.run_sync(lambda: test())
+            self.assertIsNot(trans1, trans2)
+            self.assertTrue(trans2.is_open)
+        finally:
+            queue.close()
+
+    def test_async_transport(self):
+        """Verify that operations of the asynchronous transport are executed in another thread and return results."""
+        import os
+        import threading
+
+        queue = TransportQueue()
+        loop = queue.loop()
+
+        def get_thread(transport):
+            self.assertTrue(transport.is_open)
+            return threading.current_thread()
+
+        @coroutine
+        def test():
+            with queue.request_transport(self.authinfo) as request:
+                yield request
+                async_transport = queue.get_async_transport(self.authinfo)
+                self.assertIs(async_transport, queue.get_async_transport(self.authinfo))
+                thread = yield async_transport.run(get_thread, async_transport.transport)
+                listing = yield async_transport.listdir(os.path.dirname(__file__))
+            raise Return((thread, listing))
+
+        thread, listing = loop.run_sync(lambda: test())
+        self.assertIsNot(thread, threading.current_thread())
+        self.assertIn(os.path.basename(__file__).replace('.pyc', '.py'), listing)
+
+    def test_async_transport_steps(self):
+        """Verify that exceptions of transport steps are thrown into the generator that yielded them."""
+        queue = TransportQueue()
+        loop = queue.loop()
+        results = []
+
+        def fail():
+            raise ValueError('step failed')
+
+        def steps():
+            results.append((yield lambda: 1))
+            try:
+                yield fail
+            except ValueError as exception:
+                results.append(str(exception))
+
+        @coroutine
+        def test():
+            with queue.request_transport(self.authinfo) as request:
+                yield request
+                yield queue.get_async_transport(self.authinfo).execute_steps(steps())
+
+        loop.run_sync(lambda: test())
+        self.assertEqual(results, [1, 'step failed'])
+
+    def test_async_transport_interleaved_calculations(self):
+        """Verify that the transport steps of two calculations that share a transport can interleave.
+
+        The steps of both calculations are executed alternately in the thread of the transport, so each step has to be
+        independent of the current working directory that was left behind by the steps of the other calculation.
+        """
+        import io
+        import os
+        import shutil
+        import tempfile
+        from tornado.gen import multi
+        from aiida.common.datastructures import CalcInfo
+        from aiida.common.folders import SandboxFolder
+        from aiida.engine.daemon import execmanager
+
+        workdir = tempfile.mkdtemp()
+        computer = orm.Computer(
+            name='interleaved', hostname='localhost', transport_type='local', scheduler_type='direct',
+            workdir=workdir).store()
+        authinfo = orm.AuthInfo(computer=computer, user=orm.User.objects.get_default()).store()
+        queue = TransportQueue()
+        loop = queue.loop()
+        nodes, calc_infos, temporary_folders = [], [], []
+
+        for index in range(2):
+            node = orm.CalcJobNode(computer=computer)
+            node.set_option('resources', {'num_machines': 1, 'num_mpiprocs_per_machine': 1})
+            node.set_retrieve_list(['output.txt'])
+            with SandboxFolder() as folder:
+                with io.open(folder.get_abs_path('input.txt'), 'w') as handle:
+                    handle.write(u'input {}'.format(index))
+                node.put_object_from_tree(folder.abspath)
+            node.store()
+
+            calc_info = CalcInfo()
+            calc_info.uuid = node.uuid
+            calc_info.codes_info = []
+            nodes.append(node)
+            calc_infos.append(calc_info)
+
+        @coroutine
+        def execute(generator_function, *args):
+            with queue.request_transport(authinfo) as request:
+                transport = yield request
+                async_transport = queue.get_async_transport(authinfo)
+                yield multi([async_transport.execute_steps(generator_function(transport, *arguments))
+                             for arguments in args])
+
+        def upload_steps(transport, node, calc_info):
+            return execmanager.upload_calculation_steps(node, transport, calc_info, 'aiida.submit')
+
+        def retrieve_steps(transport, node, folder):
+            return execmanager.retrieve_calculation_steps(node, transport, folder)
+
+        try:
+            loop.run_sync(lambda: execute(upload_steps, *zip(nodes, calc_infos)))
+
+            for index, node in enumerate(nodes):
+                remote_workdir = node.get_remote_workdir()
+                self.assertTrue(remote_workdir.startswith(workdir))
+                with io.open(os.path.join(remote_workdir, 'input.txt')) as handle:
+                    self.assertEqual(handle.read(), u'input {}'.format(index))
+                with io.open(os.path.join(remote_workdir, 'output.txt'), 'w') as handle:
+                    handle.write(u'output {}'.format(index))
+
+            temporary_folders.extend(tempfile.mkdtemp() for _ in nodes)
+            loop.run_sync(lambda: execute(retrieve_steps, *zip(nodes, temporary_folders)))
+
+            for index, node in enumerate(nodes):
+                self.assertEqual(node.outputs.retrieved.get_object_content('output.txt'), u'output {}'.format(index))
+        finally:
+            queue.close()
+            orm.AuthInfo.objects.delete(authinfo.id)
+            shutil.rmtree(workdir)
+            for folder in temporary_folders:
+                shutil.rmtree(folder)
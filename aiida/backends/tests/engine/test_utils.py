@@ -12,10 +12,12 @@ from __future__ import absolute_import
 from __future__ import print_function
 
 from tornado.ioloop import IOLoop
-from tornado.gen import coroutine
+from tornado.gen import coroutine, sleep
 
 from aiida import orm
 from aiida.backends.testbase import AiidaTestCase
+from aiida.common import AttributeDict
+from aiida.engine import utils
 from aiida.engine.utils import exponential_backoff_retry
 
 ITERATION = 0
@@ -64,3 +66,58 @@ class TestExponentialBackoffRetry(AiidaTestCase):
         max_attempts = MAX_ITERATIONS - 1
         with self.assertRaises(RuntimeError):
             loop.run_sync(lambda: exponential_backoff_retry(coro, initial_interval=0.1, max_attempts=max_attempts))
+
+
+class TestProcessStateChangeTimestamp(AiidaTestCase):
+    """Tests for the throttled setting of the process state change timestamp."""
+
+    def setUp(self):
+        super(TestProcessStateChangeTimestamp, self).setUp()
+        self.interval = utils.PROCESS_STATE_CHANGE_INTERVAL
+        utils.PROCESS_STATE_CHANGE_INTERVAL = 0.2
+        utils._PROCESS_STATE_CHANGE_WRITTEN.clear()  # pylint: disable=protected-access
+        utils._PROCESS_STATE_CHANGE_PENDING.clear()  # pylint: disable=protected-access
+
+    def tearDown(self):
+        utils.PROCESS_STATE_CHANGE_INTERVAL = self.interval
+        super(TestProcessStateChangeTimestamp, self).tearDown()
+
+    def test_throttled_write(self):
+        """Test that a state change within the interval is written after the interval has passed."""
+        loop = IOLoop()
+        process = AttributeDict({'node': orm.CalculationNode(), 'runner': AttributeDict({'loop': loop})})
+
+        utils.set_process_state_change_timestamp(process)
+        first = utils.get_process_state_change_timestamp('calculation')
+        self.assertIsNotNone(first)
+
+        utils.set_process_state_change_timestamp(process)
+        self.assertEqual(utils.get_process_state_change_timestamp('calculation'), first)
+
+        loop.run_sync(lambda: sleep(2 * utils.PROCESS_STATE_CHANGE_INTERVAL))
+        self.assertGreater(utils.get_process_state_change_timestamp('calculation'), first)
+
+    def test_write_pending(self):
+        """Test that a state change that is held back is written when flushing, even if the loop never runs."""
+        process = AttributeDict({'node': orm.CalculationNode(), 'runner': AttributeDict({'loop': IOLoop()})})
+
+        utils.set_process_state_change_timestamp(process)
+        first = utils.get_process_state_change_timestamp('calculation')
+
+        utils.set_process_state_change_timestamp(process)
+        self.assertEqual(utils.get_process_state_change_timestamp('calculation'), first)
+
+        utils.write_pending_process_state_change_timestamps()
+        self.assertGreater(utils.get_process_state_change_timestamp('calculation'), first)
+
+    def test_write_pending_runner_close(self):
+        """Test that a state change that is held back is written when the runner of the process is closed."""
+        from aiida.engine import Runner
+
+        with Runner() as runner:
+            process = AttributeDict({'node': orm.CalculationNode(), 'runner': runner})
+            utils.set_process_state_change_timestamp(process)
+            first = utils.get_process_state_change_timestamp('calculation')
+            utils.set_process_state_change_timestamp(process)
+
+        self.assertGreater(utils.get_process_state_change_timestamp('calculation'), first)
@@ -24,7 +24,7 @@ from aiida.backends.testbase import AiidaTestCase
 from aiida.common import exceptions
 from aiida.common.links import LinkType
 from aiida.common.utils import Capturing
-from aiida.engine import ExitCode, Process, ToContext, WorkChain, if_, while_, return_, launch, calcfunction
+from aiida.engine import ExitCode, Process, ToContext, WorkChain, if_, while_, return_, launch, calcfunction, append_
 from aiida.engine.persistence import ObjectLoader
 from aiida.manage.manager import get_manager
 from aiida.orm import load_node, Bool, Float, Int, Str
@@ -669,6 +669,39 @@ class TestWorkchain(AiidaTestCase):
 
         run_and_check_success(MainWorkChain)
 
+    def test_process_status_many_sub_processes(self):
+        """Test that process status only lists the first few sub processes when waiting for many of them."""
+
+        class MainWorkChain(WorkChain):
+
+            @classmethod
+            def define(cls, spec):
+                super(MainWorkChain, cls).define(spec)
+                spec.outline(cls.do_run)
+
+            def do_run(self):
+                pks = []
+                for i in range(self._PROCESS_STATUS_MAX_PKS + 2):
+                    node = self.submit(SubWorkChain)
+                    pks.append(str(node.pk))
+                    self.to_context(**{'subwc_{}'.format(i): node})
+
+                expected = pks[:self._PROCESS_STATUS_MAX_PKS] + ['...']
+                assert self.node.process_status == 'Waiting for {} child processes: {}'.format(
+                    len(pks), ', '.join(expected))
+
+        class SubWorkChain(WorkChain):
+
+            @classmethod
+            def define(cls, spec):
+                super(SubWorkChain, cls).define(spec)
+                spec.outline(cls.do_run)
+
+            def do_run(self):
+                return
+
+        run_and_check_success(MainWorkChain)
+
     def test_if_block_persistence(self):
         """
         This test was created to capture issue #902
@@ -763,6 +796,46 @@ class TestWorkchain(AiidaTestCase):
 
         run_and_check_success(Workchain)
 
+    def test_to_context_many(self):
+        """Verify that multiple awaitables, including ones for the outputs, are all resolved onto the context."""
+        val = Int(5).store()
+        number = 4
+
+        test_case = self
+
+        class SimpleWc(WorkChain):
+
+            @classmethod
+            def define(cls, spec):
+                super(SimpleWc, cls).define(spec)
+                spec.outline(cls.result)
+                spec.outputs.dynamic = True
+
+            def result(self):
+                self.out('result', val)
+
+        class Workchain(WorkChain):
+
+            @classmethod
+            def define(cls, spec):
+                super(Workchain, cls).define(spec)
+                spec.outline(cls.begin, cls.result)
+
+            def begin(self):
+                children = [self.submit(SimpleWc) for _ in range(number)]
+                for child in children:
+                    self.to_context(children=append_(child))
+                awaitable = append_(children[0])
+                awaitable.outputs = True
+                self.to_context(outputs=awaitable)
+
+            def result(self):
+                test_case.assertEqual(len(self.ctx.children), number)
+                test_case.assertTrue(all(child.outputs.result == val for child in self.ctx.children))
+                test_case.assertEqual(self.ctx.outputs, [{'result': val}])
+
+        run_and_check_success(Workchain)
+
     def test_persisting(self):
         persister = plumpy.test_utils.TestPersister()
         runner = get_manager().get_runner()
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida_core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Tests for the management of the indexes on the attributes and extras of nodes."""
+from __future__ import division
+from __future__ import print_function
+from __future__ import absolute_import
+
+from aiida import orm
+from aiida.backends.testbase import AiidaTestCase
+from aiida.common import exceptions
+from aiida.manage.database import indexes
+
+
+class TestIndexes(AiidaTestCase):
+    """Tests for the `aiida.manage.database.indexes` module."""
+
+    def tearDown(self):
+        for index in indexes.get_indexes():
+            if not index.default:
+                indexes.drop_index(index.name)
+        super(TestIndexes, self).tearDown()
+
+    def test_get_index_name(self):
+        """Test the names of the indexes, including those that exceed the maximum identifier length."""
+        self.assertEqual(indexes.get_index_name('extras', '_aiida_hash'), 'db_dbnode_extras_aiida_hash_btree')
+        self.assertEqual(indexes.get_index_name('attributes', 'a.B', 'gin'), 'db_dbnode_attributes_a_b_gin')
+
+        long_path = 'nested.' * 20
+        name = indexes.get_index_name('attributes', long_path)
+        self.assertEqual(len(name), indexes.MAX_INDEX_NAME_LENGTH)
+        self.assertTrue(name.endswith('_btree'))
+        self.assertNotEqual(name, indexes.get_index_name('attributes', long_path + 'other'))
+
+    def test_get_index_expression(self):
+        """Test that the index expressions are properly quoted."""
+        expression = indexes.get_index_expression('extras', '_aiida_hash')
+        self.assertEqual(expression, """(extras #> '{"_aiida_hash"}'::text[])""")
+
+        expression = indexes.get_index_expression('attributes', "a.b'c")
+        self.assertEqual(expression, """(attributes #> '{"a","b''c"}'::text[])""")
+
+    def test_default_indexes(self):
+        """Test that the indexes created by the migrations exist."""
+        names = [index.name for index in indexes.get_indexes() if index.default]
+        expected = [indexes.get_index_name(field, path) for field, path in indexes.DEFAULT_INDEXES]
+        self.assertEqual(sorted(names), sorted(expected))
+
+    def test_create_drop_index(self):
+        """Test creating and dropping an index."""
+        name = indexes.create_index('extras', 'project.name')
+        self.assertIn(name, [index.name for index in indexes.get_indexes()])
+
+        with self.assertRaises(exceptions.UniquenessError):
+            indexes.create_index('extras', 'project.name')
+
+        # The query builder filters should still return the correct results with the index in place
+        node = orm.Data()
+        node.set_extra('project', {'name': 'indexed'})
+        node.store()
+
+        builder = orm.QueryBuilder().append(orm.Data, filters={'extras.project.name': 'indexed'}, project='id')
+        self.assertEqual(builder.all(), [[node.pk]])
+
+        indexes.drop_index(name)
+        self.assertNotIn(name, [index.name for index in indexes.get_indexes()])
+
+        with self.assertRaises(exceptions.NotExistent):
+            indexes.drop_index(name)
+
+    def test_drop_default_index(self):
+        """Test that the indexes created by the migrations cannot be dropped."""
+        for field, path in indexes.DEFAULT_INDEXES:
+            name = indexes.get_index_name(field, path)
+
+            with self.assertRaises(exceptions.ModificationNotAllowed):
+                indexes.drop_index(name)
+
+            self.assertIn(name, [index.name for index in indexes.get_indexes()])
+
+    def test_create_index_invalid(self):
+        """Test that invalid arguments are rejected."""
+        with self.assertRaises(ValueError):
+            indexes.create_index('label', 'key')
+
+        with self.assertRaises(ValueError):
+            indexes.create_index('extras', 'key', index_type='hash')
+
+        with self.assertRaises(ValueError):
+            indexes.create_index('extras', 'key..nested')
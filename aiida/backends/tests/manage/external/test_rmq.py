@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida_core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Unit tests for the RabbitMQ components of the daemon workers"""
+from __future__ import division
+from __future__ import print_function
+from __future__ import absolute_import
+
+import threading
+import time
+import unittest
+import uuid
+
+import mock
+
+import kiwipy
+import kiwipy.rmq
+import plumpy
+
+from aiida.manage.external import rmq
+from aiida.manage.external.rmq import ProcessSlotScheduler
+
+
+class ProcessSlotSchedulerTest(unittest.TestCase):
+    """Test the `ProcessSlotScheduler` class"""
+
+    def setUp(self):
+        self.communicator = mock.Mock()
+        self.scheduler = ProcessSlotScheduler(self.communicator, slots=10, waiting_per_slot=5, max_prefetch=30)
+        self.scheduler.subscribe(lambda communicator, task: kiwipy.Future())
+        self.on_task = self.communicator.add_task_subscriber.call_args[0][0]
+
+    def test_invalid_arguments(self):
+        """Test that non positive numbers of slots are rejected."""
+        with self.assertRaises(ValueError):
+            ProcessSlotScheduler(self.communicator, slots=0, waiting_per_slot=5, max_prefetch=30)
+
+    def test_capacity(self):
+        """Test that waiting processes only take up a fraction of a slot."""
+        self.assertEqual(self.scheduler.get_capacity(), 10)
+
+        for pid in range(10):
+            self.on_task(self.communicator, pid)
+            self.scheduler.update_process(pid, plumpy.ProcessState.RUNNING)
+
+        # A saturated worker should not take on new processes
+        self.assertEqual(self.scheduler.num_active, 10)
+        self.assertEqual(self.scheduler.get_capacity(), 10)
+
+        with self.assertRaises(kiwipy.TaskRejected):
+            self.on_task(self.communicator, 10)
+
+        self.assertTrue(self.scheduler.is_paused)
+        self.communicator.remove_task_subscriber.assert_called_once_with(self.on_task)
+
+        for pid in range(10):
+            self.scheduler.update_process(pid, plumpy.ProcessState.WAITING)
+
+        # Ten waiting processes take up two slots, leaving eight free
+        self.assertEqual(self.scheduler.num_waiting, 10)
+        self.assertEqual(self.scheduler.get_capacity(), 18)
+
+    def test_max_prefetch(self):
+        """Test that the capacity never exceeds the maximum prefetch."""
+        for pid in range(30):
+            self.on_task(self.communicator, pid)
+            self.scheduler.update_process(pid, plumpy.ProcessState.WAITING)
+
+        self.assertEqual(self.scheduler.num_tasks, 30)
+        self.assertEqual(self.scheduler.get_capacity(), 30)
+
+    def test_terminated_processes(self):
+        """Test that processes are forgotten once they have reached a terminal state."""
+        self.scheduler.update_process(1, plumpy.ProcessState.WAITING)
+        self.scheduler.update_process(2, plumpy.ProcessState.RUNNING)
+        self.scheduler.update_process(1, plumpy.ProcessState.FINISHED)
+        self.scheduler.update_process(2, plumpy.ProcessState.EXCEPTED)
+
+        self.assertEqual(self.scheduler.num_active, 0)
+        self.assertEqual(self.scheduler.num_waiting, 0)
+        self.assertEqual(self.scheduler.get_capacity(), 10)
+
+
+class ProcessSlotSchedulerCommunicatorTest(unittest.TestCase):
+    """Test the `ProcessSlotScheduler` class with the task queue of an actual communicator"""
+
+    TIMEOUT = 10.
+
+    def setUp(self):
+        prefix = 'aiida.test.{}'.format(uuid.uuid4())
+        self.communicator = kiwipy.rmq.RmqThreadCommunicator.connect(
+            connection_params={'url': rmq.get_rmq_url()},
+            message_exchange=rmq.get_message_exchange_name(prefix),
+            task_exchange=rmq.get_task_exchange_name(prefix),
+            task_queue=rmq.get_launch_queue_name(prefix),
+            task_prefetch_count=10,
+            testing_mode=True)
+
+        self.lock = threading.Lock()
+        self.tasks = {}
+
+    def tearDown(self):
+        self.communicator.stop()
+
+    def subscriber(self, _communicator, task):
+        """Hold on to every task until its future is resolved by the test."""
+        future = kiwipy.Future()
+        with self.lock:
+            self.tasks[task] = future
+        return future
+
+    def wait_for(self, condition):
+        """Wait until the condition is met, failing the test after the timeout."""
+        start = time.time()
+        while not condition():
+            if time.time() - start > self.TIMEOUT:
+                self.fail('timed out waiting for the tasks of the communicator')
+            time.sleep(0.05)
+
+    def test_slots(self):
+        """Test that the worker only takes tasks for its free slots and that the other tasks stay in the queue."""
+        scheduler = ProcessSlotScheduler(self.communicator, slots=2, waiting_per_slot=2, max_prefetch=10)
+        scheduler.subscribe(self.subscriber)
+
+        for task in range(5):
+            self.communicator.task_send(task, no_reply=True)
+
+        # The per consumer prefetch count of the queue would allow all tasks, but there are only two free slots
+        self.wait_for(lambda: len(self.tasks) == 2 and scheduler.is_paused)
+        time.sleep(0.5)
+        self.assertEqual(len(self.tasks), 2)
+
+        # Two waiting processes take up a single slot, which frees up one slot for another task
+        for pid in list(self.tasks):
+            scheduler.update_process(pid, plumpy.ProcessState.WAITING)
+
+        self.wait_for(lambda: len(self.tasks) == 3 and scheduler.is_paused)
+        time.sleep(0.5)
+        self.assertEqual(len(self.tasks), 3)
+        self.assertEqual(scheduler.num_tasks, 3)
+
+        # Once the held tasks are done, the remaining tasks are consumed as well
+        def finish_tasks():
+            with self.lock:
+                futures = [(pid, future) for pid, future in self.tasks.items() if not future.done()]
+            for pid, future in futures:
+                scheduler.update_process(pid, plumpy.ProcessState.FINISHED)
+                future.set_result(True)
+            return len(self.tasks) == 5 and not futures
+
+        self.wait_for(finish_tasks)
+        self.wait_for(lambda: scheduler.num_tasks == 0)
+        self.assertEqual(sorted(self.tasks), list(range(5)))
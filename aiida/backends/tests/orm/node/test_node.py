@@ -48,6 +48,74 @@ class TestNode(AiidaTestCase):
             node.user = self.user
 
 
+    def test_store_many(self):
+        """Test storing multiple nodes, with links between them, at once."""
+        from aiida.common.hashing import _HASH_EXTRA_KEY
+
+        source = Data().store()
+        calculation = CalculationNode()
+        calculation.add_incoming(source, LinkType.INPUT_CALC, 'input')
+        outputs = [Data() for _ in range(3)]
+
+        for index, output in enumerate(outputs):
+            output.set_attribute('index', index)
+            output.add_incoming(calculation, LinkType.CREATE, 'output_{}'.format(index))
+
+        nodes = [calculation] + outputs
+        pks = Node.objects.store_many(nodes)
+
+        self.assertEqual(pks, [node.pk for node in nodes])
+        self.assertTrue(all(node.is_stored and not node.has_cached_links() for node in nodes))
+
+        for index, output in enumerate(outputs):
+            loaded = load_node(output.pk)
+            self.assertEqual(loaded.get_attribute('index'), index)
+            self.assertEqual(loaded.get_extra(_HASH_EXTRA_KEY), loaded.get_hash())
+            self.assertEqual(loaded.get_incoming().one().node.uuid, calculation.uuid)
+
+        self.assertEqual(load_node(calculation.pk).get_incoming().one().node.uuid, source.uuid)
+
+    def test_store_many_hash(self):
+        """Test that the hash of a process node whose inputs are stored in the same batch includes those inputs."""
+        from aiida.common.hashing import _HASH_EXTRA_KEY
+
+        source = Data()
+        source.set_attribute('value', 1)
+        calculation = CalculationNode()
+        calculation.add_incoming(source, LinkType.INPUT_CALC, 'input')
+
+        Node.objects.store_many([source, calculation])
+
+        for node in [source, calculation]:
+            loaded = load_node(node.pk)
+            self.assertIsNotNone(loaded.get_extra(_HASH_EXTRA_KEY))
+            self.assertEqual(loaded.get_extra(_HASH_EXTRA_KEY), loaded.get_hash())
+
+        # The hash of the calculation depends on the hash of its input
+        other = CalculationNode()
+        other.add_incoming(Data().store(), LinkType.INPUT_CALC, 'input')
+        other.store()
+        self.assertNotEqual(other.get_hash(), calculation.get_hash())
+
+    def test_store_many_invalid(self):
+        """Test that `store_many` raises before storing anything if any of the nodes cannot be stored."""
+        unstored_source = Data()
+        target = CalculationNode()
+        target.add_incoming(unstored_source, LinkType.INPUT_CALC, 'input')
+
+        with self.assertRaises(exceptions.ModificationNotAllowed):
+            Node.objects.store_many([target])
+
+        with self.assertRaises(exceptions.ModificationNotAllowed):
+            Node.objects.store_many([Data(), Data().store()])
+
+        with self.assertRaises(ValueError):
+            data = Data()
+            Node.objects.store_many([data, data])
+
+        self.assertFalse(target.is_stored)
+
+
 class TestNodeAttributesExtras(AiidaTestCase):
     """Test for node attributes and extras."""
 
@@ -364,6 +432,44 @@ class TestNodeAttributesExtras(AiidaTestCase):
         self.node.set_extra_many(extras)
         self.assertEqual(set(self.node.extras_keys()), set(extras))
 
+    def test_deferred_writes(self):
+        """Test that changes to the extras of stored nodes within `Node.objects.deferred_writes` are written on exit."""
+        self.node.set_extra_many({'unchanged': 0, 'deleted': 1, 'updated': 2})
+        self.node.store()
+        other = Data().store()
+
+        with Node.objects.deferred_writes():
+            self.node.set_extra('updated', 3)
+            self.node.set_extra_many({'added': 4, 'deleted': 5})
+            self.node.delete_extra('deleted')
+            other.set_extra('added', 6)
+
+            # The changes are visible on the nodes themselves, but have not yet been written to the database
+            self.assertEqual(self.node.extras, {'unchanged': 0, 'updated': 3, 'added': 4})
+            self.assertEqual(load_node(self.node.pk).extras, {'unchanged': 0, 'deleted': 1, 'updated': 2})
+            self.assertNotIn('added', load_node(other.pk).extras)
+
+        self.assertEqual(load_node(self.node.pk).extras, {'unchanged': 0, 'updated': 3, 'added': 4})
+        self.assertEqual(load_node(other.pk).get_extra('added'), 6)
+
+        with Node.objects.deferred_writes():
+            self.node.reset_extras({'reset': 7})
+
+        self.assertEqual(load_node(self.node.pk).extras, {'reset': 7})
+
+    def test_deferred_writes_exception(self):
+        """Test that changes within `Node.objects.deferred_writes` are discarded if an exception is raised."""
+        self.node.set_extra('key', 'original')
+        self.node.store()
+
+        with self.assertRaises(RuntimeError):
+            with Node.objects.deferred_writes():
+                self.node.set_extra('key', 'changed')
+                raise RuntimeError
+
+        self.assertEqual(load_node(self.node.pk).get_extra('key'), 'original')
+        self.assertEqual(self.node.get_extra('key'), 'original')
+
 
 class TestNodeLinks(AiidaTestCase):
     """Test for linking from and to Node."""
@@ -528,6 +634,38 @@ class TestNodeLinks(AiidaTestCase):
         target.validate_incoming(source_one, LinkType.RETURN, 'other_label')
         target.validate_incoming(source_two, LinkType.RETURN, 'link_label')
 
+    def test_add_incoming_many(self):
+        """Test adding multiple incoming links at once, both for an unstored and a stored target node."""
+        sources = [Data().store() for _ in range(3)]
+        links = [(source, LinkType.INPUT_CALC, 'input_{}'.format(index)) for index, source in enumerate(sources)]
+
+        unstored = CalculationNode()
+        unstored.add_incoming_many(links)
+        self.assertTrue(unstored.has_cached_links())
+        unstored.store()
+
+        stored = CalculationNode().store()
+        stored.add_incoming_many(links)
+        self.assertFalse(stored.has_cached_links())
+
+        for target in [unstored, stored]:
+            incoming = target.get_incoming(link_type=LinkType.INPUT_CALC)
+            self.assertEqual(sorted(incoming.all_link_labels()), ['input_0', 'input_1', 'input_2'])
+
+    def test_add_incoming_many_validation(self):
+        """Test that the links passed to `add_incoming_many` are also validated against each other."""
+        source_one = Data().store()
+        source_two = Data().store()
+        target = CalculationNode().store()
+
+        with self.assertRaises(ValueError):
+            target.add_incoming_many([(source_one, LinkType.INPUT_CALC, 'label'),
+                                      (source_two, LinkType.INPUT_CALC, 'label')])
+
+        # No link should have been created and the node should not hold any links in its cache
+        self.assertEqual(target.get_incoming().all(), [])
+        self.assertFalse(target.has_cached_links())
+
     def test_validate_outgoing_workflow(self):
         """Verify that attaching an unstored `Data` node with `RETURN` link from a `WorkflowNode` raises.
 
@@ -19,6 +19,7 @@ from six.moves import range, zip
 
 from aiida import orm
 from aiida.backends.testbase import AiidaTestCase
+from aiida.common.exceptions import InputValidationError
 from aiida.common.links import LinkType
 from aiida.manage import configuration
 
@@ -1158,6 +1159,133 @@ class TestConsistency(AiidaTestCase):
             self.assertEqual(len(qb.all()), qb.count())
 
 
+class TestBulkExtras(AiidaTestCase):
+    """Tests for the server-side bulk update and deletion of extras with the `QueryBuilder`."""
+
+    def test_update_extras(self):
+        """Test that `QueryBuilder.update_extras` sets the extras on the matched nodes only."""
+        matched = [orm.Data().store() for _ in range(3)]
+        other = orm.Data().store()
+
+        for node in matched:
+            node.set_extra_many({'marker': 'bulk', 'existing': 1})
+
+        qb = orm.QueryBuilder().append(orm.Data, filters={'extras.marker': 'bulk'})
+        self.assertEqual(qb.update_extras({'existing': 2, 'new': [1, 2]}), 3)
+
+        for node in matched:
+            extras = orm.load_node(node.pk).extras
+            self.assertEqual(extras['existing'], 2)
+            self.assertEqual(extras['new'], [1, 2])
+            self.assertEqual(extras['marker'], 'bulk')
+
+        self.assertNotIn('new', orm.load_node(other.pk).extras)
+
+    def test_delete_extras(self):
+        """Test that `QueryBuilder.delete_extras` deletes the extras from the matched nodes that have them."""
+        parent = orm.CalculationNode().store()
+        children = [orm.Data().store() for _ in range(2)]
+
+        for index, child in enumerate(children):
+            child.add_incoming(parent, link_type=LinkType.CREATE, link_label='link_{}'.format(index))
+            child.set_extra_many({'obsolete': True, 'kept': index})
+
+        children[1].delete_extra('obsolete')
+        parent.set_extra('obsolete', True)
+
+        qb = orm.QueryBuilder()
+        qb.append(orm.CalculationNode, filters={'id': parent.id}, tag='parent')
+        qb.append(orm.Data, with_incoming='parent', tag='child')
+
+        with self.assertRaises(InputValidationError):
+            qb.delete_extras(['obsolete'])
+
+        self.assertEqual(qb.delete_extras(['obsolete', 'missing'], tag='child'), 1)
+
+        for index, child in enumerate(children):
+            extras = orm.load_node(child.pk).extras
+            self.assertNotIn('obsolete', extras)
+            self.assertEqual(extras['kept'], index)
+
+        self.assertTrue(orm.load_node(parent.pk).get_extra('obsolete'))
+
+
+class TestQueryPlanCache(AiidaTestCase):
+    """Tests for the cache of the queries that the `QueryBuilder` builds from a queryhelp."""
+
+    option = 'querybuilder.plan_cache_size'
+
+    def setUp(self):
+        super(TestQueryPlanCache, self).setUp()
+        from aiida.manage.configuration import get_config
+        from aiida.orm.querybuilder import QUERY_PLAN_CACHE
+        self.config = get_config()
+        self.profile_name = self.config.current_profile.name
+        self.config.set_option(self.option, 100, scope=self.profile_name)
+        self.cache = QUERY_PLAN_CACHE
+        self.cache.clear()
+
+    def tearDown(self):
+        self.config.unset_option(self.option, scope=self.profile_name)
+        self.cache.clear()
+        super(TestQueryPlanCache, self).tearDown()
+
+    @staticmethod
+    def get_builder(value):
+        """Return a query builder with a path, filters, projections and ordering that depend on the value."""
+        qb = orm.QueryBuilder()
+        qb.append(orm.CalculationNode, tag='parent', filters={'attributes.value': value}, project=['id'])
+        qb.append(orm.Data, with_incoming='parent', tag='child', project=['id', 'attributes.value'])
+        qb.order_by({'child': ['id']})
+        return qb
+
+    def test_reuse(self):
+        """Test that query builders with the same queryhelp reuse the cached query and return the same results."""
+        parent = orm.CalculationNode()
+        parent.set_attribute('value', 1)
+        parent.store()
+        children = [orm.Data().store() for _ in range(2)]
+        for index, child in enumerate(children):
+            child.add_incoming(parent, link_type=LinkType.CREATE, link_label='link_{}'.format(index))
+
+        expected = [[parent.pk, child.pk, None] for child in children]
+
+        self.assertEqual(self.get_builder(1).all(), expected)
+        self.assertEqual(len(self.cache), 1)
+
+        qb = self.get_builder(1)
+        self.assertEqual(qb.all(), expected)
+        self.assertEqual(qb.dict()[0]['child']['id'], children[0].pk)
+        self.assertEqual(len(self.cache), 1)
+
+        # A different filter value results in a different query
+        self.assertEqual(self.get_builder(2).all(), [])
+        self.assertEqual(len(self.cache), 2)
+
+        # Changing a query builder after its query is loaded from the cache builds a new query
+        qb.limit(1)
+        self.assertEqual(qb.all(), expected[:1])
+        self.assertEqual(len(self.cache), 3)
+
+    def test_size(self):
+        """Test that the least recently used queries are evicted and that a size of zero disables the cache."""
+        self.config.set_option(self.option, 2, scope=self.profile_name)
+        for value in range(3):
+            self.get_builder(value).count()
+        self.assertEqual(len(self.cache), 2)
+
+        self.config.set_option(self.option, 0, scope=self.profile_name)
+        self.cache.clear()
+        self.get_builder(0).count()
+        self.assertEqual(len(self.cache), 0)
+
+    def test_disabled_by_default(self):
+        """Test that no queries are cached unless the cache size is configured."""
+        self.config.unset_option(self.option, scope=self.profile_name)
+        self.get_builder(0).count()
+        self.assertEqual(len(self.cache), 0)
+
+
 class TestManager(AiidaTestCase):
 
     def test_statistics(self):
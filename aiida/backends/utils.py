@@ -125,3 +125,19 @@ def delete_nodes_and_connections(pks):
         raise Exception("unknown backend {}".format(configuration.PROFILE.database_backend))
 
     delete_nodes_backend(pks)
+
+
+def close_thread_session():
+    """Close the database session of the current thread.
+
+    The database sessions are thread local, so a thread other than the main one that uses the ORM gets its own session,
+    which should be closed once the thread is done with it. Nodes loaded in that session should not be used afterwards.
+    """
+    if configuration.PROFILE.database_backend == BACKEND_DJANGO:
+        from aiida.backends.djsite.utils import close_thread_session_django as close_thread_session_backend
+    elif configuration.PROFILE.database_backend == BACKEND_SQLA:
+        from aiida.backends.sqlalchemy.utils import close_thread_session_sqla as close_thread_session_backend
+    else:
+        raise Exception("unknown backend {}".format(configuration.PROFILE.database_backend))
+
+    close_thread_session_backend()
@@ -163,3 +163,71 @@ def detect_invalid_nodes():
         echo.echo_success('no integrity violations detected')
     else:
         echo.echo_critical('one or more integrity violations detected')
+
+
+@verdi_database.group('index')
+def verdi_database_index():
+    """Manage the indexes on the values of attributes and extras of nodes."""
+
+
+@verdi_database_index.command('list')
+@decorators.with_dbenv()
+def database_index_list():
+    """List the indexes on the values of attributes and extras of nodes."""
+    from tabulate import tabulate
+
+    from aiida.manage.database.indexes import get_indexes
+
+    rows = [[index.name, index.definition, index.default] for index in get_indexes()]
+
+    if not rows:
+        echo.echo_info('no indexes found')
+    else:
+        echo.echo(tabulate(rows, headers=['Name', 'Definition', 'Default']))
+
+
+@verdi_database_index.command('create')
+@click.argument('field', type=click.Choice(['attributes', 'extras']))
+@click.argument('path', type=click.STRING)
+@click.option(
+    '-t',
+    '--index-type',
+    type=click.Choice(['btree', 'gin']),
+    default='btree',
+    show_default=True,
+    help='The type of the index: `btree` for equality filters and `gin` for `contains` and `has_key` filters.')
+@decorators.with_dbenv()
+def database_index_create(field, path, index_type):
+    """Create an index on the value at PATH of the attributes or extras of nodes.
+
+    Nested keys of PATH are separated by periods. Creating the index locks the node table for writing, so it is best
+    done while the daemon is stopped.
+    """
+    from aiida.common import exceptions
+    from aiida.manage.database.indexes import create_index
+
+    try:
+        name = create_index(field, path, index_type)
+    except (ValueError, exceptions.UniquenessError) as exception:
+        echo.echo_critical(str(exception))
+    else:
+        echo.echo_success('created index `{}`'.format(name))
+
+
+@verdi_database_index.command('drop')
+@click.argument('name', type=click.STRING)
+@decorators.with_dbenv()
+def database_index_drop(name):
+    """Drop the index NAME on the value of attributes or extras of nodes.
+
+    The indexes that are created by the database migrations cannot be dropped.
+    """
+    from aiida.common import exceptions
+    from aiida.manage.database.indexes import drop_index
+
+    try:
+        drop_index(name)
+    except (exceptions.NotExistent, exceptions.ModificationNotAllowed) as exception:
+        echo.echo_critical(str(exception))
+    else:
+        echo.echo_success('dropped index `{}`'.format(name))
@@ -34,7 +34,7 @@ def rehash(nodes, entry_point):
 
     The set of nodes that will be rehashed can be filtered by their identifier and/or based on their class.
     """
-    from aiida.orm import Data, ProcessNode, QueryBuilder
+    from aiida.orm import Data, Node, ProcessNode, QueryBuilder
 
     # If no explicit entry point is defined, rehash all nodes, which are either Data nodes or ProcessNodes
     if entry_point is None:
@@ -52,13 +52,15 @@ def rehash(nodes, entry_point):
 
     count = 0
 
-    for i, (node,) in enumerate(to_hash):
+    # The new hashes are written at the end of the block with a single partial update per node
+    with Node.objects.deferred_writes():
+        for i, (node,) in enumerate(to_hash):
 
-        if i % 100 == 0:
-            echo.echo('.', nl=False)
+            if i % 100 == 0:
+                echo.echo('.', nl=False)
 
-        node.rehash()
-        count += 1
+            node.rehash()
+            count += 1
 
     echo.echo('')
     echo.echo_success('{} nodes re-hashed'.format(count))
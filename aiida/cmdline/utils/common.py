@@ -466,11 +466,12 @@ def check_worker_load(active_slots):
     """
     from aiida.common.exceptions import CircusCallError
     from aiida.cmdline.utils import echo
-    from aiida.manage.external.rmq import _RMQ_TASK_PREFETCH_COUNT
+    from aiida.manage.external.rmq import get_task_prefetch_count
+    from aiida.manage.manager import get_manager
 
     warning_threshold = 0.9  # 90%
 
-    slots_per_worker = _RMQ_TASK_PREFETCH_COUNT
+    slots_per_worker = get_task_prefetch_count(get_manager().get_profile())
 
     try:
         active_workers = get_num_workers()
@@ -57,6 +57,8 @@ def get_repository_folder(subfolder=None):
             retval = os.path.abspath(os.path.join(repository_path, 'sandbox'))
         elif subfolder == "repository":
             retval = os.path.abspath(os.path.join(repository_path, 'repository'))
+        elif subfolder == "checkpoints":
+            retval = os.path.abspath(os.path.join(repository_path, 'checkpoints'))
         else:
             raise ValueError("Invalid 'subfolder' passed to get_repository_folder: {}".format(subfolder))
         _repository_folder_cache[subfolder] = retval
@@ -16,21 +16,29 @@ plugin-specific operations.
 from __future__ import division
 from __future__ import print_function
 from __future__ import absolute_import
+import functools
 import os
+import posixpath
+import re
+import sys
 
 import warnings
 from six.moves import zip
 
 from aiida.common import AIIDA_LOGGER, exceptions
+from aiida.common.warnings import AiidaDeprecationWarning
 from aiida.common.datastructures import CalcJobState
 from aiida.common.folders import SandboxFolder
 from aiida.common.links import LinkType
+from aiida.manage.configuration import get_config_option
 from aiida.orm import FolderData
 from aiida.orm.utils.log import get_dblogger_extra
 from aiida.plugins import DataFactory
 from aiida.schedulers.datastructures import JobState
 
 REMOTE_WORK_DIRECTORY_LOST_FOUND = 'lost+found'
+UPLOAD_ARCHIVE_NAME = '.aiida_upload.tar'
+RETRIEVE_ARCHIVE_NAME = '.aiida_retrieve.tar.gz'
 
 execlogger = AIIDA_LOGGER.getChild('execmanager')
 
@@ -43,8 +51,33 @@ def upload_calculation(node, transport, calc_info, script_filename, dry_run=Fals
     :param calc_info: the calculation info datastructure returned by `CalcJobNode.presubmit`
     :param script_filename: the job launch script returned by `CalcJobNode.presubmit`
     """
+    execute_transport_steps(upload_calculation_steps(node, transport, calc_info, script_filename, dry_run))
+    return calc_info, script_filename
+
+
+def upload_calculation_steps(node, transport, calc_info, script_filename, dry_run=False):
+    """Generator of the transport operations that upload a `CalcJob` instance.
+
+    The operations on the transport are yielded as callables without arguments, whose result is sent back into the
+    generator, while all operations on the database and the file repository are performed by the generator itself.
+    This allows the engine to execute the transport operations outside of the thread of the event loop, see
+    `execute_transport_steps` for the synchronous execution. The yielded operations only receive plain data and only
+    use absolute remote paths, because the operations of other calculations that share the same transport may be
+    executed in between and change its current working directory.
+
+    :param node: the `CalcJobNode`.
+    :param transport: an already opened transport to use to submit the calculation.
+    :param calc_info: the calculation info datastructure returned by `CalcJobNode.presubmit`
+    :param script_filename: the job launch script returned by `CalcJobNode.presubmit`
+    """
+    steps = _upload_calculation_steps(node, transport, calc_info, script_filename, dry_run)
+    return _log_transport_steps(transport, get_dblogger_extra(node), steps)
+
+
+def _upload_calculation_steps(node, transport, calc_info, script_filename, dry_run=False):
+    """Generator of the transport operations that upload a `CalcJob` instance, see `upload_calculation_steps`."""
+    # pylint: disable=unused-argument,too-many-locals
     from logging import LoggerAdapter
-    from tempfile import NamedTemporaryFile
     from aiida.orm import load_node, Code, RemoteData
 
     computer = node.computer
@@ -53,7 +86,6 @@ def upload_calculation(node, transport, calc_info, script_filename, dry_run=Fals
     input_codes = [load_node(_.code_uuid, sub_classes=(Code,)) for _ in codes_info]
 
     logger_extra = get_dblogger_extra(node)
-    transport.set_logger_extra(logger_extra)
     logger = LoggerAdapter(logger=execlogger, extra=logger_extra)
 
     if not dry_run and node.has_cached_links():
@@ -62,89 +94,20 @@ def upload_calculation(node, transport, calc_info, script_filename, dry_run=Fals
 
     folder = node._raw_input_folder
 
-    # If we are performing a dry-run, the working directory should actually be a local folder that should already exist
-    if dry_run:
-        workdir = transport.getcwd()
-    else:
-        remote_user = transport.whoami()
-        # TODO Doc: {username} field
-        # TODO: if something is changed here, fix also 'verdi computer test'
-        remote_working_directory = computer.get_workdir().format(username=remote_user)
-        if not remote_working_directory.strip():
-            raise exceptions.ConfigurationError(
-                "[submission of calculation {}] No remote_working_directory configured for computer '{}'".format(
-                    node.pk, computer.name))
-
-        # If it already exists, no exception is raised
-        try:
-            transport.chdir(remote_working_directory)
-        except IOError:
-            logger.debug(
-                "[submission of calculation {}] Unable to chdir in {}, trying to create it".format(
-                    node.pk, remote_working_directory))
-            try:
-                transport.makedirs(remote_working_directory)
-                transport.chdir(remote_working_directory)
-            except EnvironmentError as exc:
-                raise exceptions.ConfigurationError(
-                    "[submission of calculation {}] "
-                    "Unable to create the remote directory {} on "
-                    "computer '{}': {}".format(
-                        node.pk, remote_working_directory, computer.name, exc))
-        # Store remotely with sharding (here is where we choose
-        # the folder structure of remote jobs; then I store this
-        # in the calculation properties using _set_remote_dir
-        # and I do not have to know the logic, but I just need to
-        # read the absolute path from the calculation properties.
-        transport.mkdir(calc_info.uuid[:2], ignore_existing=True)
-        transport.chdir(calc_info.uuid[:2])
-        transport.mkdir(calc_info.uuid[2:4], ignore_existing=True)
-        transport.chdir(calc_info.uuid[2:4])
-
-        try:
-            # The final directory may already exist, most likely because this function was already executed once, but
-            # failed and as a result was rescheduled by the eninge. In this case it would be fine to delete the folder
-            # and create it from scratch, except that we cannot be sure that this the actual case. Therefore, to err on
-            # the safe side, we move the folder to the lost+found directory before recreating the folder from scratch
-            transport.mkdir(calc_info.uuid[4:])
-        except OSError:
-            # Move the existing directory to lost+found, log a warning and create a clean directory anyway
-            path_existing = os.path.join(transport.getcwd(), calc_info.uuid[4:])
-            path_lost_found = os.path.join(remote_working_directory, REMOTE_WORK_DIRECTORY_LOST_FOUND)
-            path_target = os.path.join(path_lost_found, calc_info.uuid)
-            logger.warning('tried to create path {} but it already exists, moving the entire folder to {}'.format(
-                path_existing, path_target))
-
-            # Make sure the lost+found directory exists, then copy the existing folder there and delete the original
-            transport.mkdir(path_lost_found, ignore_existing=True)
-            transport.copytree(path_existing, path_target)
-            transport.rmtree(path_existing)
-
-            # Now we can create a clean folder for this calculation
-            transport.mkdir(calc_info.uuid[4:])
-        finally:
-            transport.chdir(calc_info.uuid[4:])
-
-        # I store the workdir of the calculation for later file retrieval
-        workdir = transport.getcwd()
-        node.set_remote_workdir(workdir)
-
-    # I first create the code files, so that the code can put
-    # default files to be overwritten by the plugin itself.
-    # Still, beware! The code file itself could be overwritten...
-    # But I checked for this earlier.
+    # The files to upload as tuples of the absolute local path and the path relative to the working directory. The code
+    # files are uploaded first, so that the code can put default files to be overwritten by the plugin itself.
+    code_files = []
+    executables = []
     for code in input_codes:
         if code.is_local():
-            # Note: this will possibly overwrite files
-            for f in code.get_folder_list():
-                transport.put(code.get_abs_path(f), f)
-            transport.chmod(code.get_local_executable(), 0o755)  # rwxr-xr-x
+            code_files.extend((code.get_abs_path(filename), filename) for filename in code.get_folder_list())
+            executables.append(code.get_local_executable())
 
     # In a dry_run, the working directory is the raw input folder, which will already contain these resources
-    if not dry_run:
-        for filename in folder.get_content_list():
-            logger.debug("[submission of calculation {}] copying file/folder {}...".format(node.pk, filename))
-            transport.put(folder.get_abs_path(filename), filename)
+    if dry_run:
+        input_files = []
+    else:
+        input_files = [(folder.get_abs_path(filename), filename) for filename in folder.get_content_list()]
 
     # local_copy_list is a list of tuples, each with (uuid, dest_rel_path)
     # NOTE: validation of these lists are done inside calculation.presubmit()
@@ -152,22 +115,44 @@ def upload_calculation(node, transport, calc_info, script_filename, dry_run=Fals
     remote_copy_list = calc_info.remote_copy_list or []
     remote_symlink_list = calc_info.remote_symlink_list or []
 
-    for uuid, filename, target in local_copy_list:
-        logger.debug("[submission of calculation {}] copying local file/folder to {}".format(node.pk, target))
+    # In a dry_run, the working directory is the raw input folder, which will already contain these resources, so
+    # the archive is only of use when uploading to a real working directory
+    archive = not dry_run and get_config_option('transport.upload.archive')
 
-        try:
-            data_node = load_node(uuid=uuid)
-        except exceptions.NotExistent:
-            logger.warning('failed to load Node<{}> specified in the `local_copy_list`'.format(uuid))
-
-        # Note, once #2579 is implemented, use the `node.open` method instead of the named temporary file in
-        # combination with the new `Transport.put_object_from_filelike`
-        # Since the content of the node could potentially be binary, we read the raw bytes and pass them on
-        with NamedTemporaryFile(mode='wb+') as handle:
-            handle.write(data_node.get_object_content(filename, mode='rb'))
-            handle.flush()
-            handle.seek(0)
-            transport.put(handle.name, target)
+    # If we are performing a dry-run, the working directory should actually be a local folder that should already exist
+    if dry_run:
+        workdir = yield transport.getcwd
+    else:
+        workdir, path_lost_found = yield functools.partial(_create_remote_working_directory, transport, node.pk,
+                                                           computer.name, computer.get_workdir(), calc_info.uuid)
+        if path_lost_found is not None:
+            logger.warning('tried to create path {} but it already exists, moved the entire folder to {}'.format(
+                workdir, path_lost_found))
+        # I store the workdir of the calculation for later file retrieval
+        node.set_remote_workdir(workdir)
+
+    # The objects of the `local_copy_list` are opened here, since that requires their nodes, and the open handles are
+    # only read from by the transport operation
+    local_copy_handles = []
+
+    try:
+        for uuid, filename, target in local_copy_list:
+            logger.debug("[submission of calculation {}] copying local file/folder to {}".format(node.pk, target))
+
+            try:
+                data_node = load_node(uuid=uuid)
+            except exceptions.NotExistent:
+                logger.warning('failed to load Node<{}> specified in the `local_copy_list`'.format(uuid))
+                raise
+
+            # Since the content of the node could potentially be binary, we stream the raw bytes
+            local_copy_handles.append((data_node.open(filename, mode='rb'), target))
+
+        yield functools.partial(_upload_files, transport, node.pk, workdir, code_files, executables, input_files,
+                                local_copy_handles, archive)
+    finally:
+        for handle, _ in local_copy_handles:
+            handle.close()
 
     if dry_run:
         if remote_copy_list:
@@ -183,45 +168,268 @@ def upload_calculation(node, transport, calc_info, script_filename, dry_run=Fals
                         remote_abs_path, dest_rel_path, computer.name))
 
     else:
-
-        for (remote_computer_uuid, remote_abs_path, dest_rel_path) in remote_copy_list:
-            if remote_computer_uuid == computer.uuid:
-                logger.debug("[submission of calculation {}] copying {} remotely, directly on the machine {}".format(
-                    node.pk, dest_rel_path, computer.name))
-                try:
-                    transport.copy(remote_abs_path, dest_rel_path)
-                except (IOError, OSError):
-                    logger.warning("[submission of calculation {}] Unable to copy remote resource from {} to {}! "
-                                   "Stopping.".format(node.pk, remote_abs_path, dest_rel_path))
-                    raise
-            else:
-                raise NotImplementedError(
-                    "[submission of calculation {}] Remote copy between two different machines is "
-                    "not implemented yet".format(node.pk))
-
-        for (remote_computer_uuid, remote_abs_path, dest_rel_path) in remote_symlink_list:
-            if remote_computer_uuid == computer.uuid:
-                logger.debug("[submission of calculation {}] copying {} remotely, directly on the machine {}".format(
-                    node.pk, dest_rel_path, computer.name))
-                try:
-                    transport.symlink(remote_abs_path, dest_rel_path)
-                except (IOError, OSError):
-                    logger.warning("[submission of calculation {}] Unable to create remote symlink from {} to {}! "
-                                   "Stopping.".format(node.pk, remote_abs_path, dest_rel_path))
-                    raise
-            else:
-                raise IOError("It is not possible to create a symlink between two different machines for "
-                              "calculation {}".format(node.pk))
+        yield functools.partial(_copy_remote_resources, transport, node.pk, workdir, computer.uuid, computer.name,
+                                remote_copy_list, remote_symlink_list)
 
     if not dry_run:
         remotedata = RemoteData(computer=computer, remote_path=workdir)
         remotedata.add_incoming(node, link_type=LinkType.CREATE, link_label='remote_folder')
         remotedata.store()
 
-    return calc_info, script_filename
 
+def _log_transport_steps(transport, logger_extra, steps):
+    """Generator that yields the transport operations of the given steps, passing the logger extra to the transport.
+
+    The transport may be shared with other calculations whose operations are executed in between, so the extra is set
+    right before each operation, in the thread that executes it, such that the log records of the transport are always
+    linked to the node of the calculation whose operation it is executing.
+
+    :param transport: the transport used by the steps
+    :param logger_extra: the logger extra of the calculation as returned by `get_dblogger_extra`
+    :param steps: generator of transport steps, for example as returned by `_upload_calculation_steps`
+    """
+    result = None
+    exc_info = None
+
+    while True:
+        try:
+            if exc_info is not None:
+                step = steps.throw(*exc_info)
+            else:
+                step = steps.send(result)
+        except StopIteration:
+            return
+
+        try:
+            result = yield functools.partial(_call_transport_step, transport, logger_extra, step)
+            exc_info = None
+        except Exception:  # pylint: disable=broad-except
+            result = None
+            exc_info = sys.exc_info()
+
+
+def _call_transport_step(transport, logger_extra, step):
+    """Pass the logger extra to the transport and call the transport step."""
+    transport.set_logger_extra(logger_extra)
+    return step()
+
+
+def execute_transport_steps(steps):
+    """Execute the transport operations yielded by a generator of transport steps in the current thread.
+
+    Each yielded callable is called and its result is sent back into the generator. If it raises, the exception is
+    thrown into the generator instead, such that it can be handled there as if the operation had been called directly.
 
-def submit_calculation(calculation, transport, calc_info, script_filename):
+    :param steps: generator as returned for example by `upload_calculation_steps`
+    """
+    result = None
+    exc_info = None
+
+    while True:
+        try:
+            if exc_info is not None:
+                step = steps.throw(*exc_info)
+            else:
+                step = steps.send(result)
+        except StopIteration:
+            return
+
+        try:
+            result = step()
+            exc_info = None
+        except Exception:  # pylint: disable=broad-except
+            result = None
+            exc_info = sys.exc_info()
+
+
+def _create_remote_working_directory(transport, pk, computer_name, workdir_template, uuid):
+    """Create the sharded working directory of a calculation on the remote.
+
+    If the working directory already exists, it is moved to the lost+found directory and a clean one is created.
+
+    :return: tuple of the absolute path of the working directory and the path in the lost+found directory to which an
+        existing working directory was moved, or None if it did not exist yet
+    """
+    remote_user = transport.whoami()
+    # TODO Doc: {username} field
+    # TODO: if something is changed here, fix also 'verdi computer test'
+    remote_working_directory = workdir_template.format(username=remote_user)
+    if not remote_working_directory.strip():
+        raise exceptions.ConfigurationError(
+            "[submission of calculation {}] No remote_working_directory configured for computer '{}'".format(
+                pk, computer_name))
+
+    # If it already exists, no exception is raised
+    try:
+        transport.chdir(remote_working_directory)
+    except IOError:
+        execlogger.debug(
+            "[submission of calculation {}] Unable to chdir in {}, trying to create it".format(
+                pk, remote_working_directory))
+        try:
+            transport.makedirs(remote_working_directory)
+            transport.chdir(remote_working_directory)
+        except EnvironmentError as exc:
+            raise exceptions.ConfigurationError(
+                "[submission of calculation {}] "
+                "Unable to create the remote directory {} on "
+                "computer '{}': {}".format(
+                    pk, remote_working_directory, computer_name, exc))
+
+    # Store remotely with sharding (here is where we choose
+    # the folder structure of remote jobs; then I store this
+    # in the calculation properties using _set_remote_dir
+    # and I do not have to know the logic, but I just need to
+    # read the absolute path from the calculation properties.
+    remote_working_directory = transport.getcwd()
+    path_shard = os.path.join(remote_working_directory, uuid[:2], uuid[2:4])
+    path_workdir = os.path.join(path_shard, uuid[4:])
+    path_target = None
+
+    transport.mkdir(os.path.join(remote_working_directory, uuid[:2]), ignore_existing=True)
+    transport.mkdir(path_shard, ignore_existing=True)
+
+    try:
+        # The final directory may already exist, most likely because this function was already executed once, but
+        # failed and as a result was rescheduled by the eninge. In this case it would be fine to delete the folder
+        # and create it from scratch, except that we cannot be sure that this the actual case. Therefore, to err on
+        # the safe side, we move the folder to the lost+found directory before recreating the folder from scratch
+        transport.mkdir(path_workdir)
+    except OSError:
+        # Move the existing directory to lost+found and create a clean directory anyway
+        path_lost_found = os.path.join(remote_working_directory, REMOTE_WORK_DIRECTORY_LOST_FOUND)
+        path_target = os.path.join(path_lost_found, uuid)
+
+        # Make sure the lost+found directory exists, then copy the existing folder there and delete the original
+        transport.mkdir(path_lost_found, ignore_existing=True)
+        transport.copytree(path_workdir, path_target)
+        transport.rmtree(path_workdir)
+
+        # Now we can create a clean folder for this calculation
+        transport.mkdir(path_workdir)
+
+    return path_workdir, path_target
+
+
+def _copy_remote_resources(transport, pk, workdir, computer_uuid, computer_name, remote_copy_list,
+                           remote_symlink_list):
+    """Copy the resources of the `remote_copy_list` and create the symlinks of the `remote_symlink_list`.
+
+    :param workdir: the absolute path of the working directory on the remote
+    """
+    for (remote_computer_uuid, remote_abs_path, dest_rel_path) in remote_copy_list:
+        if remote_computer_uuid == computer_uuid:
+            execlogger.debug("[submission of calculation {}] copying {} remotely, directly on the machine {}".format(
+                pk, dest_rel_path, computer_name))
+            try:
+                transport.copy(remote_abs_path, os.path.join(workdir, dest_rel_path))
+            except (IOError, OSError):
+                execlogger.warning("[submission of calculation {}] Unable to copy remote resource from {} to {}! "
+                                   "Stopping.".format(pk, remote_abs_path, dest_rel_path))
+                raise
+        else:
+            raise NotImplementedError(
+                "[submission of calculation {}] Remote copy between two different machines is "
+                "not implemented yet".format(pk))
+
+    for (remote_computer_uuid, remote_abs_path, dest_rel_path) in remote_symlink_list:
+        if remote_computer_uuid == computer_uuid:
+            execlogger.debug("[submission of calculation {}] copying {} remotely, directly on the machine {}".format(
+                pk, dest_rel_path, computer_name))
+            try:
+                transport.symlink(remote_abs_path, os.path.join(workdir, dest_rel_path))
+            except (IOError, OSError):
+                execlogger.warning("[submission of calculation {}] Unable to create remote symlink from {} to {}! "
+                                   "Stopping.".format(pk, remote_abs_path, dest_rel_path))
+                raise
+        else:
+            raise IOError("It is not possible to create a symlink between two different machines for "
+                          "calculation {}".format(pk))
+
+
+def _upload_files(transport, pk, workdir, code_files, executables, input_files, local_copy_handles, archive=False):
+    """Upload the code files, the sandbox folder and the `local_copy_list` to the working directory.
+
+    :param workdir: the absolute path of the working directory on the remote
+    :param code_files: list of tuples of the absolute local path and the relative remote path of the code files
+    :param executables: list of the relative remote paths of the executables of the local codes
+    :param input_files: list of tuples of the absolute local path and the relative remote path of the input files
+    :param local_copy_handles: list of tuples of an open binary handle and the relative remote path of the objects of
+        the `local_copy_list`
+    :param archive: boolean, if True, try to upload all files as a single archive first, see `_upload_archive`
+    """
+    # pylint: disable=too-many-arguments
+    if archive and _upload_archive(transport, pk, workdir, code_files + input_files, local_copy_handles):
+        for executable in executables:
+            transport.chmod(os.path.join(workdir, executable), 0o755)  # rwxr-xr-x
+        return
+
+    # Note: this will possibly overwrite files
+    for source, target in code_files:
+        transport.put(source, os.path.join(workdir, target))
+
+    for executable in executables:
+        transport.chmod(os.path.join(workdir, executable), 0o755)  # rwxr-xr-x
+
+    for source, target in input_files:
+        execlogger.debug("[submission of calculation {}] copying file/folder {}...".format(pk, target))
+        transport.put(source, os.path.join(workdir, target))
+
+    for handle, target in local_copy_handles:
+        handle.seek(0)
+        transport.put_object_from_filelike(handle, os.path.join(workdir, target))
+
+
+def _upload_archive(transport, pk, workdir, files, local_copy_handles):
+    """Upload the given files and the objects of the `local_copy_list` as a single tar archive.
+
+    The archive is created locally, put in the working directory with a single transfer and unpacked there by the
+    remote `tar`. The members are added in the given order, such that later files overwrite earlier ones in the same
+    way as when they are uploaded one by one. The objects of the `local_copy_list` are streamed into the archive.
+
+    :param workdir: the absolute path of the working directory on the remote
+    :param files: list of tuples of the absolute local path and the relative remote path
+    :param local_copy_handles: list of tuples of an open binary handle and the relative remote path
+    :return: True if the archive was unpacked successfully, False if the files have to be uploaded one by one instead
+    """
+    import tarfile
+    from tempfile import NamedTemporaryFile
+    from aiida.common.escaping import escape_for_bash
+
+    archive_path = os.path.join(workdir, UPLOAD_ARCHIVE_NAME)
+
+    with NamedTemporaryFile(suffix='.tar') as handle:
+
+        with tarfile.open(fileobj=handle, mode='w', format=tarfile.GNU_FORMAT, dereference=True) as archive:
+
+            for source, target in files:
+                archive.add(source, arcname=target)
+
+            for source, target in local_copy_handles:
+                source.seek(0, os.SEEK_END)
+                info = tarfile.TarInfo(name=target)
+                info.size = source.tell()
+                info.mode = 0o644
+                source.seek(0)
+                archive.addfile(info, fileobj=source)
+
+        handle.flush()
+        transport.putfile(handle.name, archive_path)
+
+    command = 'cd {workdir} && tar -xf {archive} && rm -f {archive}'.format(
+        workdir=escape_for_bash(workdir), archive=escape_for_bash(UPLOAD_ARCHIVE_NAME))
+    retval, _, stderr = transport.exec_command_wait(command)
+
+    if retval != 0:
+        execlogger.warning("[submission of calculation {}] unpacking the upload archive failed with exit code {}, "
+                           "falling back to uploading the files one by one: {}".format(pk, retval, stderr))
+        transport.exec_command_wait('rm -f {}'.format(escape_for_bash(archive_path)))
+        return False
+
+    return True
+
+
+def submit_calculation(calculation, transport, calc_info, script_filename):  # pylint: disable=unused-argument
     """
     Submit a calculation
 
@@ -230,7 +438,13 @@ def submit_calculation(calculation, transport, calc_info, script_filename):
     :param calc_info: the calculation info datastructure returned by `CalcJobNode._presubmit`
     :param script_filename: the job launch script returned by `CalcJobNode._presubmit`
     :return: the job id as returned by the scheduler `submit_from_script` call
+
+    .. deprecated:: 1.0.0
+        Will be removed in `v2.0.0`, the engine submits jobs through
+        :meth:`aiida.engine.processes.calcjobs.manager.JobManager.request_job_submission` instead.
     """
+    warnings.warn(  # pylint: disable=no-member
+        'function is deprecated, use `JobManager.request_job_submission` instead', AiidaDeprecationWarning)
     scheduler = calculation.computer.get_scheduler()
     scheduler.set_transport(transport)
 
@@ -252,53 +466,70 @@ def retrieve_calculation(calculation, transport, retrieved_temporary_folder):
     :param retrieved_temporary_folder: the absolute path to a directory in which to store the files
         listed, if any, in the `retrieved_temporary_folder` of the jobs CalcInfo
     """
+    with transport:
+        execute_transport_steps(retrieve_calculation_steps(calculation, transport, retrieved_temporary_folder))
+
+
+def retrieve_calculation_steps(calculation, transport, retrieved_temporary_folder):
+    """
+    Generator of the transport operations that retrieve all the files of a completed job calculation.
+
+    See `upload_calculation_steps` for how the transport operations are yielded and `retrieve_calculation` for the
+    description of the arguments.
+    """
+    steps = _retrieve_calculation_steps(calculation, transport, retrieved_temporary_folder)
+    return _log_transport_steps(transport, get_dblogger_extra(calculation), steps)
+
+
+def _retrieve_calculation_steps(calculation, transport, retrieved_temporary_folder):
+    """Generator of the transport operations that retrieve the files of a job, see `retrieve_calculation_steps`."""
     logger_extra = get_dblogger_extra(calculation)
 
     execlogger.debug("Retrieving calc {}".format(calculation.pk), extra=logger_extra)
     workdir = calculation.get_remote_workdir()
 
-    execlogger.debug(
-        "[retrieval of calc {}] chdir {}".format(calculation.pk, workdir),
-        extra=logger_extra)
-
     # Create the FolderData node to attach everything to
     retrieved_files = FolderData()
     retrieved_files.add_incoming(calculation, link_type=LinkType.CREATE, link_label=calculation.link_label_retrieved)
 
-    with transport:
-        transport.chdir(workdir)
+    retrieve_list = calculation.get_retrieve_list()
+    retrieve_temporary_list = calculation.get_retrieve_temporary_list()
+    retrieve_singlefile_list = calculation.get_retrieve_singlefile_list()
 
-        # First, retrieve the files of folderdata
-        retrieve_list = calculation.get_retrieve_list()
-        retrieve_temporary_list = calculation.get_retrieve_temporary_list()
-        retrieve_singlefile_list = calculation.get_retrieve_singlefile_list()
+    archive = get_config_option('transport.retrieve.archive')
+    archive_max_size = get_config_option('transport.retrieve.archive_max_size')
 
+    # First, retrieve the files of folderdata
+    with SandboxFolder() as folder:
+        yield functools.partial(_retrieve_files_from_list, calculation.pk, transport, workdir, folder.abspath,
+                                retrieve_list, archive, archive_max_size)
+        # Here I retrieved everything; now I store them inside the calculation
+        retrieved_files.put_object_from_tree(folder.abspath)
+
+    # Second, retrieve the singlefiles, if any files were specified in the 'retrieve_temporary_list' key
+    if retrieve_singlefile_list:
         with SandboxFolder() as folder:
-            retrieve_files_from_list(calculation, transport, folder.abspath, retrieve_list)
-            # Here I retrieved everything; now I store them inside the calculation
-            retrieved_files.put_object_from_tree(folder.abspath)
-
-        # Second, retrieve the singlefiles, if any files were specified in the 'retrieve_temporary_list' key
-        if retrieve_singlefile_list:
-            with SandboxFolder() as folder:
-                _retrieve_singlefiles(calculation, transport, folder, retrieve_singlefile_list, logger_extra)
-
-        # Retrieve the temporary files in the retrieved_temporary_folder if any files were
-        # specified in the 'retrieve_temporary_list' key
-        if retrieve_temporary_list:
-            retrieve_files_from_list(calculation, transport, retrieved_temporary_folder, retrieve_temporary_list)
-
-            # Log the files that were retrieved in the temporary folder
-            for filename in os.listdir(retrieved_temporary_folder):
-                execlogger.debug("[retrieval of calc {}] Retrieved temporary file or folder '{}'".format(
-                    calculation.pk, filename), extra=logger_extra)
-
-        # Store everything
-        execlogger.debug(
-            "[retrieval of calc {}] "
-            "Storing retrieved_files={}".format(calculation.pk, retrieved_files.pk),
-            extra=logger_extra)
-        retrieved_files.store()
+            singlefile_list = yield functools.partial(_retrieve_singlefiles_from_list, calculation.pk, transport,
+                                                      workdir, folder.abspath, retrieve_singlefile_list)
+            _store_singlefiles(calculation, singlefile_list, logger_extra)
+
+    # Retrieve the temporary files in the retrieved_temporary_folder if any files were
+    # specified in the 'retrieve_temporary_list' key
+    if retrieve_temporary_list:
+        yield functools.partial(_retrieve_files_from_list, calculation.pk, transport, workdir,
+                                retrieved_temporary_folder, retrieve_temporary_list, archive, archive_max_size)
+
+        # Log the files that were retrieved in the temporary folder
+        for filename in os.listdir(retrieved_temporary_folder):
+            execlogger.debug("[retrieval of calc {}] Retrieved temporary file or folder '{}'".format(
+                calculation.pk, filename), extra=logger_extra)
+
+    # Store everything
+    execlogger.debug(
+        "[retrieval of calc {}] "
+        "Storing retrieved_files={}".format(calculation.pk, retrieved_files.pk),
+        extra=logger_extra)
+    retrieved_files.store()
 
 
 def kill_calculation(calculation, transport):
@@ -307,7 +538,13 @@ def kill_calculation(calculation, transport):
 
     :param calculation: the instance of CalcJobNode to kill.
     :param transport: an already opened transport to use to address the scheduler
+
+    .. deprecated:: 1.0.0
+        Will be removed in `v2.0.0`, the engine kills jobs through
+        :meth:`aiida.engine.processes.calcjobs.manager.JobManager.request_job_kill` instead.
     """
+    warnings.warn(  # pylint: disable=no-member
+        'function is deprecated, use `JobManager.request_job_kill` instead', AiidaDeprecationWarning)
     job_id = calculation.get_job_id()
 
     # Get the scheduler plugin class and initialize it with the correct transport
@@ -340,11 +577,25 @@ def parse_results(process, retrieved_temporary_folder=None):
     """
     from aiida.engine import ExitCode
 
+    parser, parse_kwargs = prepare_parser(process, retrieved_temporary_folder)
+
+    if parser is None:
+        return ExitCode()
+
+    exit_code = run_parser(parser, parse_kwargs)
+
+    return attach_parser_outputs(process, parser, exit_code)
+
+
+def get_parser_class(process, retrieved_temporary_folder=None):
+    """
+    Return the parser class for a given CalcJobNode (job), logging the content of the retrieved temporary folder
+
+    :returns: the parser class or `None` if the calculation does not define a parser
+    """
     assert process.node.get_state() == CalcJobState.PARSING, \
         'job should be in the PARSING state when calling this function yet it is {}'.format(process.node.get_state())
 
-    parser_class = process.node.get_parser_class()
-    exit_code = ExitCode()
     logger_extra = get_dblogger_extra(process.node)
 
     if retrieved_temporary_folder:
@@ -362,49 +613,131 @@ def parse_results(process, retrieved_temporary_folder=None):
         execlogger.debug("[parsing of calc {}] "
                          "No retrieved_temporary_folder.".format(process.node.pk), extra=logger_extra)
 
-    if parser_class is not None:
+    return process.node.get_parser_class()
+
 
-        parser = parser_class(process.node)
-        parse_kwargs = parser.get_outputs_for_parsing()
+def prepare_parser(process, retrieved_temporary_folder=None):
+    """
+    Construct the parser for a given CalcJobNode (job) and the keyword arguments with which to call its `parse` method
+
+    :returns: tuple of the parser instance and a dictionary of parse keyword arguments, the parser is `None` if the
+        calculation does not define a parser
+    """
+    parser_class = get_parser_class(process, retrieved_temporary_folder)
+
+    if parser_class is None:
+        return None, {}
 
-        if retrieved_temporary_folder:
-            parse_kwargs['retrieved_temporary_folder'] = retrieved_temporary_folder
+    parser = parser_class(process.node)
 
-        exit_code = parser.parse(**parse_kwargs)
+    return parser, _get_parse_kwargs(parser, retrieved_temporary_folder)
 
-        if exit_code is None:
-            exit_code = ExitCode(0)
 
-        if not isinstance(exit_code, ExitCode):
-            raise ValueError('parse should return an `ExitCode` or None, and not {}'.format(type(exit_code)))
+def _get_parse_kwargs(parser, retrieved_temporary_folder=None):
+    """Return the keyword arguments with which to call the `parse` method of the given parser."""
+    parse_kwargs = parser.get_outputs_for_parsing()
+
+    if retrieved_temporary_folder:
+        parse_kwargs['retrieved_temporary_folder'] = retrieved_temporary_folder
+
+    return parse_kwargs
 
-        if exit_code.status:
-            parser.logger.error('parser returned exit code<{}>: {}'.format(exit_code.status, exit_code.message))
+
+def run_parser_in_thread(parser_class, pk, retrieved_temporary_folder=None):
+    """
+    Construct the parser for the CalcJobNode with the given pk and call its `parse` method in the current thread
+
+    This is meant to be run in a thread other than that of the event loop. The database session of the event loop
+    cannot be shared between threads, so the node and the nodes that are passed to the parser are loaded anew in the
+    session of the current thread, which is closed before returning. The output nodes that were stored by the parser
+    are therefore returned by their pk, such that they can be loaded again in the thread of the event loop.
+
+    :param parser_class: the parser class of the node
+    :param pk: the pk of the `CalcJobNode`
+    :param retrieved_temporary_folder: temporary folder used in retrieving that can be used during parsing
+    :returns: tuple of the `ExitCode` returned by the parser, a dictionary of its unstored output nodes and a
+        dictionary of the pks of its stored output nodes
+    """
+    from aiida.backends.utils import close_thread_session
+    from aiida.orm import load_node, Node
+
+    outputs = {}
+    stored_outputs = {}
+
+    try:
+        parser = parser_class(load_node(pk))
+        exit_code = run_parser(parser, _get_parse_kwargs(parser, retrieved_temporary_folder))
 
         for link_label, node in parser.outputs.items():
-            try:
-                process.out(link_label, node)
-            except ValueError as exception:
-                parser.logger.error('invalid value {} specified with label {}: {}'.format(node, link_label, exception))
-                exit_code = process.exit_codes.ERROR_INVALID_OUTPUT
-                break
+            if isinstance(node, Node) and node.is_stored:
+                stored_outputs[link_label] = node.pk
+            else:
+                outputs[link_label] = node
+    finally:
+        close_thread_session()
+
+    return exit_code, outputs, stored_outputs
+
+
+def run_parser(parser, parse_kwargs):
+    """
+    Call the `parse` method of the parser and validate the exit code that it returns
+
+    :returns: the `ExitCode` returned by the parser
+    """
+    from aiida.engine import ExitCode
+
+    exit_code = parser.parse(**parse_kwargs)
+
+    if exit_code is None:
+        exit_code = ExitCode(0)
+
+    if not isinstance(exit_code, ExitCode):
+        raise ValueError('parse should return an `ExitCode` or None, and not {}'.format(type(exit_code)))
+
+    if exit_code.status:
+        parser.logger.error('parser returned exit code<{}>: {}'.format(exit_code.status, exit_code.message))
+
+    return exit_code
+
+
+def attach_parser_outputs(process, parser, exit_code):
+    """
+    Emit the outputs that were registered by the parser on the process
+
+    :returns: the exit code of the parser or `ERROR_INVALID_OUTPUT` if one of the outputs was rejected by the process
+    """
+    for link_label, node in parser.outputs.items():
+        try:
+            process.out(link_label, node)
+        except ValueError as exception:
+            parser.logger.error('invalid value {} specified with label {}: {}'.format(node, link_label, exception))
+            exit_code = process.exit_codes.ERROR_INVALID_OUTPUT
+            break
 
     return exit_code
 
 
-def _retrieve_singlefiles(job, transport, folder, retrieve_file_list, logger_extra=None):
+def _retrieve_singlefiles_from_list(pk, transport, workdir, folder, retrieve_file_list):
+    """Retrieve the files of the `retrieve_singlefile_list` and return those that exist with their link information.
+
+    :param pk: the pk of the calculation, used in log messages
+    :param workdir: the absolute path of the working directory on the remote
+    :param folder: an absolute path to a folder to copy files in
+    """
     singlefile_list = []
     for (linkname, subclassname, filename) in retrieve_file_list:
-        execlogger.debug("[retrieval of calc {}] Trying "
-                         "to retrieve remote singlefile '{}'".format(
-            job.pk, filename), extra=logger_extra)
-        localfilename = os.path.join(folder.abspath, os.path.split(filename)[1])
-        transport.get(filename, localfilename, ignore_nonexisting=True)
+        execlogger.debug("[retrieval of calc {}] Trying to retrieve remote singlefile '{}'".format(pk, filename))
+        localfilename = os.path.join(folder, os.path.split(filename)[1])
+        transport.get(os.path.join(workdir, filename), localfilename, ignore_nonexisting=True)
         singlefile_list.append((linkname, subclassname, localfilename))
 
     # ignore files that have not been retrieved
-    singlefile_list = [i for i in singlefile_list if os.path.exists(i[2])]
+    return [i for i in singlefile_list if os.path.exists(i[2])]
+
 
+def _store_singlefiles(job, singlefile_list, logger_extra=None):
+    """Create and store the `SinglefileData` nodes for the retrieved singlefiles."""
     # after retrieving from the cluster, I create the objects
     singlefiles = []
     for (linkname, subclassname, filename) in singlefile_list:
@@ -422,6 +755,23 @@ def _retrieve_singlefiles(job, transport, folder, retrieve_file_list, logger_ext
 
 
 def retrieve_files_from_list(calculation, transport, folder, retrieve_list):
+    """
+    Retrieve all the files in the retrieve_list from the remote working directory of the calculation into the
+    local folder instance through the transport, see `_retrieve_files_from_list` for the format of the retrieve_list.
+
+    If the `transport.retrieve.archive` option is enabled, the files are retrieved through a single archive.
+
+    :param calculation: the instance of CalcJobNode whose files to retrieve
+    :param transport: the Transport instance
+    :param folder: an absolute path to a folder to copy files in
+    :param retrieve_list: the list of files to retrieve
+    """
+    _retrieve_files_from_list(calculation.pk, transport, calculation.get_remote_workdir(), folder, retrieve_list,
+                              get_config_option('transport.retrieve.archive'),
+                              get_config_option('transport.retrieve.archive_max_size'))
+
+
+def _retrieve_files_from_list(pk, transport, workdir, folder, retrieve_list, archive=False, archive_max_size=0):
     """
     Retrieve all the files in the retrieve_list from the remote into the
     local folder instance through the transport. The entries in the retrieve_list
@@ -441,40 +791,226 @@ def retrieve_files_from_list(calculation, transport, folder, retrieve_list):
     treated as the work directory of the folder and the depth integer determines
     upto what level of the original remotepath nesting the files will be copied.
 
+    Relative remote paths are resolved against the given working directory rather than the current working directory
+    of the transport, which may be changed by the operations of other calculations in between.
+
+    If `archive` is True, the entries are resolved remotely by a single command that packs all matched files in one
+    compressed archive, which is then retrieved and unpacked locally. Entries that refer to absolute paths or to parent
+    directories are still retrieved one by one, as are all entries if the archive cannot be created or exceeds the
+    `archive_max_size`.
+
+    :param pk: the pk of the calculation, used in log messages
     :param transport: the Transport instance
+    :param workdir: the absolute path of the working directory on the remote
     :param folder: an absolute path to a folder to copy files in
     :param retrieve_list: the list of files to retrieve
+    :param archive: boolean, if True, retrieve the files through a single archive
+    :param archive_max_size: maximum size in MB of the archive, zero means no limit
     """
+    if archive:
+        retrieve_list = _retrieve_files_from_archive(pk, transport, workdir, folder, retrieve_list, archive_max_size)
+
+    def glob_function(pattern):
+        """Glob the pattern relative to the working directory and return the matches relative to it as well."""
+        if os.path.isabs(pattern):
+            return transport.glob(pattern)
+        return [os.path.relpath(path, workdir) for path in transport.glob(os.path.join(workdir, pattern))]
+
     for item in retrieve_list:
-        if isinstance(item, list):
-            tmp_rname, tmp_lname, depth = item
-            # if there are more than one file I do something differently
-            if transport.has_magic(tmp_rname):
-                remote_names = transport.glob(tmp_rname)
-                local_names = []
-                for rem in remote_names:
-                    to_append = rem.split(os.path.sep)[-depth:] if depth > 0 else []
-                    local_names.append(os.path.sep.join([tmp_lname] + to_append))
-            else:
-                remote_names = [tmp_rname]
-                to_append = remote_names.split(os.path.sep)[-depth:] if depth > 0 else []
-                local_names = [os.path.sep.join([tmp_lname] + to_append)]
-            if depth > 1:  # create directories in the folder, if needed
-                for this_local_file in local_names:
-                    new_folder = os.path.join(
-                        folder,
-                        os.path.split(this_local_file)[0])
-                    if not os.path.exists(new_folder):
-                        os.makedirs(new_folder)
-        else:  # it is a string
-            if transport.has_magic(item):
-                remote_names = transport.glob(item)
-                local_names = [os.path.split(rem)[1] for rem in remote_names]
-            else:
-                remote_names = [item]
-                local_names = [os.path.split(item)[1]]
+        names = _get_retrieve_names(item, glob_function, transport.has_magic)
+        if isinstance(item, list) and item[2] > 1:  # create directories in the folder, if needed
+            for _, this_local_file in names:
+                new_folder = os.path.join(folder, os.path.split(this_local_file)[0])
+                if not os.path.exists(new_folder):
+                    os.makedirs(new_folder)
+        for rem, loc in names:
+            execlogger.debug("[retrieval of calc {}] Trying to retrieve remote item '{}'".format(pk, rem))
+            transport.get(os.path.join(workdir, rem), os.path.join(folder, loc), ignore_nonexisting=True)
+
+
+def _get_retrieve_names(item, glob_function, has_magic):
+    """
+    Resolve an entry of a retrieve list into pairs of remote names and the corresponding local names.
+
+    :param item: an entry of the retrieve list, either a string or a list of remotepath, localpath and depth
+    :param glob_function: callable that returns the list of paths matching a pattern
+    :param has_magic: callable that returns whether a path contains glob wildcards
+    :return: list of tuples of the remote name and the local name relative to the target folder
+    """
+    if isinstance(item, list):
+        tmp_rname, tmp_lname, depth = item
+        # if there are more than one file I do something differently
+        if has_magic(tmp_rname):
+            remote_names = glob_function(tmp_rname)
+        else:
+            remote_names = [tmp_rname]
+        local_names = []
+        for rem in remote_names:
+            to_append = rem.split(os.path.sep)[-depth:] if depth > 0 else []
+            local_names.append(os.path.sep.join([tmp_lname] + to_append))
+    else:  # it is a string
+        if has_magic(item):
+            remote_names = glob_function(item)
+        else:
+            remote_names = [item]
+        local_names = [os.path.split(rem)[1] for rem in remote_names]
+
+    return list(zip(remote_names, local_names))
+
+
+def _retrieve_files_from_archive(pk, transport, workdir, folder, retrieve_list, max_size=0):
+    """
+    Retrieve the entries of the retrieve list that are relative to the working directory through a single archive.
+
+    The patterns are expanded by the remote shell and all existing matches are packed by the remote `tar` into a
+    compressed archive, which is retrieved with a single transfer and unpacked in a local sandbox folder. The entries
+    are then resolved against that sandbox folder exactly as they would have been against the remote working directory.
+
+    :param pk: the pk of the calculation, used in log messages
+    :param transport: the Transport instance
+    :param workdir: the absolute path of the working directory on the remote
+    :param folder: an absolute path to a folder to copy files in
+    :param retrieve_list: the list of files to retrieve
+    :param max_size: maximum size in MB of the archive, zero means no limit
+    :return: the entries of the retrieve list that were not retrieved and still have to be retrieved one by one
+    """
+    # pylint: disable=too-many-locals
+    import glob
+    import shutil
+    import tarfile
+    import tempfile
+    from tempfile import NamedTemporaryFile
+    from aiida.common.escaping import escape_for_bash
+
+    archived, remaining = [], []
+
+    for item in retrieve_list:
+        pattern = _get_retrieve_pattern(item)
+        if os.path.isabs(pattern) or os.pardir in pattern.split(os.path.sep):
+            remaining.append(item)
+        else:
+            archived.append(item)
+
+    if not archived:
+        return remaining
+
+    # The patterns should be expanded by the remote shell, so only the characters that are not wildcards are escaped
+    patterns = ' '.join(re.sub(r'([^\w\-./*?\[\]!])', r'\\\1', _get_retrieve_pattern(item)) for item in archived)
+    archive_path = os.path.join(workdir, RETRIEVE_ARCHIVE_NAME)
+    remove_command = 'rm -f {}'.format(escape_for_bash(archive_path))
+    command = 'cd {workdir} && for f in {patterns}; do if [ -e "$f" ]; then printf "%s\\0" "$f"; fi; done | ' \
+              'tar -czhf {archive} --null -T -'.format(
+                  workdir=escape_for_bash(workdir), patterns=patterns, archive=escape_for_bash(RETRIEVE_ARCHIVE_NAME))
+
+    retval, _, stderr = transport.exec_command_wait(command)
+
+    if retval != 0:
+        execlogger.warning("[retrieval of calc {}] creating the retrieve archive failed with exit code {}, "
+                           "retrieving the files one by one: {}".format(pk, retval, stderr))
+        transport.exec_command_wait(remove_command)
+        return retrieve_list
+
+    size = transport.get_attribute(archive_path).st_size
 
-        for rem, loc in zip(remote_names, local_names):
-            transport.logger.debug(
-                "[retrieval of calc {}] Trying to retrieve remote item '{}'".format(calculation.pk, rem))
-            transport.get(rem, os.path.join(folder, loc), ignore_nonexisting=True)
+    if max_size and size > max_size * 1024 * 1024:
+        execlogger.info("[retrieval of calc {}] the retrieve archive of {} bytes exceeds the maximum size of {} MB, "
+                        "retrieving the files one by one".format(pk, size, max_size))
+        transport.exec_command_wait(remove_command)
+        return retrieve_list
+
+    # The archive is unpacked in a plain temporary directory, since a `SandboxFolder` requires the loaded profile
+    sandbox = tempfile.mkdtemp()
+
+    try:
+        with NamedTemporaryFile(suffix='.tar.gz') as handle:
+            transport.getfile(archive_path, handle.name)
+            transport.exec_command_wait(remove_command)
+
+            with tarfile.open(handle.name, mode='r:gz') as archive:
+                members = archive.getmembers()
+                unsafe = _get_unsafe_archive_member(members)
+
+                if unsafe is not None:
+                    execlogger.warning("[retrieval of calc {}] the retrieve archive contains the member '{}' that "
+                                       "would be extracted outside of the sandbox folder, retrieving the files one "
+                                       "by one".format(pk, unsafe.name))
+                    return retrieve_list
+
+                archive.extractall(sandbox, members=members)
+
+        def glob_function(pattern):
+            return [os.path.relpath(path, sandbox) for path in glob.glob(os.path.join(sandbox, pattern))]
+
+        for item in archived:
+            for rem, loc in _get_retrieve_names(item, glob_function, glob.has_magic):
+                source = os.path.join(sandbox, rem)
+                if os.path.exists(source):
+                    _copy_retrieved(source, os.path.join(folder, loc))
+    finally:
+        shutil.rmtree(sandbox, ignore_errors=True)
+
+    return remaining
+
+
+def _get_unsafe_archive_member(members):
+    """
+    Return the first member of a retrieve archive that would be extracted outside of the target folder, if any.
+
+    Since the archive is created by the remote, its members are not trusted blindly. Members with absolute names or
+    names that refer to a parent directory are unsafe, as are members that would be placed below a symbolic link,
+    links whose target is absolute, refers to a parent directory or lies below a symbolic link and any member that is
+    not a regular file, directory or link.
+
+    :param members: list of `tarfile.TarInfo` instances in the order in which they are extracted
+    :return: the first unsafe `tarfile.TarInfo` or None if all members are safe
+    """
+    symlinks = set()
+
+    def is_contained(path):
+        """Return whether the relative path stays inside the target folder without passing through a symlink."""
+        if os.path.isabs(path):
+            return False
+        parts = [part for part in path.split('/') if part not in ('', os.curdir)]
+        if os.pardir in parts:
+            return False
+        return not any('/'.join(parts[:index]) in symlinks for index in range(1, len(parts) + 1))
+
+    for member in members:
+        if not is_contained(member.name):
+            return member
+
+        if member.issym():
+            if not is_contained(posixpath.join(posixpath.dirname(member.name), member.linkname)):
+                return member
+            symlinks.add('/'.join(part for part in member.name.split('/') if part not in ('', os.curdir)))
+        elif member.islnk():
+            if not is_contained(member.linkname):
+                return member
+        elif not member.isfile() and not member.isdir():
+            return member
+
+    return None
+
+
+def _get_retrieve_pattern(item):
+    """Return the remote path or pattern of an entry of a retrieve list."""
+    return item[0] if isinstance(item, list) else item
+
+
+def _copy_retrieved(source, destination):
+    """Copy a retrieved file or folder to its destination, merging folders with existing ones like `Transport.get`."""
+    import shutil
+
+    if not os.path.isdir(source):
+        parent = os.path.dirname(destination)
+        if parent and not os.path.exists(parent):
+            os.makedirs(parent)
+        shutil.copyfile(source, destination)
+        return
+
+    for root, _, filenames in os.walk(source):
+        target = os.path.join(destination, os.path.relpath(root, source))
+        if not os.path.exists(target):
+            os.makedirs(target)
+        for filename in filenames:
+            shutil.copyfile(os.path.join(root, filename), os.path.join(target, filename))
@@ -12,10 +12,14 @@
 from __future__ import division
 from __future__ import print_function
 from __future__ import absolute_import
+import io
 import logging
+import os
+import tempfile
 import traceback
 
 import plumpy
+import six
 
 from aiida.orm.utils import serialize
 
@@ -40,12 +44,103 @@ def get_object_loader():
     return OBJECT_LOADER
 
 
+def get_checkpoint_codec():
+    """
+    Return the name of the codec with which process checkpoints should be written
+
+    The codec is configured through the `engine.checkpoint_codec` option. If it requires a package that is not
+    installed, a warning is logged and the default yaml codec is used instead.
+
+    :return: name of the codec in :data:`aiida.orm.utils.serialize.CHECKPOINT_CODECS`
+    """
+    from aiida.manage.configuration import get_config_option
+
+    codec = get_config_option('engine.checkpoint_codec')
+
+    if codec == 'msgpack' and serialize.msgpack is None:
+        LOGGER.warning('the `msgpack` checkpoint codec is configured but `msgpack` is not installed, using yaml')
+        return 'yaml'
+
+    return codec
+
+
 class AiiDAPersister(plumpy.Persister):
     """
     This node is responsible to taking saved process instance states and
     persisting them to the database.
+
+    The checkpoints are written to a dedicated directory in the file repository of the profile, with one file per
+    process id and checkpoint tag, such that the node table does not have to be rewritten on every state change.
+    Checkpoints that were stored in the attributes of the process node by earlier versions can still be loaded.
     """
 
+    _CHECKPOINT_SUFFIX = '.checkpoint'
+
+    def __init__(self, directory=None):
+        """
+        Construct the persister
+
+        :param directory: optional absolute path of the directory in which to write the checkpoints, by default the
+            `checkpoints` folder of the profile repository is used
+        """
+        super(AiiDAPersister, self).__init__()
+        self._directory = directory
+
+    @property
+    def directory(self):
+        """
+        Return the directory in which the checkpoints are stored, creating it if it does not exist yet
+
+        :return: absolute path of the checkpoint directory
+        """
+        if self._directory is None:
+            from aiida.common.utils import get_repository_folder
+            self._directory = get_repository_folder('checkpoints')
+
+        if not os.path.isdir(self._directory):
+            try:
+                os.makedirs(self._directory)
+            except OSError:
+                # Another process may have created the directory in the meantime
+                if not os.path.isdir(self._directory):
+                    raise
+
+        return self._directory
+
+    def _get_checkpoint_filepath(self, pid, tag=None):
+        """
+        Return the absolute path of the file for the checkpoint of the given process and tag
+
+        :param pid: the process id
+        :param tag: optional checkpoint identifier
+        :return: absolute filepath
+        """
+        if tag is None:
+            filename = '{}{}'.format(pid, self._CHECKPOINT_SUFFIX)
+        else:
+            filename = '{}.{}{}'.format(pid, tag, self._CHECKPOINT_SUFFIX)
+
+        return os.path.join(self.directory, filename)
+
+    def _parse_checkpoint_filename(self, filename):
+        """
+        Parse the name of a checkpoint file into the process id and tag
+
+        :param filename: the name of the checkpoint file
+        :return: `PersistedCheckpoint` tuple or None if the file is not a checkpoint
+        """
+        if not filename.endswith(self._CHECKPOINT_SUFFIX):
+            return None
+
+        pid, _, tag = filename[:-len(self._CHECKPOINT_SUFFIX)].partition('.')
+
+        try:
+            pid = int(pid)
+        except ValueError:
+            return None
+
+        return plumpy.PersistedCheckpoint(pid, tag or None)
+
     def save_checkpoint(self, process, tag=None):
         """
         Persist a Process instance
@@ -56,9 +151,6 @@ class AiiDAPersister(plumpy.Persister):
         """
         LOGGER.debug('Persisting process<%d>', process.pid)
 
-        if tag is not None:
-            raise NotImplementedError('Checkpoint tags not supported yet')
-
         try:
             bundle = plumpy.Bundle(process, plumpy.LoadSaveContext(loader=get_object_loader()))
         except ValueError:
@@ -67,13 +159,39 @@ class AiiDAPersister(plumpy.Persister):
                 process, traceback.format_exc()))
 
         try:
-            process.node.set_checkpoint(serialize.serialize(bundle))
+            checkpoint = serialize.serialize_checkpoint(bundle, codec=get_checkpoint_codec())
+            filepath = self._get_checkpoint_filepath(process.pid, tag)
+
+            # Write to a temporary file first and move it in place, such that a crash never leaves a truncated file
+            # The file and the directory entries are synced to disk, such that the checkpoint survives a power loss
+            handle, temporary = tempfile.mkstemp(dir=self.directory, prefix='.tmp')
+            with io.open(handle, 'w', encoding='utf8') as target:
+                target.write(six.text_type(checkpoint))
+                target.flush()
+                os.fsync(target.fileno())
+            self._fsync_directory()
+            os.rename(temporary, filepath)
+            self._fsync_directory()
         except Exception:
             raise plumpy.PersistenceError("Failed to store a checkpoint for '{}': {}".format(
                 process, traceback.format_exc()))
 
         return bundle
 
+    def _fsync_directory(self):
+        """Sync the entries of the checkpoint directory to disk, which is not supported on all platforms."""
+        try:
+            descriptor = os.open(self.directory, os.O_RDONLY)
+        except OSError:
+            return
+
+        try:
+            os.fsync(descriptor)
+        except OSError:
+            pass
+        finally:
+            os.close(descriptor)
+
     def load_checkpoint(self, pid, tag=None):
         """
         Load a process from a persisted checkpoint by its process id
@@ -84,12 +202,35 @@ class AiiDAPersister(plumpy.Persister):
         :rtype: :class:`plumpy.Bundle`
         :raises: :class:`plumpy.PersistenceError` Raised if there was a problem loading the checkpoint
         """
+        try:
+            with io.open(self._get_checkpoint_filepath(pid, tag), 'r', encoding='utf8') as handle:
+                checkpoint = handle.read()
+        except (IOError, OSError):
+            if tag is not None:
+                raise plumpy.PersistenceError('Process<{}> does not have a saved checkpoint with tag `{}`'.format(
+                    pid, tag))
+            checkpoint = self._load_node_checkpoint(pid)
+
+        try:
+            bundle = serialize.deserialize_checkpoint(checkpoint)
+        except Exception:
+            raise plumpy.PersistenceError("Failed to load the checkpoint for process<{}>: {}".format(
+                pid, traceback.format_exc()))
+
+        return bundle
+
+    @staticmethod
+    def _load_node_checkpoint(pid):
+        """
+        Return the checkpoint that earlier versions stored in the attributes of the process node
+
+        :param pid: the process id
+        :return: the serialized checkpoint
+        :raises: :class:`plumpy.PersistenceError` if the node does not exist or does not have a checkpoint
+        """
         from aiida.common.exceptions import MultipleObjectsError, NotExistent
         from aiida.orm import load_node
 
-        if tag is not None:
-            raise NotImplementedError('Checkpoint tags not supported yet')
-
         try:
             calculation = load_node(pid)
         except (MultipleObjectsError, NotExistent):
@@ -101,13 +242,7 @@ class AiiDAPersister(plumpy.Persister):
         if checkpoint is None:
             raise plumpy.PersistenceError('Calculation<{}> does not have a saved checkpoint'.format(calculation.pk))
 
-        try:
-            bundle = serialize.deserialize(checkpoint)
-        except Exception:
-            raise plumpy.PersistenceError("Failed to load the checkpoint for process<{}>: {}".format(
-                pid, traceback.format_exc()))
-
-        return bundle
+        return checkpoint
 
     def get_checkpoints(self):
         """
@@ -116,6 +251,14 @@ class AiiDAPersister(plumpy.Persister):
 
         :return: list of PersistedCheckpoint tuples
         """
+        checkpoints = []
+
+        for filename in os.listdir(self.directory):
+            checkpoint = self._parse_checkpoint_filename(filename)
+            if checkpoint is not None:
+                checkpoints.append(checkpoint)
+
+        return checkpoints
 
     def get_process_checkpoints(self, pid):
         """
@@ -126,6 +269,7 @@ class AiiDAPersister(plumpy.Persister):
         :param pid: the process pid
         :return: list of PersistedCheckpoint tuples
         """
+        return [checkpoint for checkpoint in self.get_checkpoints() if checkpoint.pid == pid]
 
     def delete_checkpoint(self, pid, tag=None):
         """
@@ -134,10 +278,23 @@ class AiiDAPersister(plumpy.Persister):
         :param pid: the process id of the :class:`plumpy.Process`
         :param tag: optional checkpoint identifier to allow retrieving a specific sub checkpoint
         """
-        from aiida.orm import load_node
+        try:
+            os.remove(self._get_checkpoint_filepath(pid, tag))
+        except OSError:
+            pass
+
+        if tag is None:
+            from aiida.common.exceptions import NotExistent
+            from aiida.orm import load_node
 
-        calc = load_node(pid)
-        calc.delete_checkpoint()
+            try:
+                calc = load_node(pid)
+            except NotExistent:
+                # The node was deleted, for example by `delete_nodes`, so there is no attribute checkpoint to remove
+                return
+
+            if calc.checkpoint is not None:
+                calc.delete_checkpoint()
 
     def delete_process_checkpoints(self, pid):
         """
@@ -145,3 +302,8 @@ class AiiDAPersister(plumpy.Persister):
 
         :param pid: the process id of the :class:`aiida.engine.processes.process.Process`
         """
+        tags = set([checkpoint.tag for checkpoint in self.get_process_checkpoints(pid)])
+        tags.add(None)
+
+        for tag in tags:
+            self.delete_checkpoint(pid, tag)
@@ -205,18 +205,12 @@ class CalcJob(Process):
 
         This is called once it's finished waiting for the calculation to be finished and the data has been retrieved.
         """
-        import shutil
         from aiida.engine.daemon import execmanager
 
         try:
             exit_code = execmanager.parse_results(self, retrieved_temporary_folder)
         finally:
-            # Delete the temporary folder
-            try:
-                shutil.rmtree(retrieved_temporary_folder)
-            except OSError as exception:
-                if exception.errno != 2:
-                    raise
+            self._remove_retrieved_temporary_folder(retrieved_temporary_folder)
 
         # Finally link up the outputs and we're done
         for entry in self.node.get_outgoing():
@@ -224,6 +218,35 @@ class CalcJob(Process):
 
         return exit_code
 
+    def finalize_parse(self, retrieved_temporary_folder=None, exit_status=0, exit_message=None):
+        """
+        Finalize a retrieved job calculation whose results were already parsed in the parse executor of the runner.
+
+        This is called instead of `parse` once the `Waiting` state has run the parser outside of the event loop.
+        """
+        from aiida.engine import ExitCode
+
+        self._remove_retrieved_temporary_folder(retrieved_temporary_folder)
+
+        for entry in self.node.get_outgoing():
+            self.out(entry.link_label, entry.node)
+
+        return ExitCode(exit_status, exit_message)
+
+    @staticmethod
+    def _remove_retrieved_temporary_folder(retrieved_temporary_folder):
+        """Delete the temporary folder used in retrieving, ignoring it if it no longer exists."""
+        import shutil
+
+        if retrieved_temporary_folder is None:
+            return
+
+        try:
+            shutil.rmtree(retrieved_temporary_folder)
+        except OSError as exception:
+            if exception.errno != 2:
+                raise
+
     def presubmit(self, folder):
         """
         Prepares the calculation folder with all inputs, ready to be copied to the cluster.
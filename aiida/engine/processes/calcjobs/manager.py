@@ -13,16 +13,134 @@ from __future__ import print_function
 from __future__ import absolute_import
 
 import contextlib
+import errno
+import fcntl
+import io
+import os
+import tempfile
 import time
 
 from six import iteritems, itervalues
 from tornado import concurrent, gen
 
 from aiida import schedulers
-from aiida.common import exceptions, lang
+from aiida.common import exceptions, json, lang
 from aiida.common.log import AIIDA_LOGGER
 
-__all__ = ('JobsList', 'JobManager')
+__all__ = ('JobsList', 'JobManager', 'SharedJobsCache')
+
+
+class SharedJobsCache(object):  # pylint: disable=useless-object-inheritance
+    """On-disk cache of the scheduler jobs list of an ``AuthInfo`` that is shared between runners in different processes.
+
+    Polling the scheduler is coordinated through a lease, which is an exclusive lock on a file in the cache directory
+    that can be held by a single runner at a time. The runner holding the lease polls the scheduler and writes the
+    response to the cache, such that all other runners can use it instead of polling the scheduler themselves. Since the
+    lock is released by the operating system when the holding process dies, a crashed worker cannot block the others.
+    """
+
+    def __init__(self, directory, authinfo_id):
+        """Construct an instance for the given authinfo storing its files in the given directory.
+
+        :param directory: absolute path of the directory shared by the runners, will be created if it does not exist
+        :param authinfo_id: the id of the authinfo whose jobs list is cached
+        """
+        try:
+            os.makedirs(directory)
+        except OSError as exception:
+            if exception.errno != errno.EEXIST:
+                raise
+
+        self._directory = directory
+        self._filepath_cache = os.path.join(directory, 'authinfo-{}.json'.format(authinfo_id))
+        self._filepath_lease = os.path.join(directory, 'authinfo-{}.lock'.format(authinfo_id))
+        self._lease_handle = None
+
+    @property
+    def has_lease(self):
+        """Return whether this instance currently holds the lease.
+
+        :rtype: bool
+        """
+        return self._lease_handle is not None
+
+    def acquire_lease(self):
+        """Try to acquire the lease to poll the scheduler without blocking.
+
+        :return: True if the lease was acquired, False if it is currently held by another runner
+        :rtype: bool
+        """
+        if self._lease_handle is not None:
+            return True
+
+        handle = io.open(self._filepath_lease, 'a')
+
+        try:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except (IOError, OSError) as exception:
+            handle.close()
+            if exception.errno in (errno.EACCES, errno.EAGAIN):
+                return False
+            raise
+
+        self._lease_handle = handle
+        return True
+
+    def release_lease(self):
+        """Release the lease if it is held by this instance."""
+        if self._lease_handle is None:
+            return
+
+        try:
+            fcntl.flock(self._lease_handle.fileno(), fcntl.LOCK_UN)
+        finally:
+            self._lease_handle.close()
+            self._lease_handle = None
+
+    def read(self):
+        """Read the cached jobs list.
+
+        :return: tuple of the timestamp of the poll that produced the jobs list, as produced by `time.time()`, and a
+            mapping of job ids to :py:class:`~aiida.schedulers.datastructures.JobInfo` instances. The timestamp is
+            `None` if there is no valid cache.
+        """
+        try:
+            with io.open(self._filepath_cache, 'r', encoding='utf8') as handle:
+                data = json.load(handle)
+            timestamp = float(data['timestamp'])
+            serialized_jobs = data['jobs']
+        except (IOError, OSError, ValueError, KeyError, TypeError):
+            return None, {}
+
+        jobs = {}
+
+        for job_id, serialized in iteritems(serialized_jobs):
+            job_info = schedulers.JobInfo()
+            job_info.load_from_serialized(serialized)
+            jobs[job_id] = job_info
+
+        return timestamp, jobs
+
+    def write(self, timestamp, jobs):
+        """Write the jobs list to the cache, atomically replacing the previous one.
+
+        :param timestamp: the timestamp of the start of the poll that produced the jobs list
+        :param jobs: a mapping of job ids to :py:class:`~aiida.schedulers.datastructures.JobInfo` instances
+        """
+        data = {
+            'timestamp': timestamp,
+            'jobs': {job_id: job_info.serialize() for job_id, job_info in iteritems(jobs)},
+        }
+
+        handle, filepath = tempfile.mkstemp(dir=self._directory)
+
+        try:
+            with io.open(handle, 'wb') as fhandle:
+                json.dump(data, fhandle)
+            os.rename(filepath, self._filepath_cache)
+        except Exception:
+            os.remove(filepath)
+            raise
 
 
 class JobsList(object):  # pylint: disable=useless-object-inheritance
@@ -40,9 +158,24 @@ class JobsList(object):  # pylint: disable=useless-object-inheritance
     launched with that particular authinfo. If multiple authinfo instances with the same computer, have active jobs
     these limitations are not respected between them, since there is no communication between ``JobsList`` instances.
     See the :py:class:`~aiida.engine.processes.calcjobs.manager.JobManager` for example usage.
+
+    If the computer also defines a maximum polling interval, the interval is adapted to the state of the jobs: it grows
+    with the time that queued jobs have been waiting and with the remaining requested walltime of running jobs, up to the
+    maximum. After failed scheduler polls, the interval is doubled with every consecutive failure.
+
+    The guarantees can be extended to ``JobsList`` instances for the same authinfo in different runners, for example
+    the workers of the daemon, by passing a :py:class:`~aiida.engine.processes.calcjobs.manager.SharedJobsCache`. If
+    the scheduler can be queried for all jobs of the user, only the runner holding the lease of the cache will poll the
+    scheduler, while the others will use the response that it wrote to the cache.
     """
 
-    def __init__(self, authinfo, transport_queue, last_updated=None):
+    _DEFERRED_UPDATE_DELAY = 1.
+    _ADAPTIVE_POLL_FRACTION = 0.1
+    _MAXIMUM_ERROR_BACKOFF = 600.
+    _SUBMIT = 'submit'
+    _KILL = 'kill'
+
+    def __init__(self, authinfo, transport_queue, last_updated=None, shared_cache=None):
         """Construct an instance for the given authinfo and transport queue.
 
         :param authinfo: The authinfo used to check the jobs list
@@ -51,6 +184,8 @@ class JobsList(object):  # pylint: disable=useless-object-inheritance
         :type: :class:`aiida.engine.transports.TransportQueue`
         :param last_updated: initialize the last updated timestamp
         :type: float
+        :param shared_cache: optional cache to share the scheduler response with runners in other processes
+        :type: :class:`aiida.engine.processes.calcjobs.manager.SharedJobsCache`
         """
         lang.type_check(last_updated, float, allow_none=True)
 
@@ -63,6 +198,14 @@ class JobsList(object):  # pylint: disable=useless-object-inheritance
         self._job_update_requests = {}  # Mapping: {job_id: Future}
         self._last_updated = last_updated
         self._update_handle = None
+        self._update_time = None
+        self._update_deferred = False
+        self._poll_failures = 0
+        self._last_poll_failure = None
+        self._shared_cache = shared_cache
+        self._batched_requests = {self._SUBMIT: [], self._KILL: []}  # Mapping: {operation: [(arguments, Future)]}
+        self._batched_handles = {self._SUBMIT: None, self._KILL: None}
+        self._job_first_requested = {}  # Mapping: {job_id: timestamp of first update request}
 
     @property
     def logger(self):
@@ -80,6 +223,73 @@ class JobsList(object):  # pylint: disable=useless-object-inheritance
         """
         return self._authinfo.computer.get_minimum_job_poll_interval()
 
+    def get_maximum_update_interval(self):
+        """Get the maximum interval up to which the interval between updates is adapted to the state of the jobs.
+
+        :return: the maximum interval, which disables the adaptive interval if it is not larger than the minimum
+        :rtype: float
+        """
+        return self._authinfo.computer.get_maximum_job_poll_interval()
+
+    def get_update_interval(self):
+        """Get the interval that should be respected between updates of the list given the last known job states.
+
+        If the maximum update interval is larger than the minimum, the interval for each job with an outstanding update
+        request is a fraction of the time it has been queued or of its remaining requested walltime, clamped between
+        the minimum and maximum. The interval of the list is the smallest of those of its jobs. Jobs in any other state
+        or whose state is not known yet are polled with the minimum interval.
+
+        :return: the update interval
+        :rtype: float
+        """
+        minimum_interval = self.get_minimum_update_interval()
+        maximum_interval = self.get_maximum_update_interval()
+
+        if not maximum_interval or maximum_interval <= minimum_interval:
+            return minimum_interval
+
+        now = time.time()
+        intervals = [
+            self._get_job_update_interval(job_id, now) for job_id, request in iteritems(self._job_update_requests)
+            if not request.done()
+        ]
+
+        if not intervals:
+            return minimum_interval
+
+        return max(minimum_interval, min(maximum_interval, min(intervals)))
+
+    def _get_job_update_interval(self, job_id, now):
+        """Get the desired update interval for a single job based on the last known information from the scheduler.
+
+        :param job_id: job identifier
+        :param now: the current timestamp
+        :return: the desired interval, which is zero if the job should be polled as soon as allowed
+        :rtype: float
+        """
+        job_info = self._jobs_cache.get(job_id, None)
+
+        if job_info is None:
+            return 0.
+
+        if job_info.job_state in [schedulers.JobState.QUEUED, schedulers.JobState.QUEUED_HELD]:
+            # The longer a job has been queued, the less likely it is to finish soon
+            queued = now - self._job_first_requested.get(job_id, now)
+            return self._ADAPTIVE_POLL_FRACTION * queued
+
+        if job_info.job_state == schedulers.JobState.RUNNING:
+            requested = job_info.requested_wallclock_time_seconds
+            elapsed = job_info.wallclock_time_seconds
+
+            if requested is None or elapsed is None or self.last_updated is None:
+                return 0.
+
+            # The job cannot run longer than its requested walltime, so poll more often when it is nearing its end
+            remaining = requested - elapsed - (now - self.last_updated)
+            return max(self._ADAPTIVE_POLL_FRACTION * remaining, 0.)
+
+        return 0.
+
     @property
     def last_updated(self):
         """Get the timestamp of when the list was last updated as produced by `time.time()`
@@ -89,10 +299,83 @@ class JobsList(object):  # pylint: disable=useless-object-inheritance
         """
         return self._last_updated
 
+    def _is_sharing_scheduler_poll(self):
+        """Return whether the response of polling the scheduler is shared with other runners through the shared cache.
+
+        This is only possible if the scheduler can be queried for all jobs of the user, since otherwise the response
+        would only contain the jobs of the runner that polled the scheduler.
+
+        :rtype: bool
+        """
+        if self._shared_cache is None:
+            return False
+
+        return self._authinfo.computer.get_scheduler().get_feature('can_query_by_user')
+
+    def _get_jobs_from_shared_cache(self):
+        """Get the current jobs list from the shared cache if it is recent enough to be used.
+
+        The cache can only be used if it is younger than the minimum update interval and if the poll that produced it
+        started after the first update request of all the jobs that are not in it. Otherwise a job that was submitted
+        by this runner after the poll would be mistaken for a job that is no longer with the scheduler.
+
+        :return: a mapping of job ids to :py:class:`~aiida.schedulers.datastructures.JobInfo` instances or None
+        """
+        timestamp, jobs = self._shared_cache.read()
+
+        if timestamp is None or time.time() - timestamp >= self.get_minimum_update_interval():
+            return None
+
+        for job_id in self._job_update_requests:
+            if job_id not in jobs and self._job_first_requested.get(job_id, timestamp) >= timestamp:
+                return None
+
+        self._last_updated = timestamp
+        self.logger.info('AuthInfo<{}>: retrieved status of active jobs from shared cache'.format(self._authinfo.pk))
+
+        return jobs
+
     @gen.coroutine
     def _get_jobs_from_scheduler(self):
         """Get the current jobs list from the scheduler.
 
+        If the poll is shared with other runners, the jobs list is taken from the shared cache if it is recent enough.
+        Otherwise the scheduler is only polled if the lease can be acquired, in which case the response is written to
+        the shared cache. If the lease is held by another runner, the update is deferred.
+
+        :return: a mapping of job ids to :py:class:`~aiida.schedulers.datastructures.JobInfo` instances or None if the
+            update was deferred
+        :rtype: dict
+        """
+        if not self._is_sharing_scheduler_poll():
+            jobs_cache = yield self._poll_scheduler()
+            raise gen.Return(jobs_cache)
+
+        jobs_cache = self._get_jobs_from_shared_cache()
+
+        if jobs_cache is not None:
+            raise gen.Return(jobs_cache)
+
+        if not self._shared_cache.acquire_lease():
+            raise gen.Return(None)
+
+        try:
+            # The cache may have been updated by the previous holder of the lease in the meantime
+            jobs_cache = self._get_jobs_from_shared_cache()
+
+            if jobs_cache is None:
+                timestamp = time.time()
+                jobs_cache = yield self._poll_scheduler()
+                self._shared_cache.write(timestamp, jobs_cache)
+        finally:
+            self._shared_cache.release_lease()
+
+        raise gen.Return(jobs_cache)
+
+    @gen.coroutine
+    def _poll_scheduler(self):
+        """Poll the scheduler for the current jobs list.
+
         :return: a mapping of job ids to :py:class:`~aiida.schedulers.datastructures.JobInfo` instances
         :rtype: dict
         """
@@ -108,52 +391,89 @@ class JobsList(object):  # pylint: disable=useless-object-inheritance
             else:
                 kwargs['jobs'] = self._get_jobs_with_scheduler()
 
-            scheduler_response = scheduler.get_jobs(**kwargs)
+            # The transport is shared with the other clients of the queue, so it is only used in its own thread
+            async_transport = self._transport_queue.get_async_transport(self._authinfo)
+            jobs_cache = yield async_transport.run(self._get_jobs, scheduler, kwargs)
 
-            # Update the last update time and clear the jobs cache
+            # Update the last update time
             self._last_updated = time.time()
-            jobs_cache = {}
             self.logger.info('AuthInfo<{}>: successfully retrieved status of active jobs'.format(self._authinfo.pk))
 
-            for job_id, job_info in iteritems(scheduler_response):
-                # If the job is done then get detailed job information
-                detailed_job_info = None
-                if job_info.job_state == schedulers.JobState.DONE:
-                    try:
-                        detailed_job_info = scheduler.get_detailed_jobinfo(job_id)
-                    except exceptions.FeatureNotAvailable:
-                        detailed_job_info = 'This scheduler does not implement get_detailed_jobinfo'
+            raise gen.Return(jobs_cache)
 
-                job_info.detailedJobinfo = detailed_job_info
-                jobs_cache[job_id] = job_info
+    @staticmethod
+    def _get_jobs(scheduler, kwargs):
+        """Get the jobs list from the scheduler including the detailed job information of the jobs that are done.
 
-            raise gen.Return(jobs_cache)
+        :param scheduler: the scheduler with an open transport
+        :param kwargs: the keyword arguments for `Scheduler.get_jobs`
+        :return: a mapping of job ids to :py:class:`~aiida.schedulers.datastructures.JobInfo` instances
+        :rtype: dict
+        """
+        scheduler_response = scheduler.get_jobs(**kwargs)
+        jobs_cache = {}
+
+        # For jobs that are done get the detailed job information, for all of them with a single command
+        jobs_done = [
+            job_id for job_id, job_info in iteritems(scheduler_response)
+            if job_info.job_state == schedulers.JobState.DONE
+        ]
+
+        try:
+            detailed_job_infos = scheduler.get_detailed_jobinfo_many(jobs_done)
+        except exceptions.FeatureNotAvailable:
+            detailed_job_infos = {
+                job_id: 'This scheduler does not implement get_detailed_jobinfo' for job_id in jobs_done
+            }
+
+        for job_id, job_info in iteritems(scheduler_response):
+            job_info.detailedJobinfo = detailed_job_infos.get(job_id, None)
+            jobs_cache[job_id] = job_info
+
+        return jobs_cache
 
     @gen.coroutine
     def _update_job_info(self):
         """Update all of the job information objects.
 
         This will set the futures for all pending update requests where the corresponding job has a new status compared
-        to the last update.
+        to the last update. If the update is deferred, because another runner is currently polling the scheduler, the
+        pending requests are left untouched.
         """
         try:
             if not self._update_requests_outstanding():
+                self._job_update_requests = {}
                 return
 
             # Update our cache of the job states
-            self._jobs_cache = yield self._get_jobs_from_scheduler()
+            jobs_cache = yield self._get_jobs_from_scheduler()
         except Exception as exception:
+            self._poll_failures += 1
+            self._last_poll_failure = time.time()
             # Set the exception on all the update futures
             for future in itervalues(self._job_update_requests):
                 if not future.done():
                     future.set_exception(exception)
-            raise
-        else:
-            for job_id, future in iteritems(self._job_update_requests):
-                if not future.done():
-                    future.set_result(self._jobs_cache.get(job_id, None))
-        finally:
             self._job_update_requests = {}
+            raise
+
+        self._update_deferred = jobs_cache is None
+
+        if self._update_deferred:
+            return
+
+        self._poll_failures = 0
+
+        self._jobs_cache = jobs_cache
+
+        for job_id, future in iteritems(self._job_update_requests):
+            if not future.done():
+                job_info = self._jobs_cache.get(job_id, None)
+                if job_info is None or job_info.job_state == schedulers.JobState.DONE:
+                    self._job_first_requested.pop(job_id, None)
+                future.set_result(job_info)
+
+        self._job_update_requests = {}
 
     @contextlib.contextmanager
     def request_job_info_update(self, job_id):
@@ -166,6 +486,7 @@ class JobsList(object):  # pylint: disable=useless-object-inheritance
         """
         # Get or create the future
         request = self._job_update_requests.setdefault(job_id, concurrent.Future())
+        self._job_first_requested.setdefault(job_id, time.time())
         assert not request.done(), 'Expected pending job info future, found in done state.'
 
         try:
@@ -174,6 +495,167 @@ class JobsList(object):  # pylint: disable=useless-object-inheritance
         finally:
             pass
 
+    @contextlib.contextmanager
+    def request_job_submission(self, working_directory, submit_script):
+        """Request the submission of a job script to the scheduler.
+
+        Submission requests are coalesced: all requests that are made while waiting for the transport, or while a
+        previous batch is being submitted, are submitted together with a single remote command.
+
+        :param working_directory: the absolute path of the working directory on the remote
+        :param submit_script: the path of the submit script relative to the working directory
+        :return: future that will resolve to the job id of the submitted job
+        """
+        with self._request_batched_operation(self._SUBMIT, (working_directory, submit_script)) as request:
+            yield request
+
+    @contextlib.contextmanager
+    def request_job_kill(self, job_id):
+        """Request a job to be killed through the scheduler.
+
+        Kill requests are coalesced in the same way as submission requests. If the scheduler reports that killing a job
+        failed, its status is checked with a single scheduler query for all failed jobs of the batch: a job that is no
+        longer running is considered killed.
+
+        :param job_id: job identifier
+        :return: future that will resolve to True once the job is killed
+        """
+        with self._request_batched_operation(self._KILL, job_id) as request:
+            yield request
+
+    @contextlib.contextmanager
+    def _request_batched_operation(self, operation, arguments):
+        """Add a request for a scheduler operation to the batch of pending requests for that operation.
+
+        :param operation: the scheduler operation, either `_SUBMIT` or `_KILL`
+        :param arguments: the arguments of the operation for the job of this request
+        :return: future that will resolve to the result of the operation for this request
+        """
+        request = concurrent.Future()
+        entry = (arguments, request)
+        self._batched_requests[operation].append(entry)
+
+        try:
+            self._ensure_processing_batch(operation)
+            yield request
+        finally:
+            if not request.done() and entry in self._batched_requests[operation]:
+                self._batched_requests[operation].remove(entry)
+
+    def _ensure_processing_batch(self, operation):
+        """Ensure that pending requests for the given scheduler operation are being processed.
+
+        This will automatically stop if there are no pending requests.
+
+        :param operation: the scheduler operation, either `_SUBMIT` or `_KILL`
+        """
+
+        @gen.coroutine
+        def processing():
+            """Process the pending requests, continue with those made in the meantime."""
+            try:
+                yield self._process_batch(operation)
+            finally:
+                if self._batched_requests[operation]:
+                    self._batched_handles[operation] = self._loop.call_later(0., processing)
+                else:
+                    self._batched_handles[operation] = None
+
+        if self._batched_handles[operation] is None:
+            self._batched_handles[operation] = self._loop.call_later(0., processing)
+
+    @gen.coroutine
+    def _process_batch(self, operation):
+        """Perform the scheduler operation for all pending requests with a single scheduler call.
+
+        :param operation: the scheduler operation, either `_SUBMIT` or `_KILL`
+        """
+        batch = []
+
+        try:
+            with self._transport_queue.request_transport(self._authinfo) as request:
+                transport = yield request
+
+                batch = [entry for entry in self._batched_requests[operation] if not entry[1].done()]
+                self._batched_requests[operation] = []
+
+                if not batch:
+                    return
+
+                scheduler = self._authinfo.computer.get_scheduler()
+                scheduler.set_transport(transport)
+
+                self.logger.info('AuthInfo<{}>: performing {} for {} jobs'.format(
+                    self._authinfo.pk, operation, len(batch)))
+
+                arguments = [entry[0] for entry in batch]
+                function = self._submit_jobs if operation == self._SUBMIT else self._kill_jobs
+
+                # The transport is shared with the other clients of the queue, so it is only used in its own thread
+                async_transport = self._transport_queue.get_async_transport(self._authinfo)
+                results = yield async_transport.run(function, scheduler, arguments)
+        except Exception as exception:  # pylint: disable=broad-except
+            if not batch:
+                batch = self._batched_requests[operation]
+                self._batched_requests[operation] = []
+
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exception)
+            return
+
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    @staticmethod
+    def _submit_jobs(scheduler, submissions):
+        """Submit the given job scripts with a single scheduler call.
+
+        :param scheduler: the scheduler with an open transport
+        :param submissions: list of tuples of the working directory and the path of the submit script relative to it
+        :return: list with for each submission either the job id or an exception
+        """
+        if len(submissions) == 1:
+            working_directory, submit_script = submissions[0]
+            return [scheduler.submit_from_script(working_directory, submit_script)]
+
+        return scheduler.submit_from_script_many(submissions)
+
+    def _kill_jobs(self, scheduler, job_ids):
+        """Kill the given jobs with a single scheduler call, which is the plain `kill` if there is only a single job.
+
+        :param scheduler: the scheduler with an open transport
+        :param job_ids: list of job identifiers
+        :return: list with for each job either True or an exception if the job could not be killed
+        """
+        if len(job_ids) == 1:
+            killed = {job_ids[0]: scheduler.kill(job_ids[0])}
+        else:
+            killed = scheduler.kill_many(job_ids)
+
+        failed = [job_id for job_id in job_ids if killed.get(job_id) is not True]
+        running_jobs = scheduler.get_jobs(jobs=failed, as_dict=True) if failed else {}
+        results = []
+
+        for job_id in job_ids:
+            job = running_jobs.get(job_id, None)
+
+            if job_id not in failed:
+                results.append(True)
+            elif job is not None and job.job_state != schedulers.JobState.DONE:
+                # If the job is returned it is still running and the kill really failed
+                results.append(exceptions.RemoteOperationError('scheduler.kill({}) was unsuccessful'.format(job_id)))
+            else:
+                self.logger.warning('scheduler.kill() failed but job<{}> no longer seems to be running'.format(job_id))
+                results.append(True)
+
+        return results
+
     def _ensure_updating(self):
         """Ensure that we are updating the job list from the remote resource.
 
@@ -183,16 +665,32 @@ class JobsList(object):  # pylint: disable=useless-object-inheritance
         @gen.coroutine
         def updating():
             """Do the actual update, stop if not requests left."""
-            yield self._update_job_info()
-            # Any outstanding requests?
-            if self._update_requests_outstanding():
-                self._update_handle = self._loop.call_later(self._get_next_update_delay(), updating)
-            else:
-                self._update_handle = None
+            self._update_time = None
+            try:
+                yield self._update_job_info()
+            finally:
+                # Any outstanding requests? Also reschedule after a failed update, which will be backed off
+                if self._update_requests_outstanding():
+                    self._schedule_update(updating)
+                else:
+                    self._update_handle = None
 
         # Check if we're already updating
         if self._update_handle is None:
-            self._update_handle = self._loop.call_later(self._get_next_update_delay(), updating)
+            self._schedule_update(updating)
+        elif self._update_time is not None and time.time() + self._get_next_update_delay() < self._update_time:
+            # The scheduled update is not running yet, but a newly requested job needs to be polled earlier
+            self._loop.remove_timeout(self._update_handle)
+            self._schedule_update(updating)
+
+    def _schedule_update(self, callback):
+        """Schedule the next update of the list after the delay that is currently required.
+
+        :param callback: the function that performs the update
+        """
+        delay = self._get_next_update_delay()
+        self._update_time = time.time() + delay
+        self._update_handle = self._loop.call_later(delay, callback)
 
     @staticmethod
     def _has_job_state_changed(old, new):
@@ -214,21 +712,32 @@ class JobsList(object):  # pylint: disable=useless-object-inheritance
     def _get_next_update_delay(self):
         """Calculate when we are next allowed to poll the scheduler.
 
-        This delay is calculated as the minimum polling interval defined by the authentication info for this instance,
-        minus time elapsed since the last update.
+        This delay is calculated as the update interval for the current jobs, see ``get_update_interval``, minus time
+        elapsed since the last update. After consecutive failed polls, the delay is instead the minimum polling interval
+        doubled for every failure, up to the larger of the maximum interval and ``_MAXIMUM_ERROR_BACKOFF``, minus the
+        time elapsed since the last failure.
 
         :return: delay (in seconds) after which the scheduler may be polled again
         :rtype: float
         """
+        if self._update_deferred:
+            # Another runner is polling the scheduler, so check the shared cache again shortly
+            return self._DEFERRED_UPDATE_DELAY
+
+        if self._poll_failures:
+            maximum_backoff = max(self.get_maximum_update_interval(), self._MAXIMUM_ERROR_BACKOFF)
+            backoff = min(max(self.get_minimum_update_interval(), 1.) * 2**self._poll_failures, maximum_backoff)
+            return max(backoff - (time.time() - self._last_poll_failure), 0.)
+
         if self.last_updated is None:
             # Never updated, so do it straight away
             return 0.
 
-        # Make sure to actually 'get' the minimum interval here, in case the user changed since last time
-        minimum_interval = self.get_minimum_update_interval()
+        # Make sure to actually 'get' the interval here, in case the user changed since last time
+        interval = self.get_update_interval()
         elapsed = time.time() - self.last_updated
 
-        delay = max(minimum_interval - elapsed, 0.)
+        delay = max(interval - elapsed, 0.)
 
         return delay
 
@@ -256,13 +765,23 @@ class JobManager(object):
     As long as a :py:class:`~aiida.engine.runners.Runner` will create a single ``JobManager`` instance and use that for
     its lifetime, the guarantees made by the ``JobsList`` about respecting the minimum polling interval of the scheduler
     will be maintained. Note, however, that since each ``Runner`` will create its own job manager, these guarantees
-    only hold per runner.
+    only hold per runner, unless a `shared_directory` is specified. In that case, the ``JobsList`` instances of all
+    job managers using the same directory coordinate polling the scheduler through a
+    :py:class:`~aiida.engine.processes.calcjobs.manager.SharedJobsCache`.
     """
 
     # pylint: disable=useless-object-inheritance
 
-    def __init__(self, transport_queue):
+    def __init__(self, transport_queue, shared_directory=None):
+        """Construct the job manager.
+
+        :param transport_queue: a transport queue
+        :type: :class:`aiida.engine.transports.TransportQueue`
+        :param shared_directory: optional absolute path of a directory through which scheduler polls are shared with
+            job managers of other runners
+        """
         self._transport_queue = transport_queue
+        self._shared_directory = shared_directory
         self._job_lists = {}
 
     def get_jobs_list(self, authinfo):
@@ -272,10 +791,42 @@ class JobManager(object):
         :return: a `JobsList` instance
         """
         if authinfo.id not in self._job_lists:
-            self._job_lists[authinfo.id] = JobsList(authinfo, self._transport_queue)
+            shared_cache = None
+            if self._shared_directory is not None:
+                shared_cache = SharedJobsCache(self._shared_directory, authinfo.id)
+            self._job_lists[authinfo.id] = JobsList(authinfo, self._transport_queue, shared_cache=shared_cache)
 
         return self._job_lists[authinfo.id]
 
+    @contextlib.contextmanager
+    def request_job_submission(self, authinfo, working_directory, submit_script):
+        """Get a future that will resolve to the job id of the submitted job script.
+
+        This is a context manager so that if the user leaves the context the request is automatically cancelled.
+
+        :param authinfo: the `AuthInfo` with which to submit the job
+        :param working_directory: the absolute path of the working directory on the remote
+        :param submit_script: the path of the submit script relative to the working directory
+        :return: future that will resolve to the job id
+        :rtype: :class:`tornado.concurrent.Future`
+        """
+        with self.get_jobs_list(authinfo).request_job_submission(working_directory, submit_script) as request:
+            yield request
+
+    @contextlib.contextmanager
+    def request_job_kill(self, authinfo, job_id):
+        """Get a future that will resolve to True once the job has been killed.
+
+        This is a context manager so that if the user leaves the context the request is automatically cancelled.
+
+        :param authinfo: the `AuthInfo` with which the job was submitted
+        :param job_id: job identifier
+        :return: future that will resolve to True
+        :rtype: :class:`tornado.concurrent.Future`
+        """
+        with self.get_jobs_list(authinfo).request_job_kill(job_id) as request:
+            yield request
+
     @contextlib.contextmanager
     def request_job_info_update(self, authinfo, job_id):
         """Get a future that will resolve to information about a given job.
@@ -17,6 +17,7 @@ import sys
 import tempfile
 
 import six
+from tornado.concurrent import Future, chain_future
 from tornado.gen import coroutine, Return
 
 import plumpy
@@ -27,12 +28,14 @@ from aiida.engine.daemon import execmanager
 from aiida.engine.utils import exponential_backoff_retry, interruptable_task
 from aiida.schedulers.datastructures import JobState
 
+from ..exit_code import ExitCode
 from ..process import ProcessState
 
 UPLOAD_COMMAND = 'upload'
 SUBMIT_COMMAND = 'submit'
 UPDATE_COMMAND = 'update'
 RETRIEVE_COMMAND = 'retrieve'
+PARSE_COMMAND = 'parse'
 KILL_COMMAND = 'kill'
 
 TRANSPORT_TASK_RETRY_INITIAL_INTERVAL = 20
@@ -73,7 +76,10 @@ def task_upload_job(node, transport_queue, calc_info, script_filename, cancellab
     def do_upload():
         with transport_queue.request_transport(authinfo) as request:
             transport = yield cancellable.with_interrupt(request)
-            raise Return(execmanager.upload_calculation(node, transport, calc_info, script_filename))
+            async_transport = transport_queue.get_async_transport(authinfo)
+            yield async_transport.execute_steps(
+                execmanager.upload_calculation_steps(node, transport, calc_info, script_filename))
+            raise Return((calc_info, script_filename))
 
     try:
         logger.info('uploading calculation<{}>'.format(node.pk))
@@ -91,18 +97,19 @@ def task_upload_job(node, transport_queue, calc_info, script_filename, cancellab
 
 
 @coroutine
-def task_submit_job(node, transport_queue, calc_info, script_filename, cancellable):
+def task_submit_job(node, job_manager, script_filename, cancellable):
     """
     Transport task that will attempt to submit a job calculation
 
-    The task will first request a transport from the queue. Once the transport is yielded, the relevant execmanager
-    function is called, wrapped in the exponential_backoff_retry coroutine, which, in case of a caught exception, will
-    retry after an interval that increases exponentially with the number of retries, for a maximum number of retries.
-    If all retries fail, the task will raise a TransportTaskException
+    The task will request the submission of the job from the job manager, which coalesces it with the other pending
+    submissions for the same authinfo into a single scheduler call. The request is wrapped in the
+    exponential_backoff_retry coroutine, which, in case of a caught exception, will retry after an interval that
+    increases exponentially with the number of retries, for a maximum number of retries. If all retries fail, the task
+    will raise a TransportTaskException
 
     :param node: the node that represents the job calculation
-    :param transport_queue: the TransportQueue from which to request a Transport
-    :param calc_info: the calculation info datastructure returned by `CalcJobNode._presubmit`
+    :param job_manager: the job manager through which to submit the job
+    :type job_manager: :class:`aiida.engine.processes.calcjobs.manager.JobManager`
     :param script_filename: the job launch script returned by `CalcJobNode._presubmit`
     :param cancellable: the cancelled flag that will be queried to determine whether the task was cancelled
     :type cancellable: :class:`aiida.engine.utils.InterruptableFuture`
@@ -118,12 +125,14 @@ def task_submit_job(node, transport_queue, calc_info, script_filename, cancellab
     max_attempts = TRANSPORT_TASK_MAXIMUM_ATTEMTPS
 
     authinfo = node.computer.get_authinfo(node.user)
+    workdir = node.get_remote_workdir()
 
     @coroutine
     def do_submit():
-        with transport_queue.request_transport(authinfo) as request:
-            transport = yield cancellable.with_interrupt(request)
-            raise Return(execmanager.submit_calculation(node, transport, calc_info, script_filename))
+        with job_manager.request_job_submission(authinfo, workdir, script_filename) as request:
+            job_id = yield cancellable.with_interrupt(request)
+        node.set_job_id(job_id)
+        raise Return(job_id)
 
     try:
         logger.info('submitting CalcJob<{}>'.format(node.pk))
@@ -232,7 +241,9 @@ def task_retrieve_job(node, transport_queue, retrieved_temporary_folder, cancell
     def do_retrieve():
         with transport_queue.request_transport(authinfo) as request:
             transport = yield cancellable.with_interrupt(request)
-            raise Return(execmanager.retrieve_calculation(node, transport, retrieved_temporary_folder))
+            async_transport = transport_queue.get_async_transport(authinfo)
+            yield async_transport.execute_steps(
+                execmanager.retrieve_calculation_steps(node, transport, retrieved_temporary_folder))
 
     try:
         logger.info('retrieving CalcJob<{}>'.format(node.pk))
@@ -250,17 +261,66 @@ def task_retrieve_job(node, transport_queue, retrieved_temporary_folder, cancell
 
 
 @coroutine
-def task_kill_job(node, transport_queue, cancellable):
+def task_parse_job(process, executor, retrieved_temporary_folder, cancellable):
+    """
+    Task that will parse the retrieved files of a job calculation in the given executor
+
+    The parser is run in the executor, such that the event loop can keep running other processes while it is busy. The
+    nodes of the event loop cannot be used in another thread, so the parser is constructed for the node loaded in the
+    database session of the executor thread, see `execmanager.run_parser_in_thread`. Its outputs are attached to the
+    process in the thread of the event loop, since that interacts with the process and its node.
+
+    :param process: the `CalcJob` process whose retrieved files to parse
+    :param executor: the executor in which to run the parser
+    :type executor: :class:`concurrent.futures.Executor`
+    :param retrieved_temporary_folder: temporary folder used in retrieving that can be used during parsing
+    :param cancellable: the cancelled flag that will be queried to determine whether the task was cancelled
+    :type cancellable: :class:`aiida.engine.utils.InterruptableFuture`
+    :raises: Return with the exit code of the parser if the task was successfully completed
+    """
+    from aiida.orm import load_node
+
+    node = process.node
+    parser_class = execmanager.get_parser_class(process, retrieved_temporary_folder)
+
+    if parser_class is None:
+        raise Return(ExitCode())
+
+    # The future of the executor resolves in one of its threads, so it is chained through the loop to a tornado future
+    parsed = Future()
+    parse_future = executor.submit(execmanager.run_parser_in_thread, parser_class, node.pk, retrieved_temporary_folder)
+    process.runner.loop.add_future(parse_future, lambda future: chain_future(future, parsed))
+
+    logger.info('parsing CalcJob<{}>'.format(node.pk))
+    exit_code, outputs, stored_outputs = yield cancellable.with_interrupt(parsed)
+    logger.info('parsing CalcJob<{}> successful'.format(node.pk))
+
+    # The outputs are registered on a parser for the node of the event loop, whose logger is used to report failures
+    parser = parser_class(node)
+
+    for link_label, output in outputs.items():
+        parser.out(link_label, output)
+
+    for link_label, pk in stored_outputs.items():
+        parser.out(link_label, load_node(pk))
+
+    raise Return(execmanager.attach_parser_outputs(process, parser, exit_code))
+
+
+@coroutine
+def task_kill_job(node, job_manager, cancellable):
     """
     Transport task that will attempt to kill a job calculation
 
-    The task will first request a transport from the queue. Once the transport is yielded, the relevant execmanager
-    function is called, wrapped in the exponential_backoff_retry coroutine, which, in case of a caught exception, will
-    retry after an interval that increases exponentially with the number of retries, for a maximum number of retries.
-    If all retries fail, the task will raise a TransportTaskException
+    The task will request the job to be killed from the job manager, which coalesces it with the other pending kill
+    requests for the same authinfo into a single scheduler call. The request is wrapped in the
+    exponential_backoff_retry coroutine, which, in case of a caught exception, will retry after an interval that
+    increases exponentially with the number of retries, for a maximum number of retries. If all retries fail, the task
+    will raise a TransportTaskException
 
     :param node: the node that represents the job calculation
-    :param transport_queue: the TransportQueue from which to request a Transport
+    :param job_manager: the job manager through which to kill the job
+    :type job_manager: :class:`aiida.engine.processes.calcjobs.manager.JobManager`
     :param cancellable: the cancelled flag that will be queried to determine whether the task was cancelled
     :type cancellable: :class:`aiida.engine.utils.InterruptableFuture`
     :raises: Return if the tasks was successfully completed
@@ -274,12 +334,13 @@ def task_kill_job(node, transport_queue, cancellable):
         raise Return(True)
 
     authinfo = node.computer.get_authinfo(node.user)
+    job_id = node.get_job_id()
 
     @coroutine
     def do_kill():
-        with transport_queue.request_transport(authinfo) as request:
-            transport = yield cancellable.with_interrupt(request)
-            raise Return(execmanager.kill_calculation(node, transport))
+        with job_manager.request_job_kill(authinfo, job_id) as request:
+            result = yield cancellable.with_interrupt(request)
+        raise Return(result)
 
     try:
         logger.info('killing CalcJob<{}>'.format(node.pk))
@@ -329,7 +390,8 @@ class Waiting(plumpy.Waiting):
                 raise Return(self.submit(calc_info, script_filename))
 
             elif command == SUBMIT_COMMAND:
-                yield self._launch_task(task_submit_job, node, transport_queue, *args)
+                _, script_filename = args
+                yield self._launch_task(task_submit_job, node, self.process.runner.job_manager, script_filename)
                 raise Return(self.update())
 
             elif self.data == UPDATE_COMMAND:
@@ -344,8 +406,30 @@ class Waiting(plumpy.Waiting):
                 # Create a temporary folder that has to be deleted by JobProcess.retrieved after successful parsing
                 temp_folder = tempfile.mkdtemp()
                 yield self._launch_task(task_retrieve_job, node, transport_queue, temp_folder)
+
+                if self.process.runner.parse_executor is not None:
+                    raise Return(self.parse_in_executor(temp_folder))
+
                 raise Return(self.parse(temp_folder))
 
+            elif command == PARSE_COMMAND:
+                temp_folder = args[0]
+
+                # The runner that loaded this state from a checkpoint need not have a parse executor
+                if self.process.runner.parse_executor is None:
+                    raise Return(self.parse(temp_folder))
+
+                try:
+                    exit_code = yield self._launch_task(
+                        task_parse_job, self.process, self.process.runner.parse_executor, temp_folder)
+                except plumpy.Interruption:
+                    raise
+                except Exception:
+                    # The process will except, so the temporary folder will not be cleaned up by `finalize_parse`
+                    self.process._remove_retrieved_temporary_folder(temp_folder)  # pylint: disable=protected-access
+                    raise
+                raise Return(self.parsed(temp_folder, exit_code))
+
             else:
                 raise RuntimeError('Unknown waiting command')
 
@@ -353,7 +437,7 @@ class Waiting(plumpy.Waiting):
             raise plumpy.PauseInterruption('Pausing after failed transport task: {}'.format(exception))
         except plumpy.KillInterruption:
             exc_info = sys.exc_info()
-            yield self._launch_task(task_kill_job, node, transport_queue)
+            yield self._launch_task(task_kill_job, node, self.process.runner.job_manager)
             self._killing.set_result(True)
             six.reraise(*exc_info)
         except Return:
@@ -409,6 +493,23 @@ class Waiting(plumpy.Waiting):
         """
         return self.create_state(ProcessState.RUNNING, self.process.parse, retrieved_temporary_folder)
 
+    def parse_in_executor(self, retrieved_temporary_folder):
+        """Return the `Waiting` state that will `parse` the `CalcJob` in the parse executor of the runner.
+
+        :param retrieved_temporary_folder: temporary folder used in retrieving that can be used during parsing.
+        """
+        return self.create_state(
+            ProcessState.WAITING, None, msg='Waiting for parsing', data=(PARSE_COMMAND, retrieved_temporary_folder))
+
+    def parsed(self, retrieved_temporary_folder, exit_code):
+        """Return the `Running` state that will finalize the `CalcJob` whose results were parsed in the executor.
+
+        :param retrieved_temporary_folder: temporary folder used in retrieving that is to be cleaned up.
+        :param exit_code: the exit code returned by the parser.
+        """
+        return self.create_state(ProcessState.RUNNING, self.process.finalize_parse, retrieved_temporary_folder,
+                                 exit_code.status, exit_code.message)
+
     def interrupt(self, reason):
         """Interrupt the `Waiting` state by calling interrupt on the transport task `InterruptableFuture`."""
         if self._task is not None:
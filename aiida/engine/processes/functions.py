@@ -12,11 +12,14 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import absolute_import
 
+import contextlib
 import functools
 import logging
 import signal
 import inspect
+import threading
 
+import six
 from six.moves import zip  # pylint: disable=unused-import
 from six import PY2
 
@@ -30,10 +33,90 @@ from aiida.manage.manager import get_manager  # pylint: disable=wrong-import-pos
 
 from .process import Process  # pylint: disable=wrong-import-position
 
-__all__ = ('calcfunction', 'workfunction', 'FunctionProcess')
+__all__ = ('calcfunction', 'workfunction', 'FunctionProcess', 'batched_provenance')
 
 LOGGER = logging.getLogger(__name__)
 
+# State of the `batched_provenance` block of each thread: `runners` holds the idle runners that are reused by process
+# functions while a block is active in that thread and is `None` otherwise
+_BATCHED = threading.local()
+
+
+@contextlib.contextmanager
+def batched_provenance():
+    """
+    Context manager to run many process functions with a minimal number of database round trips.
+
+    All provenance that is stored within the block, i.e. the nodes and links of the process functions that are called
+    and their outputs, is committed to the database in a single transaction when the block is exited. The node of each
+    process function is stored together with its unstored inputs and the input links with bulk insert statements, and
+    the updates of the attributes and extras of the stored nodes, such as the process state, are collected and only
+    written when the block is exited. The runners that are created to execute the process functions are reused for
+    subsequent calls instead of being created anew for each call. Example usage:
+
+    >>> with batched_provenance():
+    >>>     results = [add(Int(i), Int(i)) for i in range(10000)]
+
+    Note that the nodes still get a primary key as soon as they are stored, since it serves as the identifier of the
+    process, but they only become visible to other database connections once the block is exited. The nodes of the
+    process functions for which caching is enabled are still stored one by one, such that they can be stored from the
+    cache. If an exception is raised within the block, all provenance stored within the block is rolled back. Nested
+    blocks are merged into the outermost one. The block only applies to the process functions that are called in the
+    thread that opened it.
+    """
+    from aiida import orm
+
+    if _get_batched_runners() is not None:
+        yield
+        return
+
+    _BATCHED.runners = []
+
+    try:
+        with get_manager().get_backend().transaction():
+            with orm.Node.objects.deferred_writes():
+                yield
+    finally:
+        runners, _BATCHED.runners = _BATCHED.runners, None
+        for runner in runners:
+            runner.close()
+
+
+def _get_batched_runners():
+    """Return the idle runners of the `batched_provenance` block of the current thread.
+
+    :return: list of runners or `None` if no block is active in the current thread
+    """
+    return getattr(_BATCHED, 'runners', None)
+
+
+def _acquire_runner(manager):
+    """Return a runner to execute a process function in, reusing an idle one if in a `batched_provenance` block.
+
+    :param manager: the manager to create a new runner with
+    :return: the runner
+    :rtype: :class:`aiida.engine.runners.Runner`
+    """
+    runners = _get_batched_runners()
+
+    if runners:
+        return runners.pop()
+
+    return manager.create_runner(with_persistence=False)
+
+
+def _release_runner(runner):
+    """Release a runner that was acquired with `_acquire_runner`, closing it unless in a `batched_provenance` block.
+
+    :param runner: the runner to release
+    """
+    runners = _get_batched_runners()
+
+    if runners is not None:
+        runners.append(runner)
+    else:
+        runner.close()
+
 
 def calcfunction(function):
     """
@@ -125,7 +208,8 @@ def process_function(node_class):
 
             The function will have to create a new runner for the FunctionProcess instead of using the global runner,
             because otherwise if this process function were to call another one from within its scope, that would use
-            the same runner and it would be blocking the event loop from continuing.
+            the same runner and it would be blocking the event loop from continuing. Within a `batched_provenance` block
+            the runners of process functions that have terminated are reused.
 
             :param args: input arguments to construct the FunctionProcess
             :param kwargs: input keyword arguments to construct the FunctionProcess
@@ -133,7 +217,7 @@ def process_function(node_class):
             :rtype: (dict, int)
             """
             manager = get_manager()
-            runner = manager.create_runner(with_persistence=False)
+            runner = _acquire_runner(manager)
             inputs = process_class.create_inputs(*args, **kwargs)
 
             # Remove all the known inputs from the kwargs
@@ -171,7 +255,7 @@ def process_function(node_class):
                 # If the `original_handler` is set, that means the `kill_process` was bound, which needs to be reset
                 if original_handler:
                     signal.signal(signal.SIGINT, original_handler)
-                runner.close()
+                _release_runner(runner)
 
             store_provenance = inputs.get('metadata', {}).get('store_provenance', True)
             if not store_provenance:
@@ -389,6 +473,36 @@ class FunctionProcess(Process):
         super(FunctionProcess, self)._setup_db_record()
         self.node.store_source_info(self._func)
 
+    @override
+    def _store_db_record(self):
+        """Store the node of the process, together with the unstored nodes of its inputs.
+
+        Within a `batched_provenance` block the nodes and the input links are inserted with bulk insert statements,
+        unless caching is enabled for any of the nodes or the class of any of them overrides `store`, in which case the
+        nodes have to be stored one by one.
+        """
+        from aiida import orm
+        from aiida.manage.caching import get_use_cache
+
+        if _get_batched_runners() is None:
+            super(FunctionProcess, self)._store_db_record()
+            return
+
+        # The same node can be passed for multiple inputs, and nodes such as `Int` compare by value so use the uuid
+        nodes = {}
+        for entry in self.node.get_incoming().all():
+            if not entry.node.is_stored:
+                nodes.setdefault(entry.node.uuid, entry.node)
+        nodes = list(nodes.values()) + [self.node]
+
+        for node in nodes:
+            overrides_store = six.get_unbound_function(type(node).store) is not six.get_unbound_function(orm.Node.store)
+            if overrides_store or get_use_cache(type(node)):
+                super(FunctionProcess, self)._store_db_record()
+                return
+
+        orm.Node.objects.store_many(nodes)
+
     @override
     def run(self):
         """Run the process.
@@ -12,12 +12,151 @@
 from __future__ import division
 from __future__ import print_function
 from __future__ import absolute_import
-import tornado.gen
 
 import kiwipy
 import plumpy
 
-__all__ = ('CalculationFuture',)
+__all__ = ('CalculationFuture', 'CalculationWatcher')
+
+
+class CalculationWatcher(object):  # pylint: disable=useless-object-inheritance
+    """
+    Watch process nodes and call callbacks once they have reached a terminal state.
+
+    Termination is detected through the state change broadcasts of the processes if a communicator is available. As a
+    fallback, if a poll interval is given, the states of all watched process nodes are polled with a single query.
+    """
+
+    def __init__(self, loop=None, poll_interval=None, communicator=None):
+        """
+        Construct the watcher. If a None poll_interval is supplied polling will not be used. If a communicator is
+        supplied it will be used to listen for broadcast messages.
+
+        :param loop: An event loop, in which the callbacks are called. Can be None if no polling is used, in which case
+            the callbacks are called directly from the thread that receives the broadcast.
+        :param poll_interval: The polling interval. Can be None in which case no polling.
+        :param communicator: A communicator. Can be None in which case no broadcast listens.
+        """
+        assert not (poll_interval is None and communicator is None), 'Must poll or have a communicator to use'
+        assert not (poll_interval is not None and loop is None), 'Must have an event loop to poll'
+
+        self._loop = loop
+        self._poll_interval = poll_interval
+        self._communicator = communicator
+        self._callbacks = {}
+        self._subscriber = None
+        self._check_scheduled = False
+        self._poll_handle = None
+
+    def add_callback(self, pk, callback):
+        """
+        Add a callback to be called, with the pk as its sole argument, once the process node with the given pk has
+        terminated. If the node has already terminated, the callback will be called as soon as possible.
+
+        :param pk: the pk of the process node
+        :param callback: the function to be called upon termination
+        """
+        self._callbacks.setdefault(pk, []).append(callback)
+        self._subscribe()
+
+        # The node may have terminated before the subscription. If there is a loop, the check is deferred to its next
+        # iteration, such that the checks for all the callbacks added in the meantime are performed in a single query
+        if self._loop is None:
+            self._check()
+        elif not self._check_scheduled:
+            self._check_scheduled = True
+            self._loop.add_callback(self._check)
+
+    def remove_callback(self, pk, callback):
+        """
+        Remove a callback that was added for the process node with the given pk, if it has not been called yet.
+
+        :param pk: the pk of the process node
+        :param callback: the callback to remove
+        """
+        callbacks = self._callbacks.get(pk, [])
+
+        try:
+            callbacks.remove(callback)
+        except ValueError:
+            pass
+
+        if not callbacks:
+            self._callbacks.pop(pk, None)
+
+    def close(self):
+        """Stop watching by removing the broadcast subscriber and the pending poll, discarding any callbacks."""
+        self._callbacks = {}
+
+        if self._subscriber is not None:
+            self._communicator.remove_broadcast_subscriber(self._subscriber)
+            self._subscriber = None
+
+        if self._poll_handle is not None:
+            self._loop.remove_timeout(self._poll_handle)
+            self._poll_handle = None
+
+    def _subscribe(self):
+        """Add a single broadcast subscriber for the terminal state changes of all processes if not already done."""
+        from .process import ProcessState
+
+        if self._communicator is None or self._subscriber is not None:
+            return
+
+        self._subscriber = kiwipy.BroadcastFilter(self._on_broadcast)
+        for state in [ProcessState.FINISHED, ProcessState.KILLED, ProcessState.EXCEPTED]:
+            self._subscriber.add_subject_filter('state_changed.*.{}'.format(state.value))
+        self._communicator.add_broadcast_subscriber(self._subscriber)
+
+    def _on_broadcast(self, _communicator, _body, sender, _subject, _correlation_id):
+        """Notify the callbacks of the process that sent a terminal state change, if it is being watched."""
+        if sender not in self._callbacks:
+            return
+
+        if self._loop is None:
+            self._notify(sender)
+        else:
+            self._loop.add_callback(self._notify, sender)
+
+    def _notify(self, pk):
+        """Call and remove all callbacks of the process node with the given pk."""
+        for callback in self._callbacks.pop(pk, []):
+            if self._loop is None:
+                callback(pk)
+            else:
+                self._loop.add_callback(callback, pk)
+
+    def _check(self):
+        """Notify the callbacks of all watched process nodes that have terminated and schedule the next poll."""
+        self._check_scheduled = False
+
+        if self._callbacks:
+            for pk in self._get_terminated(list(self._callbacks)):
+                self._notify(pk)
+
+        if self._poll_interval is not None and self._callbacks and self._poll_handle is None:
+            self._poll_handle = self._loop.call_later(self._poll_interval, self._poll)
+
+    def _poll(self):
+        """Check all watched process nodes after the poll interval has expired."""
+        self._poll_handle = None
+        self._check()
+
+    @staticmethod
+    def _get_terminated(pks):
+        """Return the pks of the process nodes, among those with the given pks, that have reached a terminal state.
+
+        :param pks: list of process node pks
+        :return: set of pks of the terminated process nodes
+        """
+        from aiida.orm import ProcessNode, QueryBuilder
+        from .process import ProcessState
+
+        states = [state.value for state in [ProcessState.FINISHED, ProcessState.KILLED, ProcessState.EXCEPTED]]
+        filters = {'id': {'in': pks}, 'attributes.{}'.format(ProcessNode.PROCESS_STATE_KEY): {'in': states}}
+        builder = QueryBuilder().append(ProcessNode, filters=filters, project=['id'])
+
+        return {pk for pk, in builder.iterall()}
 
 
 class CalculationFuture(plumpy.Future):
@@ -25,9 +164,9 @@ class CalculationFuture(plumpy.Future):
     A future that waits for a calculation to complete using both polling and
     listening for broadcast events if possible
     """
-    _filtered = None
+    _watcher = None
 
-    def __init__(self, pk, loop=None, poll_interval=None, communicator=None):
+    def __init__(self, pk, loop=None, poll_interval=None, communicator=None, watcher=None):
         """
         Get a future for a calculation node being finished.  If a None poll_interval is
         supplied polling will not be used.  If a communicator is supplied it will be used
@@ -37,44 +176,29 @@ class CalculationFuture(plumpy.Future):
         :param loop: An event loop
         :param poll_interval: The polling interval.  Can be None in which case no polling.
         :param communicator: A communicator.   Can be None in which case no broadcast listens.
+        :param watcher: An optional watcher shared with other futures, in which case the loop, poll interval and
+            communicator are ignored
+        :type watcher: :class:`aiida.engine.processes.futures.CalculationWatcher`
         """
-        from aiida.orm import load_node
-        from .process import ProcessState
-
         super(CalculationFuture, self).__init__()
-        assert not (poll_interval is None and communicator is None), 'Must poll or have a communicator to use'
 
-        calc_node = load_node(pk=pk)
-
-        if calc_node.is_terminated:
-            self.set_result(calc_node)
-        else:
-            self._communicator = communicator
-            self.add_done_callback(lambda _: self.cleanup())
-
-            # Try setting up a filtered broadcast subscriber
-            if self._communicator is not None:
-                self._filtered = kiwipy.BroadcastFilter(lambda *args, **kwargs: self.set_result(calc_node), sender=pk)
-                for state in [ProcessState.FINISHED, ProcessState.KILLED, ProcessState.EXCEPTED]:
-                    self._filtered.add_subject_filter('state_changed.*.{}'.format(state.value))
-                self._communicator.add_broadcast_subscriber(self._filtered)
-
-            # Start polling
-            if poll_interval is not None:
-                loop.add_callback(self._poll_calculation, calc_node, poll_interval)
+        self._pk = pk
+        self._owns_watcher = watcher is None
+        self._watcher = CalculationWatcher(loop, poll_interval, communicator) if watcher is None else watcher
+        self.add_done_callback(lambda _: self.cleanup())
+        self._watcher.add_callback(pk, self._on_terminated)
 
     def cleanup(self):
-        """Clean up the future by removing broadcast subscribers from the communicator if it still exists."""
-        if self._communicator is not None:
-            self._communicator.remove_broadcast_subscriber(self._filtered)
-            self._filtered = None
-            self._communicator = None
-
-    @tornado.gen.coroutine
-    def _poll_calculation(self, calc_node, poll_interval):
-        """Poll whether the calculation node has reached a terminal state."""
-        while not self.done() and not calc_node.is_terminated:
-            yield tornado.gen.sleep(poll_interval)
+        """Clean up the future by removing its callback from the watcher, closing the watcher if it owns it."""
+        if self._watcher is not None:
+            self._watcher.remove_callback(self._pk, self._on_terminated)
+            if self._owns_watcher:
+                self._watcher.close()
+            self._watcher = None
+
+    def _on_terminated(self, pk):
+        """Set the loaded calculation node as the result of the future."""
+        from aiida.orm import load_node
 
         if not self.done():
-            self.set_result(calc_node)
+            self.set_result(load_node(pk=pk))
@@ -16,6 +16,7 @@ import abc
 import collections
 import enum
 import inspect
+import sys
 import uuid
 import traceback
 
@@ -53,6 +54,9 @@ class Process(plumpy.Process):
 
     _node_class = orm.ProcessNode
     _spec_class = ProcessSpec
+    _transition_transaction = None
+    _linked_output_labels = None
+    _has_unlinked_outputs = True
 
     SINGLE_OUTPUT_LINKNAME = 'result'
 
@@ -244,6 +248,7 @@ class Process(plumpy.Process):
             self._pid = self._create_and_setup_db_record()
 
         self.node.logger.info('Loaded process<{}> from saved state'.format(self.node.pk))
+        self._update_slot_scheduler()
 
     def kill(self, msg=None):
         """
@@ -322,10 +327,59 @@ class Process(plumpy.Process):
                 self._parent_pid = current.pid
         self._pid = self._create_and_setup_db_record()
 
+    @override
+    def transition_to(self, new_state, *args, **kwargs):
+        """Transition to the new state, where the database writes of the transition are committed in one transaction.
+
+        The transaction is opened when the new state is being entered and committed in `on_entered`, before the state
+        change is broadcast, such that listeners that react to the broadcast find the node in its updated state. If
+        the transition fails, the writes that were made as part of it are rolled back. The transaction is only opened if
+        the `engine.coalesce_transition_writes` option is enabled, which it is not by default.
+        """
+        try:
+            super(Process, self).transition_to(new_state, *args, **kwargs)
+        except BaseException:
+            self._close_transition_transaction(sys.exc_info())
+            raise
+        else:
+            self._close_transition_transaction()
+
+    def _open_transition_transaction(self):
+        """Open the transaction for the database writes of the current state transition, if it is not open already.
+
+        Whether writes are coalesced is controlled through the `engine.coalesce_transition_writes` option.
+        """
+        from aiida.manage.configuration import get_config_option
+        from aiida.manage.manager import get_manager
+
+        if self._transition_transaction is not None or not get_config_option('engine.coalesce_transition_writes'):
+            return
+
+        transaction = get_manager().get_backend().transaction()
+        transaction.__enter__()  # pylint: disable=no-member
+        self._transition_transaction = transaction
+
+    def _close_transition_transaction(self, exc_info=None):
+        """Close the transaction of the current state transition if it is open.
+
+        :param exc_info: optional exception info tuple of the exception that made the transition fail, in which case the
+            transaction is rolled back instead of committed
+        """
+        transaction, self._transition_transaction = self._transition_transaction, None
+
+        if transaction is None:
+            return
+
+        if exc_info is None:
+            transaction.__exit__(None, None, None)
+        else:
+            transaction.__exit__(*exc_info)
+
     @override
     def on_entering(self, state):
+        # All node mutations up to and including `on_entered` are committed in a single transaction
+        self._open_transition_transaction()
         super(Process, self).on_entering(state)
-        # Update the node attributes every time we enter a new state
 
     def on_entered(self, from_state):
         # pylint: disable=cyclic-import
@@ -334,17 +388,27 @@ class Process(plumpy.Process):
         self._save_checkpoint()
         # Update the latest process state change timestamp
         set_process_state_change_timestamp(self)
+        # Commit before the state change is broadcast by the base class, because listeners will load the node
+        self._close_transition_transaction()
+        self._update_slot_scheduler()
         super(Process, self).on_entered(from_state)
 
+    def _update_slot_scheduler(self):
+        """Register the current state of this process with the slot scheduler of the runner, if it has one."""
+        slot_scheduler = self.runner.slot_scheduler
+
+        if slot_scheduler is not None:
+            slot_scheduler.update_process(self.pid, self._state.LABEL)
+
     @override
     def on_terminated(self):
         """Called when a Process enters a terminal state."""
         super(Process, self).on_terminated()
         if self._enable_persistence:
             try:
-                self.runner.persister.delete_checkpoint(self.pid)
+                self.runner.persister.delete_process_checkpoints(self.pid)
             except BaseException:
-                self.logger.exception('Failed to delete checkpoint')
+                self.logger.exception('Failed to delete checkpoints')
 
         try:
             self.node.seal()
@@ -421,6 +485,7 @@ class Process(plumpy.Process):
         :param value: The value emitted
         """
         super(Process, self).on_output_emitting(output_port, value)
+        self._has_unlinked_outputs = True
 
         # Note that `PortNamespaces` should be able to receive non `Data` types such as a normal dictionary
         if isinstance(output_port, OutputPort) and not isinstance(value, orm.Data):
@@ -521,7 +586,7 @@ class Process(plumpy.Process):
         self._setup_db_record()
         if self.metadata.store_provenance:
             try:
-                self.node.store_all()
+                self._store_db_record()
                 if self.node.is_finished_ok:
                     self._state = ProcessState.FINISHED
                     for entry in self.node.get_outgoing(link_type=LinkType.RETURN):
@@ -573,26 +638,59 @@ class Process(plumpy.Process):
     def update_outputs(self):
         """Attach new outputs to the node since the last call.
 
+        The link labels of the outputs that have already been attached are kept in memory, such that the outgoing links
+        of the node only have to be queried once, for example after the process has been reloaded from a checkpoint.
+        If no outputs have been emitted since the last call, nothing is done at all.
+
+        The unstored outputs are stored together with their links in a single bulk insert through
+        `Node.objects.store_many`, except for those whose class overrides `store`, which are stored one by one.
+
         Does nothing, if self.metadata.store_provenance is False.
         """
-        if self.metadata.store_provenance is False:
+        if self.metadata.store_provenance is False or not self._has_unlinked_outputs:
             return
 
-        outputs_flat = self._flat_outputs()
-        outputs_stored = self.node.get_outgoing(link_type=(LinkType.CREATE, LinkType.RETURN)).all_link_labels()
-        outputs_new = set(outputs_flat.keys()) - set(outputs_stored)
+        if self._linked_output_labels is None:
+            outgoing = self.node.get_outgoing(link_type=(LinkType.CREATE, LinkType.RETURN))
+            self._linked_output_labels = set(outgoing.all_link_labels())
+
+        if isinstance(self.node, orm.CalculationNode):
+            link_type = LinkType.CREATE
+        elif isinstance(self.node, orm.WorkflowNode):
+            link_type = LinkType.RETURN
+        else:
+            link_type = None
+
+        # The same node can be emitted under multiple labels, so the unstored outputs are collected by their uuid
+        unstored = collections.OrderedDict()
+        store = six.get_unbound_function(orm.Node.store)
+        link_labels = []
 
-        for link_label, output in outputs_flat.items():
+        for link_label, output in self._flat_outputs().items():
 
-            if link_label not in outputs_new:
+            if link_label in self._linked_output_labels:
                 continue
 
-            if isinstance(self.node, orm.CalculationNode):
-                output.add_incoming(self.node, LinkType.CREATE, link_label)
-            elif isinstance(self.node, orm.WorkflowNode):
-                output.add_incoming(self.node, LinkType.RETURN, link_label)
+            link_labels.append(link_label)
+
+            if link_type is not None:
+                output.add_incoming(self.node, link_type, link_label)
+
+            if not output.is_stored:
+                if six.get_unbound_function(type(output).store) is store:
+                    unstored[output.uuid] = output
+                else:
+                    output.store()
+
+        if unstored:
+            orm.Node.objects.store_many(list(unstored.values()))
+
+        self._linked_output_labels.update(link_labels)
+        self._has_unlinked_outputs = False
 
-            output.store()
+    def _store_db_record(self):
+        """Store the node of the process, together with the unstored nodes of its inputs."""
+        self.node.store_all()
 
     def _setup_db_record(self):
         """
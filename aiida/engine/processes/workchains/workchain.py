@@ -23,8 +23,7 @@ from plumpy.workchains import if_, while_, return_, _PropagateReturn
 from aiida.common import exceptions
 from aiida.common.extendeddicts import AttributeDict
 from aiida.common.lang import override
-from aiida.orm import Node, WorkChainNode
-from aiida.orm.utils import load_node
+from aiida.orm import Node, QueryBuilder, WorkChainNode
 
 from ..exit_code import ExitCode
 from ..process_spec import ProcessSpec
@@ -46,6 +45,7 @@ class WorkChain(Process):
     _spec_class = WorkChainSpec
     _STEPPER_STATE = 'stepper_state'
     _CONTEXT = 'CONTEXT'
+    _PROCESS_STATUS_MAX_PKS = 5
 
     def __init__(self, inputs=None, logger=None, runner=None, enable_persistence=True):
         """Construct a WorkChain instance.
@@ -72,6 +72,7 @@ class WorkChain(Process):
 
         self._stepper = None
         self._awaitables = []
+        self._finished_awaitable_pks = set()
         self._context = AttributeDict()
 
     @property
@@ -114,6 +115,7 @@ class WorkChain(Process):
 
         self.set_logger(self.node.logger)
 
+        self._finished_awaitable_pks = set()
         if self._awaitables:
             self.action_awaitables()
 
@@ -152,9 +154,15 @@ class WorkChain(Process):
             self.insert_awaitable(awaitable)
 
     def _update_process_status(self):
-        """Set the process status with a message accounting the current sub processes that we are waiting for."""
+        """Set the process status with a message accounting the current sub processes that we are waiting for.
+
+        To keep the status short for work chains with many sub processes, it only lists the pks of the first few.
+        """
         if self._awaitables:
-            status = 'Waiting for child processes: {}'.format(', '.join([str(_.pk) for _ in self._awaitables]))
+            pks = [str(awaitable.pk) for awaitable in self._awaitables[:self._PROCESS_STATUS_MAX_PKS]]
+            if len(self._awaitables) > self._PROCESS_STATUS_MAX_PKS:
+                pks.append('...')
+            status = 'Waiting for {} child processes: {}'.format(len(self._awaitables), ', '.join(pks))
             self.node.set_process_status(status)
         else:
             self.node.set_process_status(None)
@@ -246,12 +254,30 @@ class WorkChain(Process):
         """
         for awaitable in self._awaitables:
             if awaitable.target == AwaitableTarget.PROCESS:
-                callback = functools.partial(self._run_task, self.on_process_finished, awaitable)
-                self.runner.call_on_calculation_finish(awaitable.pk, callback)
+                self.runner.call_on_calculation_finish(awaitable.pk, self._on_awaitable_finished)
             else:
                 assert "invalid awaitable target '{}'".format(awaitable.target)
 
-    def on_process_finished(self, awaitable, pk):
+    def _on_awaitable_finished(self, pk):
+        """Callback function called by the runner when the process instance identified by pk is completed.
+
+        The pk is recorded and the awaitables of all processes that have completed by the time the work chain gets to
+        handle them are resolved together, such that their nodes can be loaded in bulk.
+
+        :param pk: the pk of the awaitable's target
+        :type pk: int
+        """
+        if not self._finished_awaitable_pks:
+            self.call_soon(self._resolve_finished_awaitables)
+
+        self._finished_awaitable_pks.add(pk)
+
+    def _resolve_finished_awaitables(self):
+        """Resolve the awaitables of all processes whose completion has been recorded since the last call."""
+        pks, self._finished_awaitable_pks = self._finished_awaitable_pks, set()
+        self._resolve_awaitables([awaitable for awaitable in self._awaitables if awaitable.pk in pks])
+
+    def on_process_finished(self, awaitable, pk):  # pylint: disable=unused-argument
         """Callback function called by the runner when the process instance identified by pk is completed.
 
         The awaitable will be effectuated on the context of the work chain and removed from the internal list. If all
@@ -261,23 +287,53 @@ class WorkChain(Process):
         :param pk: the pk of the awaitable's target
         :type pk: int
         """
-        try:
-            node = load_node(pk)
-        except (exceptions.MultipleObjectsError, exceptions.NotExistent):
+        self._resolve_awaitables([awaitable])
+
+    def _resolve_awaitables(self, awaitables):
+        """Effectuate the given awaitables, whose targets have completed, on the context and remove them.
+
+        The target nodes, and the outputs of those targets for which they are requested, are each loaded with a single
+        query. If all awaitables have been dealt with, the work chain process is resumed.
+
+        :param awaitables: list of Awaitable instances
+        """
+        if not awaitables:
+            return
+
+        pks = {awaitable.pk for awaitable in awaitables}
+        builder = QueryBuilder().append(Node, filters={'id': {'in': list(pks)}})
+        nodes = {node.pk: node for node, in builder.iterall()}
+
+        for pk in pks.difference(nodes):
             raise ValueError('provided pk<{}> could not be resolved to a valid Node instance'.format(pk))
 
-        if awaitable.outputs:
-            value = {entry.link_label: entry.node for entry in node.get_outgoing()}
-        else:
-            value = node
+        outputs = {}
+        output_pks = list({awaitable.pk for awaitable in awaitables if awaitable.outputs})
 
-        if awaitable.action == AwaitableAction.ASSIGN:
-            self.ctx[awaitable.key] = value
-        elif awaitable.action == AwaitableAction.APPEND:
-            self.ctx.setdefault(awaitable.key, []).append(value)
-        else:
-            assert "invalid awaitable action '{}'".format(awaitable.action)
+        if output_pks:
+            builder = QueryBuilder()
+            builder.append(Node, filters={'id': {'in': output_pks}}, project=['id'], tag='process')
+            builder.append(Node, with_incoming='process', project=['*'], edge_project=['label'], tag='output',
+                           edge_tag='link')
+            for entry in builder.iterdict():
+                outputs.setdefault(entry['process']['id'], {})[entry['link']['label']] = entry['output']['*']
+
+        for awaitable in awaitables:
+            if awaitable.outputs:
+                value = outputs.get(awaitable.pk, {})
+            else:
+                value = nodes[awaitable.pk]
+
+            if awaitable.action == AwaitableAction.ASSIGN:
+                self.ctx[awaitable.key] = value
+            elif awaitable.action == AwaitableAction.APPEND:
+                self.ctx.setdefault(awaitable.key, []).append(value)
+            else:
+                assert "invalid awaitable action '{}'".format(awaitable.action)
+
+        resolved = {id(awaitable) for awaitable in awaitables}
+        self._awaitables = [awaitable for awaitable in self._awaitables if id(awaitable) not in resolved]
+        self._update_process_status()
 
-        self.remove_awaitable(awaitable)
         if self.state == ProcessState.WAITING and not self._awaitables:
             self.resume()
@@ -14,6 +14,7 @@ from __future__ import print_function
 from __future__ import absolute_import
 
 import collections
+import concurrent.futures
 import logging
 import signal
 import tornado.ioloop
@@ -21,7 +22,6 @@ import tornado.ioloop
 import plumpy
 
 from aiida.common import exceptions
-from aiida.orm import load_node
 from .processes import futures
 from .processes.calcjobs import manager
 from .utils import instantiate_process
@@ -44,7 +44,17 @@ class Runner(object):  # pylint: disable=useless-object-inheritance
     _controller = None
     _closed = False
 
-    def __init__(self, poll_interval=0, loop=None, communicator=None, rmq_submit=False, persister=None):
+    def __init__(self,
+                 poll_interval=0,
+                 loop=None,
+                 communicator=None,
+                 rmq_submit=False,
+                 persister=None,
+                 transport_idle_timeout=0,
+                 transport_keepalive_interval=0,
+                 job_manager_shared_directory=None,
+                 parse_pool_size=0,
+                 slot_scheduler=None):
         """
         Construct a new runner
 
@@ -56,6 +66,15 @@ class Runner(object):  # pylint: disable=useless-object-inheritance
         :param rmq_submit: if True, processes will be submitted to RabbitMQ, otherwise they will be scheduled here
         :param persister: the persister to use to persist processes
         :type persister: :class:`plumpy.Persister`
+        :param transport_idle_timeout: time in seconds to keep unused transports open, zero disables pooling
+        :param transport_keepalive_interval: interval in seconds between keepalive packets sent over open transports
+        :param job_manager_shared_directory: optional directory through which the job manager shares scheduler polls
+            with the runners of other processes
+        :param parse_pool_size: number of threads in which calculation jobs are parsed outside of the event loop, zero
+            disables the pool and parses calculation jobs in the event loop itself
+        :param slot_scheduler: optional scheduler that adapts the number of tasks taken from the task queue to the
+            states of the processes run by this runner
+        :type slot_scheduler: :class:`aiida.manage.external.rmq.ProcessSlotScheduler`
         """
         assert not (rmq_submit and persister is None), \
             'Must supply a persister if you want to submit using communicator'
@@ -63,9 +82,15 @@ class Runner(object):  # pylint: disable=useless-object-inheritance
         self._loop = loop if loop is not None else tornado.ioloop.IOLoop()
         self._poll_interval = poll_interval
         self._rmq_submit = rmq_submit
-        self._transport = transports.TransportQueue(self._loop)
-        self._job_manager = manager.JobManager(self._transport)
+        self._transport = transports.TransportQueue(
+            self._loop, idle_timeout=transport_idle_timeout, keepalive_interval=transport_keepalive_interval)
+        self._job_manager = manager.JobManager(self._transport, shared_directory=job_manager_shared_directory)
         self._persister = persister
+        self._parse_executor = None
+        self._slot_scheduler = slot_scheduler
+
+        if parse_pool_size > 0:
+            self._parse_executor = concurrent.futures.ThreadPoolExecutor(max_workers=parse_pool_size)
 
         if communicator is not None:
             self._communicator = communicator
@@ -74,6 +99,8 @@ class Runner(object):  # pylint: disable=useless-object-inheritance
             LOGGER.warning('Disabling RabbitMQ submission, no communicator provided')
             self._rmq_submit = False
 
+        self._calculation_watcher = futures.CalculationWatcher(self._loop, self._poll_interval, self._communicator)
+
     def __enter__(self):
         return self
 
@@ -112,6 +139,26 @@ class Runner(object):  # pylint: disable=useless-object-inheritance
     def job_manager(self):
         return self._job_manager
 
+    @property
+    def parse_executor(self):
+        """
+        Get the executor in which calculation jobs are parsed, or `None` if they are parsed in the event loop
+
+        :return: the parse executor
+        :rtype: :class:`concurrent.futures.Executor`
+        """
+        return self._parse_executor
+
+    @property
+    def slot_scheduler(self):
+        """
+        Get the scheduler that adapts the number of tasks taken from the task queue, if any
+
+        :return: the slot scheduler or None
+        :rtype: :class:`aiida.manage.external.rmq.ProcessSlotScheduler`
+        """
+        return self._slot_scheduler
+
     @property
     def controller(self):
         return self._controller
@@ -145,6 +192,12 @@ class Runner(object):  # pylint: disable=useless-object-inheritance
         """Close the runner by stopping the loop."""
         assert not self._closed
         self.stop()
+        self._transport.close()
+        self._calculation_watcher.close()
+        if self._parse_executor is not None:
+            self._parse_executor.shutdown(wait=False)
+        # The callbacks that write held back state change timestamps will not be called once the loop is stopped
+        utils.write_pending_process_state_change_timestamps()
         self._closed = True
 
     def submit(self, process, *args, **inputs):
@@ -263,8 +316,7 @@ class Runner(object):  # pylint: disable=useless-object-inheritance
         :param pk: the pk of the calculation
         :param callback: the function to be called upon calculation termination
         """
-        calculation = load_node(pk=pk)
-        self._poll_calculation(calculation, callback)
+        self._calculation_watcher.add_callback(pk, callback)
 
     def get_calculation_future(self, pk):
         """
@@ -273,10 +325,4 @@ class Runner(object):  # pylint: disable=useless-object-inheritance
 
         :return: A future representing the completion of the calculation node
         """
-        return futures.CalculationFuture(pk, self._loop, self._poll_interval, self._communicator)
-
-    def _poll_calculation(self, calc_node, callback):
-        if calc_node.is_terminated:
-            self._loop.add_callback(callback, calc_node.pk)
-        else:
-            self._loop.call_later(self._poll_interval, self._poll_calculation, calc_node, callback)
+        return futures.CalculationFuture(pk, watcher=self._calculation_watcher)
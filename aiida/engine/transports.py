@@ -13,8 +13,12 @@ from __future__ import print_function
 from __future__ import absolute_import
 from collections import namedtuple
 import contextlib
+import functools
 import logging
+import sys
 import traceback
+
+from concurrent.futures import ThreadPoolExecutor
 from tornado import concurrent, gen, ioloop
 
 _LOGGER = logging.getLogger(__name__)
@@ -30,6 +34,131 @@ class TransportRequest(object):
         self.count = 0
 
 
+class AsyncTransport(object):  # pylint: disable=useless-object-inheritance
+    """
+    Wrapper of an open transport that executes its blocking operations in a dedicated thread.
+
+    Every method of the transport is available as a variant that returns a future, which resolves in the event loop
+    once the operation has completed in the thread::
+
+        @tornado.gen.coroutine
+        def transport_task(async_transport):
+            files = yield async_transport.listdir('.')
+
+    All operations are executed one after the other in the same thread, because transports are not thread safe, so all
+    clients of a transport provided by the queue should only use it through this wrapper. Since the operations of
+    different clients of the same transport interleave, also within `execute_steps`, an operation should not depend on
+    state of the transport that is left behind by a previous one, such as its current working directory: it should
+    either use absolute paths, or change the working directory and use it within a single call of `run`.
+    """
+
+    def __init__(self, transport, loop):
+        """
+        :param transport: the open transport
+        :type transport: :class:`aiida.transports.Transport`
+        :param loop: the event loop in which the futures are resolved
+        :type loop: :class:`tornado.ioloop.IOLoop`
+        """
+        self._transport = transport
+        self._loop = loop
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._pending = 0
+        self._idle_callbacks = []
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+
+        attribute = getattr(self._transport, name)
+
+        if not callable(attribute):
+            return attribute
+
+        @functools.wraps(attribute)
+        def method(*args, **kwargs):
+            return self.run(attribute, *args, **kwargs)
+
+        return method
+
+    @property
+    def transport(self):
+        """Return the wrapped transport."""
+        return self._transport
+
+    @property
+    def is_busy(self):
+        """Return whether operations are currently being executed or waiting to be executed in the thread.
+
+        :rtype: bool
+        """
+        return self._pending > 0
+
+    def run(self, function, *args, **kwargs):
+        """Call the function with the given arguments in the thread of the transport.
+
+        :return: future that resolves to the return value of the function
+        :rtype: :class:`tornado.concurrent.Future`
+        """
+        future = concurrent.Future()
+
+        def done(executor_future):
+            """Copy the outcome to the tornado future and notify the idle callbacks, all in the event loop."""
+            self._pending -= 1
+            concurrent.chain_future(executor_future, future)
+
+            if not self.is_busy:
+                callbacks, self._idle_callbacks = self._idle_callbacks, []
+                for callback in callbacks:
+                    callback()
+
+        self._pending += 1
+        self._loop.add_future(self._executor.submit(function, *args, **kwargs), done)
+
+        return future
+
+    @gen.coroutine
+    def execute_steps(self, steps):
+        """Execute the transport operations yielded by a generator of transport steps in the thread of the transport.
+
+        This is the asynchronous counterpart of :py:func:`aiida.engine.daemon.execmanager.execute_transport_steps`: the
+        generator itself runs in the event loop, while each callable that it yields is called in the thread.
+
+        :param steps: generator as returned for example by `execmanager.upload_calculation_steps`
+        """
+        result = None
+        exc_info = None
+
+        while True:
+            try:
+                if exc_info is not None:
+                    step = steps.throw(*exc_info)
+                else:
+                    step = steps.send(result)
+            except StopIteration:
+                return
+
+            try:
+                result = yield self.run(step)
+                exc_info = None
+            except Exception:  # pylint: disable=broad-except
+                result = None
+                exc_info = sys.exc_info()
+
+    def call_when_idle(self, callback):
+        """Call the callback once no more operations are pending, straight away if that is already the case.
+
+        :param callback: function without arguments
+        """
+        if self.is_busy:
+            self._idle_callbacks.append(callback)
+        else:
+            callback()
+
+    def close(self):
+        """Stop the thread of the transport once the pending operations have completed, the transport is not closed."""
+        self._executor.shutdown(wait=False)
+
+
 class TransportQueue(object):  # pylint: disable=useless-object-inheritance
     """
     A queue to get transport objects from authinfo.  This class allows clients
@@ -40,21 +169,158 @@ class TransportQueue(object):  # pylint: disable=useless-object-inheritance
     it will open the transport and give it to all the clients that asked for it
     up to that point.  This way opening of transports (a costly operation) can
     be minimised.
+
+    If an `idle_timeout` is specified, the queue operates in pooled mode: once no client wants a transport anymore, it
+    is not closed straight away but kept open for at most `idle_timeout` seconds. A client requesting a transport for
+    the same authinfo within that period receives the pooled transport immediately, without having to wait for the safe
+    open interval, provided that it is still alive. A transport whose connection was dropped is discarded and a new one
+    is opened in its place.
     """
     AuthInfoEntry = namedtuple('AuthInfoEntry', ['authinfo', 'transport', 'callbacks', 'callback_handle'])
+    PooledTransport = namedtuple('PooledTransport', ['transport', 'close_handle'])
 
-    def __init__(self, loop=None):
+    def __init__(self, loop=None, idle_timeout=0., keepalive_interval=0.):
         """
         :param loop: The event loop to use, will use `tornado.ioloop.IOLoop.current()` if not supplied
         :type loop: :class:`tornado.ioloop.IOLoop`
+        :param idle_timeout: time in seconds to keep an unused transport open, zero disables pooling
+        :type idle_timeout: float
+        :param keepalive_interval: interval in seconds between keepalive packets sent over opened transports, zero
+            disables them
+        :type keepalive_interval: float
         """
         self._loop = loop if loop is not None else ioloop.IOLoop.current()
+        self._idle_timeout = idle_timeout
+        self._keepalive_interval = keepalive_interval
         self._transport_requests = {}
+        self._transport_pool = {}
+        self._async_transports = {}
 
     def loop(self):
         """ Get the loop being used by this transport queue """
         return self._loop
 
+    @property
+    def is_pooling(self):
+        """Return whether transports are kept open after they are no longer requested.
+
+        :rtype: bool
+        """
+        return bool(self._idle_timeout)
+
+    def close(self):
+        """Close all transports that are currently kept open in the pool."""
+        for authinfo_id in list(self._transport_pool):
+            self._close_pooled_transport(authinfo_id)
+
+    def _close_pooled_transport(self, authinfo_id):
+        """Remove the pooled transport of the given authinfo from the pool and close it.
+
+        :param authinfo_id: the id of the authinfo of the pooled transport
+        """
+        pooled = self._transport_pool.pop(authinfo_id, None)
+
+        if pooled is None:
+            return
+
+        self._loop.remove_timeout(pooled.close_handle)
+        self._close_async_transport(authinfo_id, pooled.transport)
+
+        try:
+            if pooled.transport.is_open:
+                _LOGGER.debug('Transport queue closing pooled transport for authinfo<%d>', authinfo_id)
+                pooled.transport.close()
+        except Exception as exception:  # pylint: disable=broad-except
+            _LOGGER.warning('exception occurred while closing pooled transport:\n %s', exception)
+
+    def _get_pooled_transport(self, authinfo):
+        """Take the pooled transport for the given authinfo out of the pool if it is still alive.
+
+        :param authinfo: the authinfo of the transport
+        :return: the open transport or None if there is no usable pooled transport
+        """
+        pooled = self._transport_pool.get(authinfo.id, None)
+
+        if pooled is None:
+            return None
+
+        try:
+            alive = pooled.transport.is_alive()
+        except Exception:  # pylint: disable=broad-except
+            alive = False
+
+        if not alive:
+            _LOGGER.debug('Transport queue discarding dead pooled transport for %s', authinfo)
+            self._close_pooled_transport(authinfo.id)
+            return None
+
+        self._loop.remove_timeout(pooled.close_handle)
+        self._transport_pool.pop(authinfo.id)
+
+        return pooled.transport
+
+    def get_async_transport(self, authinfo):
+        """Return the asynchronous wrapper of the transport that is currently provided for the given authinfo.
+
+        This should only be called by a client that holds the transport, i.e. within the `request_transport` context
+        after the request has been yielded. All clients of the same transport share the same wrapper and thread.
+
+        :param authinfo: the authinfo of the transport
+        :return: the asynchronous wrapper of the open transport
+        :rtype: :class:`aiida.engine.transports.AsyncTransport`
+        """
+        transport_request = self._transport_requests.get(authinfo.id, None)
+
+        if transport_request is None or not transport_request.future.done():
+            raise RuntimeError('no transport is currently provided for {}'.format(authinfo))
+
+        transport = transport_request.future.result()
+        async_transport = self._async_transports.get(authinfo.id, None)
+
+        if async_transport is None or async_transport.transport is not transport:
+            if async_transport is not None:
+                async_transport.close()
+            async_transport = AsyncTransport(transport, self._loop)
+            self._async_transports[authinfo.id] = async_transport
+
+        return async_transport
+
+    def _close_async_transport(self, authinfo_id, transport):
+        """Stop the thread of the asynchronous wrapper of the given transport, if there is one.
+
+        :param authinfo_id: the id of the authinfo of the transport
+        :param transport: the transport whose wrapper to close
+        """
+        async_transport = self._async_transports.get(authinfo_id, None)
+
+        if async_transport is not None and async_transport.transport is transport:
+            self._async_transports.pop(authinfo_id).close()
+
+    def _release_transport(self, authinfo, transport):
+        """Release a transport that is no longer requested, either closing it or putting it in the pool.
+
+        If the transport is still in use in the thread of its asynchronous wrapper, for example by a task that was
+        interrupted, it is only released once those operations have completed.
+
+        :param authinfo: the authinfo of the transport
+        :param transport: the open transport
+        """
+        async_transport = self._async_transports.get(authinfo.id, None)
+
+        if async_transport is not None and async_transport.transport is transport and async_transport.is_busy:
+            async_transport.call_when_idle(functools.partial(self._release_transport, authinfo, transport))
+            return
+
+        if not self.is_pooling or authinfo.id in self._transport_pool:
+            _LOGGER.debug('Transport request closing transport for %s', authinfo)
+            self._close_async_transport(authinfo.id, transport)
+            transport.close()
+            return
+
+        _LOGGER.debug('Transport request returning transport for %s to the pool', authinfo)
+        close_handle = self._loop.call_later(self._idle_timeout, self._close_pooled_transport, authinfo.id)
+        self._transport_pool[authinfo.id] = self.PooledTransport(transport, close_handle)
+
     @contextlib.contextmanager
     def request_transport(self, authinfo):
         """
@@ -79,27 +345,34 @@ class TransportQueue(object):  # pylint: disable=useless-object-inheritance
             transport_request = TransportRequest()
             self._transport_requests[authinfo.id] = transport_request
 
-            transport = authinfo.get_transport()
-            safe_open_interval = transport.get_safe_open_interval()
+            pooled_transport = self._get_pooled_transport(authinfo)
+
+            if pooled_transport is not None:
+                transport_request.future.set_result(pooled_transport)
+            else:
+                transport = authinfo.get_transport()
+                safe_open_interval = transport.get_safe_open_interval()
 
-            def do_open():
-                """ Actually open the transport """
-                if transport_request.count > 0:
-                    # The user still wants the transport so open it
-                    _LOGGER.debug('Transport request opening transport for %s', authinfo)
-                    try:
-                        transport.open()
-                    except Exception as exception:  # pylint: disable=broad-except
-                        _LOGGER.error('exception occurred while trying to open transport:\n %s', exception)
-                        transport_request.future.set_exception(exception)
+                def do_open():
+                    """ Actually open the transport """
+                    if transport_request.count > 0:
+                        # The user still wants the transport so open it
+                        _LOGGER.debug('Transport request opening transport for %s', authinfo)
+                        try:
+                            transport.open()
+                            if self._keepalive_interval:
+                                transport.set_keepalive(self._keepalive_interval)
+                        except Exception as exception:  # pylint: disable=broad-except
+                            _LOGGER.error('exception occurred while trying to open transport:\n %s', exception)
+                            transport_request.future.set_exception(exception)
 
-                        # Cleanup of the stale TransportRequest with the excepted transport future
-                        self._transport_requests.pop(authinfo.id, None)
-                    else:
-                        transport_request.future.set_result(transport)
+                            # Cleanup of the stale TransportRequest with the excepted transport future
+                            self._transport_requests.pop(authinfo.id, None)
+                        else:
+                            transport_request.future.set_result(transport)
 
-            # Save the handle so that we can cancel the callback if the user no longer wants it
-            open_callback_handle = self._loop.call_later(safe_open_interval, do_open)
+                # Save the handle so that we can cancel the callback if the user no longer wants it
+                open_callback_handle = self._loop.call_later(safe_open_interval, do_open)
 
         try:
             transport_request.count += 1
@@ -116,8 +389,7 @@ class TransportQueue(object):  # pylint: disable=useless-object-inheritance
             # Check if there are no longer any users that want the transport
             if transport_request.count == 0:
                 if transport_request.future.done():
-                    _LOGGER.debug('Transport request closing transport for %s', authinfo)
-                    transport_request.future.result().close()
+                    self._release_transport(authinfo, transport_request.future.result())
                 elif open_callback_handle is not None:
                     self._loop.remove_timeout(open_callback_handle)
 
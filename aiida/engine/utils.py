@@ -13,6 +13,7 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import absolute_import
 
+import atexit
 import contextlib
 import logging
 
@@ -25,6 +26,10 @@ __all__ = ('interruptable_task', 'InterruptableFuture')
 LOGGER = logging.getLogger(__name__)
 PROCESS_STATE_CHANGE_KEY = 'process|state_change|{}'
 PROCESS_STATE_CHANGE_DESCRIPTION = 'The last time a process of type {}, changed state'
+PROCESS_STATE_CHANGE_INTERVAL = 5.  # Minimum time in seconds between two writes of the state change timestamp
+
+_PROCESS_STATE_CHANGE_WRITTEN = {}
+_PROCESS_STATE_CHANGE_PENDING = {}
 
 
 def instantiate_process(runner, process, *args, **inputs):
@@ -240,11 +245,16 @@ def set_process_state_change_timestamp(process):
     of the given process, to the current timestamp. The process type will be determined based on
     the class of the calculation node it has as its database container.
 
+    The setting is a single database row that is shared by all processes of all daemon workers, so to prevent it from
+    becoming a point of contention, each interpreter writes it at most once per `PROCESS_STATE_CHANGE_INTERVAL`
+    seconds. A state change within that interval is written once the interval has passed, through a callback that is
+    scheduled on the event loop of the runner of the process. Since that loop may no longer run by then, any timestamp
+    that is still held back is also written when a runner is closed or the interpreter exits, see
+    `write_pending_process_state_change_timestamps`.
+
     :param process: the Process instance that changed its state
     """
-    from aiida.backends.utils import get_settings_manager
     from aiida.common import timezone
-    from aiida.common.exceptions import UniquenessError
     from aiida.orm import ProcessNode, CalculationNode, WorkflowNode
 
     if isinstance(process.node, CalculationNode):
@@ -257,15 +267,65 @@ def set_process_state_change_timestamp(process):
     else:
         raise ValueError('unsupported calculation node type {}'.format(type(process.node)))
 
+    now = timezone.now()
+    last_written = _PROCESS_STATE_CHANGE_WRITTEN.get(process_type, None)
+
+    if last_written is not None:
+        remaining = PROCESS_STATE_CHANGE_INTERVAL - (now - last_written).total_seconds()
+        if remaining > 0:
+            if process_type not in _PROCESS_STATE_CHANGE_PENDING:
+                process.runner.loop.call_later(remaining, _write_pending_process_state_change_timestamp, process_type)
+            _PROCESS_STATE_CHANGE_PENDING[process_type] = now
+            return
+
+    _write_process_state_change_timestamp(process_type, now)
+
+
+def _write_pending_process_state_change_timestamp(process_type):
+    """
+    Write the state change timestamp for the given process type that was held back by the throttling of
+    `set_process_state_change_timestamp`, if there is one.
+
+    :param process_type: the process type, either 'calculation' or 'work'
+    """
+    timestamp = _PROCESS_STATE_CHANGE_PENDING.pop(process_type, None)
+
+    if timestamp is not None:
+        _write_process_state_change_timestamp(process_type, timestamp)
+
+
+@atexit.register
+def write_pending_process_state_change_timestamps():
+    """
+    Write all state change timestamps that were held back by the throttling of `set_process_state_change_timestamp`.
+    """
+    for process_type in list(_PROCESS_STATE_CHANGE_PENDING):
+        _write_pending_process_state_change_timestamp(process_type)
+
+
+def _write_process_state_change_timestamp(process_type, timestamp):
+    """
+    Write the global setting that reflects the last time a process of the given type changed state.
+
+    :param process_type: the process type, either 'calculation' or 'work'
+    :param timestamp: the timestamp of the state change
+    """
+    from aiida.backends.utils import get_settings_manager
+    from aiida.common import timezone
+    from aiida.common.exceptions import UniquenessError
+
     key = PROCESS_STATE_CHANGE_KEY.format(process_type)
     description = PROCESS_STATE_CHANGE_DESCRIPTION.format(process_type)
-    value = timezone.datetime_to_isoformat(timezone.now())
+    value = timezone.datetime_to_isoformat(timestamp)
+
+    _PROCESS_STATE_CHANGE_WRITTEN[process_type] = timezone.now()
+    _PROCESS_STATE_CHANGE_PENDING.pop(process_type, None)
 
     try:
         manager = get_settings_manager()
         manager.set(key, value, description)
     except UniquenessError as exception:
-        process.logger.debug('could not update the {} setting because of a UniquenessError: {}'.format(key, exception))
+        LOGGER.debug('could not update the {} setting because of a UniquenessError: {}'.format(key, exception))
 
 
 def get_process_state_change_timestamp(process_type=None):
@@ -94,6 +94,50 @@ CONFIG_OPTIONS = {
         'description': 'The polling interval in seconds to be used by process runners',
         'global_only': False,
     },
+    'transport.pool.idle_timeout': {
+        'key': 'transport_pool_idle_timeout',
+        'valid_type': 'int',
+        'valid_values': None,
+        'default': 0,
+        'description': 'Time in seconds an unused transport is kept open by the runner before being closed, '
+                       'zero disables pooling and closes transports as soon as they are no longer requested',
+        'global_only': False,
+    },
+    'transport.pool.keepalive_interval': {
+        'key': 'transport_pool_keepalive_interval',
+        'valid_type': 'int',
+        'valid_values': None,
+        'default': 0,
+        'description': 'Interval in seconds between keepalive packets sent over pooled transports, zero disables them',
+        'global_only': False,
+    },
+    'transport.upload.archive': {
+        'key': 'transport_upload_archive',
+        'valid_type': 'bool',
+        'valid_values': None,
+        'default': False,
+        'description': 'Boolean whether the input files of calculation jobs are uploaded as a single tar archive that is '
+                       'unpacked remotely, instead of one by one',
+        'global_only': False,
+    },
+    'transport.retrieve.archive': {
+        'key': 'transport_retrieve_archive',
+        'valid_type': 'bool',
+        'valid_values': None,
+        'default': False,
+        'description': 'Boolean whether the files of calculation jobs are retrieved as a single compressed archive that '
+                       'is created remotely, instead of one by one',
+        'global_only': False,
+    },
+    'transport.retrieve.archive_max_size': {
+        'key': 'transport_retrieve_archive_max_size',
+        'valid_type': 'int',
+        'valid_values': None,
+        'default': 0,
+        'description': 'Maximum size in MB of the retrieve archive, larger archives are discarded and the files are '
+                       'retrieved one by one instead, zero means no limit',
+        'global_only': False,
+    },
     'daemon.timeout': {
         'key': 'daemon_timeout',
         'valid_type': 'int',
@@ -102,6 +146,87 @@ CONFIG_OPTIONS = {
         'description': 'The timeout in seconds for calls to the circus client',
         'global_only': False,
     },
+    'daemon.shared_scheduler_poll': {
+        'key': 'daemon_shared_scheduler_poll',
+        'valid_type': 'bool',
+        'valid_values': None,
+        'default': False,
+        'description': 'Boolean whether daemon workers share scheduler poll results, such that the scheduler of each '
+                       'computer is polled by a single worker per minimum job poll interval',
+        'global_only': False,
+    },
+    'daemon.parse_pool_size': {
+        'key': 'daemon_parse_pool_size',
+        'valid_type': 'int',
+        'valid_values': None,
+        'default': 0,
+        'description': 'Number of threads per daemon worker in which calculation jobs are parsed outside of the event '
+                       'loop, zero parses them in the event loop itself',
+        'global_only': False,
+    },
+    'daemon.worker_process_slots': {
+        'key': 'daemon_worker_process_slots',
+        'valid_type': 'int',
+        'valid_values': None,
+        'default': 100,
+        'description': 'Maximum number of processes a daemon worker runs concurrently. If `daemon.adaptive_prefetch` '
+                       'is enabled, a waiting process only takes up a fraction of a slot',
+        'global_only': False,
+    },
+    'daemon.adaptive_prefetch': {
+        'key': 'daemon_adaptive_prefetch',
+        'valid_type': 'bool',
+        'valid_values': None,
+        'default': False,
+        'description': 'Boolean whether daemon workers adapt the number of processes they take on to their load, '
+                       'such that workers holding mostly waiting processes take on more of them',
+        'global_only': False,
+    },
+    'daemon.worker_waiting_per_slot': {
+        'key': 'daemon_worker_waiting_per_slot',
+        'valid_type': 'int',
+        'valid_values': None,
+        'default': 10,
+        'description': 'Number of waiting processes that take up a single daemon worker slot, only used if '
+                       '`daemon.adaptive_prefetch` is enabled',
+        'global_only': False,
+    },
+    'daemon.worker_max_prefetch': {
+        'key': 'daemon_worker_max_prefetch',
+        'valid_type': 'int',
+        'valid_values': None,
+        'default': 1000,
+        'description': 'Maximum number of processes a daemon worker holds in total, only used if '
+                       '`daemon.adaptive_prefetch` is enabled',
+        'global_only': False,
+    },
+    'engine.checkpoint_codec': {
+        'key': 'engine_checkpoint_codec',
+        'valid_type': 'string',
+        'valid_values': ['yaml', 'msgpack'],
+        'default': 'yaml',
+        'description': 'Format in which process checkpoints are written, `msgpack` requires the `msgpack` package. '
+                       'Existing checkpoints can always be read regardless of this setting',
+        'global_only': False,
+    },
+    'engine.coalesce_transition_writes': {
+        'key': 'engine_coalesce_transition_writes',
+        'valid_type': 'bool',
+        'valid_values': None,
+        'default': False,
+        'description': 'Boolean whether all database writes of a process state transition are committed in a single '
+                       'transaction, instead of each write being committed separately',
+        'global_only': False,
+    },
+    'querybuilder.plan_cache_size': {
+        'key': 'querybuilder_plan_cache_size',
+        'valid_type': 'int',
+        'valid_values': None,
+        'default': 0,
+        'description': 'Maximum number of built queries that are cached for reuse by query builders with the same '
+                       'queryhelp, including the filter values, zero disables the cache',
+        'global_only': False,
+    },
     'verdi.shell.auto_import': {
         'key': 'verdi_shell_auto_import',
         'valid_type': 'string',
@@ -30,6 +30,7 @@ CIRCUS_LOG_FILE_TEMPLATE = os.path.join(DAEMON_LOG_DIR, 'circus-{}.log')
 DAEMON_LOG_FILE_TEMPLATE = os.path.join(DAEMON_LOG_DIR, 'aiida-{}.log')
 CIRCUS_PORT_FILE_TEMPLATE = os.path.join(DAEMON_DIR, 'circus-{}.port')
 CIRCUS_SOCKET_FILE_TEMPATE = os.path.join(DAEMON_DIR, 'circus-{}.sockets')
+DAEMON_SCHEDULER_POLL_DIR_TEMPLATE = os.path.join(DAEMON_DIR, 'scheduler-poll-{}')
 CIRCUS_CONTROLLER_SOCKET_TEMPLATE = 'circus.c.sock'
 CIRCUS_PUBSUB_SOCKET_TEMPLATE = 'circus.p.sock'
 CIRCUS_STATS_SOCKET_TEMPLATE = 'circus.s.sock'
@@ -304,5 +305,6 @@ class Profile(object):  # pylint: disable=useless-object-inheritance,too-many-pu
             'daemon': {
                 'log': DAEMON_LOG_FILE_TEMPLATE.format(self.name),
                 'pid': DAEMON_PID_FILE_TEMPLATE.format(self.name),
+                'scheduler_poll': DAEMON_SCHEDULER_POLL_DIR_TEMPLATE.format(self.name),
             }
         }
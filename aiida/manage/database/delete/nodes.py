@@ -49,6 +49,7 @@ def delete_nodes(pks,
     from aiida.backends.utils import delete_nodes_and_connections
     from aiida.common import exceptions
     from aiida.common.links import LinkType
+    from aiida.manage.manager import get_manager
     from aiida.orm import User, Node, ProcessNode, Data, QueryBuilder, load_node
 
     user_email = User.objects.get_default().email
@@ -210,3 +211,9 @@ def delete_nodes(pks,
     # I can now delete the folders
     for repository in repositories:
         repository.erase(force=True)
+
+    # The checkpoints of deleted processes are stored in the file repository as well and can never be loaded again
+    persister = get_manager().get_persister()
+    for checkpoint in persister.get_checkpoints():
+        if checkpoint.pid in pks_set_to_delete:
+            persister.delete_checkpoint(checkpoint.pid, checkpoint.tag)
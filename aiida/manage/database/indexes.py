@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida_core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Manage expression indexes on the values of the attributes and extras of nodes.
+
+The query builder filters on the value of an attribute or extra through the JSONB value at its path, for example
+`attributes #> '{process_state}'`. Without an index on that expression, such a filter requires a scan of the whole node
+table. The indexes on the keys that AiiDA itself filters on, like the `_aiida_hash` extra or the `process_state`
+attribute, are created by the database migrations. Indexes on other keys can be created and dropped for the database of
+each profile with the functions of this module, or with `verdi database index`.
+
+A `btree` index serves the `==` and `in` filters on string, number and boolean values, a `gin` index serves the
+`contains` and `has_key` filters.
+"""
+from __future__ import division
+from __future__ import print_function
+from __future__ import absolute_import
+
+import collections
+import re
+
+from aiida.common import exceptions
+from aiida.common.hashing import make_hash
+
+__all__ = ('NodeIndex', 'get_indexes', 'create_index', 'drop_index')
+
+INDEX_FIELDS = ('attributes', 'extras')
+INDEX_TYPES = ('btree', 'gin')
+
+# Postgres truncates identifiers that are longer than this
+MAX_INDEX_NAME_LENGTH = 63
+
+# The indexes created by the database migrations, as tuples of the field and the path
+DEFAULT_INDEXES = (
+    ('extras', '_aiida_hash'),
+    ('attributes', 'process_state'),
+    ('attributes', 'exit_status'),
+    ('attributes', 'md5'),
+)
+
+NodeIndex = collections.namedtuple('NodeIndex', ['name', 'definition', 'default'])
+
+
+def get_index_name(field, path, index_type='btree'):
+    """Return the name of the index on the value at the given path of the attributes or extras.
+
+    :param field: either `attributes` or `extras`
+    :param path: the path of the value, with nested keys separated by periods
+    :param index_type: the type of the index, either `btree` or `gin`
+    :return: the name of the index
+    """
+    slug = re.sub(r'[^a-z0-9]+', '_', path.lower()).strip('_')
+    name = 'db_dbnode_{}_{}_{}'.format(field, slug, index_type)
+
+    if len(name) > MAX_INDEX_NAME_LENGTH:
+        suffix = '_{}_{}'.format(make_hash([field, path])[:8], index_type)
+        name = name[:MAX_INDEX_NAME_LENGTH - len(suffix)] + suffix
+
+    return name
+
+
+def get_index_expression(field, path):
+    """Return the expression of the value at the given path of the attributes or extras, as used by the query builder.
+
+    :param field: either `attributes` or `extras`
+    :param path: the path of the value, with nested keys separated by periods
+    :return: the expression
+    """
+    keys = ['"{}"'.format(key.replace('\\', '\\\\').replace('"', '\\"')) for key in path.split('.')]
+    array = '{{{}}}'.format(','.join(keys)).replace("'", "''")
+
+    return "({} #> '{}'::text[])".format(field, array)
+
+
+def get_indexes(backend=None):
+    """Return the expression indexes on the values of the attributes and extras of nodes that exist in the database.
+
+    :param backend: the backend to use, by default the backend of the current profile
+    :return: a list of `NodeIndex` tuples
+    """
+    backend = backend or _get_backend()
+    default_names = {get_index_name(field, path) for field, path in DEFAULT_INDEXES}
+
+    statement = """
+        SELECT indexname, indexdef FROM pg_indexes
+        WHERE tablename = 'db_dbnode' AND (indexname LIKE %(attributes)s OR indexname LIKE %(extras)s)
+        ORDER BY indexname;
+    """
+    parameters = {field: 'db_dbnode_{}_%'.format(field) for field in INDEX_FIELDS}
+
+    return [
+        NodeIndex(name, definition, name in default_names)
+        for name, definition in backend.execute_prepared_statement(statement, parameters)
+    ]
+
+
+def create_index(field, path, index_type='btree', backend=None):
+    """Create an index on the value at the given path of the attributes or extras of nodes.
+
+    .. note:: creating the index locks the node table for writing, which can take a while for large databases.
+
+    :param field: either `attributes` or `extras`
+    :param path: the path of the value, with nested keys separated by periods
+    :param index_type: the type of the index, either `btree` or `gin`
+    :param backend: the backend to use, by default the backend of the current profile
+    :return: the name of the created index
+    :raises ValueError: if the field, path or index type is invalid
+    :raises aiida.common.UniquenessError: if the index already exists
+    """
+    if field not in INDEX_FIELDS:
+        raise ValueError('invalid field `{}`, valid fields are: {}'.format(field, ', '.join(INDEX_FIELDS)))
+
+    if index_type not in INDEX_TYPES:
+        raise ValueError('invalid index type `{}`, valid types are: {}'.format(index_type, ', '.join(INDEX_TYPES)))
+
+    if not path or not all(path.split('.')):
+        raise ValueError('invalid path `{}`'.format(path))
+
+    backend = backend or _get_backend()
+    name = get_index_name(field, path, index_type)
+
+    if name in [index.name for index in get_indexes(backend)]:
+        raise exceptions.UniquenessError('the index `{}` already exists'.format(name))
+
+    _execute(backend, 'CREATE INDEX {} ON db_dbnode USING {} ({});'.format(name, index_type,
+                                                                         get_index_expression(field, path)))
+
+    return name
+
+
+def drop_index(name, backend=None):
+    """Drop an index on the value of the attributes or extras of nodes.
+
+    The indexes created by the database migrations cannot be dropped, since AiiDA relies on them.
+
+    :param name: the name of the index
+    :param backend: the backend to use, by default the backend of the current profile
+    :raises aiida.common.NotExistent: if the index does not exist
+    :raises aiida.common.ModificationNotAllowed: if the index is one of the indexes created by the migrations
+    """
+    backend = backend or _get_backend()
+    index = {index.name: index for index in get_indexes(backend)}.get(name)
+
+    if index is None:
+        raise exceptions.NotExistent('the index `{}` does not exist'.format(name))
+
+    if index.default:
+        raise exceptions.ModificationNotAllowed(
+            'the index `{}` is created by the database migrations and cannot be dropped'.format(name))
+
+    _execute(backend, 'DROP INDEX {};'.format(name))
+
+
+def _get_backend():
+    """Return the backend of the current profile."""
+    from aiida.manage.manager import get_manager
+    return get_manager().get_backend()
+
+
+def _execute(backend, statement):
+    """Execute and commit a statement that does not return any rows."""
+    with backend.cursor() as cursor:
+        cursor.execute(statement)
+        cursor.connection.commit()
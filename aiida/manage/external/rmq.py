@@ -14,12 +14,13 @@ from __future__ import print_function
 from __future__ import absolute_import
 import collections
 import logging
+import threading
 
-from tornado import gen
+from tornado import concurrent, gen
 import plumpy
 from kiwipy import communications, Future
 
-__all__ = ('RemoteException', 'CommunicationTimeout', 'DeliveryFailed', 'ProcessLauncher')
+__all__ = ('RemoteException', 'CommunicationTimeout', 'DeliveryFailed', 'ProcessLauncher', 'ProcessSlotScheduler')
 
 LOGGER = logging.getLogger(__name__)
 
@@ -101,6 +102,26 @@ def get_task_exchange_name(prefix):
     return '{}.{}'.format(prefix, _TASK_EXCHANGE)
 
 
+def get_task_prefetch_count(profile):
+    """
+    Return the maximum number of tasks a daemon worker of the given profile takes from the task queue
+
+    With `daemon.adaptive_prefetch` enabled, this is the most tasks a worker can ever hold, while the number it
+    actually takes on is limited to its free slots by the `ProcessSlotScheduler`.
+
+    :param profile: the profile
+    :returns: the task prefetch count
+    """
+    from aiida.manage.configuration import get_config
+
+    config = get_config()
+
+    if config.get_option('daemon.adaptive_prefetch', scope=profile.name):
+        return config.get_option('daemon.worker_max_prefetch', scope=profile.name)
+
+    return config.get_option('daemon.worker_process_slots', scope=profile.name)
+
+
 def _store_inputs(inputs):
     """
     Try to store the values in the input dictionary. For nested dictionaries, the values are stored by recursively.
@@ -178,3 +199,151 @@ class ProcessLauncher(plumpy.ProcessLauncher):
             raise
 
         raise gen.Return(serialized)
+
+
+class ProcessSlotScheduler(object):  # pylint: disable=useless-object-inheritance
+    """
+    Limit the number of tasks a daemon worker takes from the task queue to the load of the processes it holds.
+
+    Processes that are waiting, for example for a calculation job on a remote computer or for the children of a work
+    chain, are cheap compared to processes that are actively running. Therefore, a waiting process only takes up a
+    fraction ``1 / waiting_per_slot`` of a slot. The worker accepts a new task as long as it has a free slot, such that
+    a worker holding mostly waiting processes takes on more tasks, whereas a saturated worker takes on no new ones,
+    with at most ``max_prefetch`` tasks in total.
+
+    The task subscriber of the worker is registered through the scheduler with `subscribe`. A task that is delivered
+    while there is no free slot is rejected, which requeues it, and the subscriber is removed from the communicator,
+    which stops the consumption of the task queue such that the remaining tasks go to other workers. The subscriber is
+    added back as soon as a slot is freed. The prefetch count of the task queue of the communicator should therefore
+    be set to ``max_prefetch``, which is the most tasks the worker can hold at any time.
+    """
+
+    def __init__(self, communicator, slots, waiting_per_slot, max_prefetch):
+        """
+        Construct the scheduler
+
+        :param communicator: the communicator of the daemon worker
+        :type communicator: :class:`~kiwipy.rmq.communicator.RmqThreadCommunicator`
+        :param slots: the number of slots of the worker
+        :param waiting_per_slot: the number of waiting processes that take up a single slot
+        :param max_prefetch: the maximum number of tasks the worker holds in total
+        :raises ValueError: if any of the numbers is smaller than one
+        """
+        if min(slots, waiting_per_slot, max_prefetch) < 1:
+            raise ValueError('the number of slots, waiting processes per slot and maximum prefetch should be positive')
+
+        self._communicator = communicator
+        self._slots = slots
+        self._waiting_per_slot = waiting_per_slot
+        self._max_prefetch = max_prefetch
+        self._lock = threading.Lock()
+        self._processes = {}
+        self._num_waiting = 0
+        self._num_tasks = 0
+        self._subscriber = None
+        self._paused = False
+
+    @property
+    def num_tasks(self):
+        """Return the number of tasks held by the worker, which are acknowledged once their process terminates."""
+        return self._num_tasks
+
+    @property
+    def num_waiting(self):
+        """Return the number of processes held by the worker that are waiting."""
+        return min(self._num_waiting, self._num_tasks)
+
+    @property
+    def num_active(self):
+        """Return the number of processes held by the worker that are not waiting."""
+        return self._num_tasks - self.num_waiting
+
+    @property
+    def is_paused(self):
+        """Return whether the consumption of the task queue is currently paused because the worker is saturated."""
+        return self._paused
+
+    def get_capacity(self):
+        """
+        Return the number of tasks the worker can hold at its current load
+
+        :returns: the number of tasks held plus the number of free slots, capped by the maximum prefetch
+        """
+        load = self.num_active + self.num_waiting / self._waiting_per_slot
+        free = max(int(self._slots - load), 0)
+        return min(self._num_tasks + free, self._max_prefetch)
+
+    def subscribe(self, subscriber):
+        """
+        Add the task subscriber of the worker to the communicator, such that it only receives tasks for free slots
+
+        :param subscriber: the task subscriber
+        """
+        self._subscriber = subscriber
+        self._communicator.add_task_subscriber(self._on_task)
+
+    def update_process(self, pid, state):
+        """
+        Register the current state of a process held by the worker, forgetting it once it has reached a terminal state
+
+        :param pid: the pid of the process
+        :param state: the current state of the process
+        :type state: :class:`plumpy.ProcessState`
+        """
+        with self._lock:
+            if self._processes.pop(pid, False):
+                self._num_waiting -= 1
+
+            if state not in [plumpy.ProcessState.FINISHED, plumpy.ProcessState.EXCEPTED, plumpy.ProcessState.KILLED]:
+                waiting = state == plumpy.ProcessState.WAITING
+                self._processes[pid] = waiting
+                self._num_waiting += waiting
+
+        self._schedule_resume()
+
+    def _on_task(self, *args, **kwargs):
+        """Pass a task on to the subscriber if there is a free slot, otherwise reject it and pause the consumption."""
+        with self._lock:
+            if self._paused or self._num_tasks >= self.get_capacity():
+                self._pause()
+                raise communications.TaskRejected('the worker has no free slot')
+            self._num_tasks += 1
+
+        try:
+            result = self._subscriber(*args, **kwargs)
+        except Exception:
+            self._release()
+            raise
+
+        if concurrent.is_future(result):
+            # The future may be resolved on another thread, so the release is done on the communicator thread
+            result.add_done_callback(lambda _: self._communicator.loop().add_callback(self._release))
+        else:
+            self._release()
+
+        return result
+
+    def _release(self):
+        """Release the slot of a task that is done."""
+        with self._lock:
+            self._num_tasks -= 1
+
+        self._schedule_resume()
+
+    def _pause(self):
+        """Stop the consumption of the task queue, should be called on the communicator thread with the lock held."""
+        if not self._paused:
+            self._paused = True
+            self._communicator.remove_task_subscriber(self._on_task)
+
+    def _schedule_resume(self):
+        """Resume the consumption of the task queue on the communicator thread, if it is paused."""
+        if self._paused:
+            self._communicator.loop().add_callback(self._resume)
+
+    def _resume(self):
+        """Resume the consumption of the task queue if it is paused and a slot has been freed."""
+        with self._lock:
+            if self._paused and self._num_tasks < self.get_capacity():
+                self._paused = False
+                self._communicator.add_task_subscriber(self._on_task)
@@ -167,7 +167,7 @@ class Manager(object):  # pylint: disable=useless-object-inheritance
         profile = self.get_profile()
 
         if task_prefetch_count is None:
-            task_prefetch_count = rmq._RMQ_TASK_PREFETCH_COUNT  # pylint: disable=protected-access
+            task_prefetch_count = rmq.get_task_prefetch_count(profile)
 
         url = rmq.get_rmq_url()
         prefix = profile.rmq_prefix
@@ -270,7 +270,12 @@ class Manager(object):  # pylint: disable=useless-object-inheritance
         profile = self.get_profile()
         poll_interval = 0.0 if profile.is_test_profile else config.get_option('runner.poll.interval')
 
-        settings = {'rmq_submit': False, 'poll_interval': poll_interval}
+        settings = {
+            'rmq_submit': False,
+            'poll_interval': poll_interval,
+            'transport_idle_timeout': config.get_option('transport.pool.idle_timeout', scope=profile.name),
+            'transport_keepalive_interval': config.get_option('transport.pool.keepalive_interval', scope=profile.name),
+        }
         settings.update(kwargs)
 
         if 'communicator' not in settings:
@@ -294,7 +299,27 @@ class Manager(object):  # pylint: disable=useless-object-inheritance
         import plumpy
         from aiida.engine import persistence
         from aiida.manage.external import rmq
-        runner = self.create_runner(rmq_submit=True, loop=loop)
+        from .configuration import get_config
+
+        config = get_config()
+        profile = self.get_profile()
+        settings = {
+            'rmq_submit': True,
+            'loop': loop,
+            'parse_pool_size': config.get_option('daemon.parse_pool_size', scope=profile.name),
+        }
+
+        if config.get_option('daemon.shared_scheduler_poll', scope=profile.name):
+            settings['job_manager_shared_directory'] = profile.filepaths['daemon']['scheduler_poll']
+
+        if config.get_option('daemon.adaptive_prefetch', scope=profile.name):
+            settings['slot_scheduler'] = rmq.ProcessSlotScheduler(
+                self.get_communicator(),
+                slots=config.get_option('daemon.worker_process_slots', scope=profile.name),
+                waiting_per_slot=config.get_option('daemon.worker_waiting_per_slot', scope=profile.name),
+                max_prefetch=config.get_option('daemon.worker_max_prefetch', scope=profile.name))
+
+        runner = self.create_runner(**settings)
         runner_loop = runner.loop
 
         # Listen for incoming launch requests
@@ -307,7 +332,11 @@ class Manager(object):  # pylint: disable=useless-object-inheritance
         def callback(*args, **kwargs):
             return plumpy.create_task(functools.partial(task_receiver, *args, **kwargs), loop=runner_loop)
 
-        runner.communicator.add_task_subscriber(callback)
+        # With an adaptive prefetch, the slot scheduler decides which tasks the worker takes on
+        if runner.slot_scheduler is not None:
+            runner.slot_scheduler.subscribe(callback)
+        else:
+            runner.communicator.add_task_subscriber(callback)
 
         return runner
 
@@ -47,6 +47,8 @@ class Computer(entities.Entity):
 
     PROPERTY_MINIMUM_SCHEDULER_POLL_INTERVAL = 'minimum_scheduler_poll_interval'  # pylint: disable=invalid-name
     PROPERTY_MINIMUM_SCHEDULER_POLL_INTERVAL__DEFAULT = 10.  # pylint: disable=invalid-name
+    PROPERTY_MAXIMUM_SCHEDULER_POLL_INTERVAL = 'maximum_scheduler_poll_interval'  # pylint: disable=invalid-name
+    PROPERTY_MAXIMUM_SCHEDULER_POLL_INTERVAL__DEFAULT = 0.  # pylint: disable=invalid-name
     PROPERTY_WORKDIR = 'workdir'
     PROPERTY_SHEBANG = 'shebang'
 
@@ -459,6 +461,30 @@ class Computer(entities.Entity):
         """
         self.set_property(self.PROPERTY_MINIMUM_SCHEDULER_POLL_INTERVAL, interval)
 
+    def get_maximum_job_poll_interval(self):
+        """
+        Get the maximum interval between subsequent requests to update the list
+        of jobs currently running on this computer, up to which the interval is
+        adapted to the state of the jobs. If it is not larger than the minimum
+        interval, the jobs are always polled with the minimum interval.
+
+        :return: The maximum interval (in seconds)
+        :rtype: float
+        """
+        return self.get_property(self.PROPERTY_MAXIMUM_SCHEDULER_POLL_INTERVAL,
+                                 self.PROPERTY_MAXIMUM_SCHEDULER_POLL_INTERVAL__DEFAULT)
+
+    def set_maximum_job_poll_interval(self, interval):
+        """
+        Set the maximum interval between subsequent requests to update the list
+        of jobs currently running on this computer, up to which the interval is
+        adapted to the state of the jobs.
+
+        :param interval: The maximum interval in seconds
+        :type interval: float
+        """
+        self.set_property(self.PROPERTY_MAXIMUM_SCHEDULER_POLL_INTERVAL, interval)
+
     def get_transport(self, user=None):
         """
         Return a Transport class, configured with all correct parameters.
@@ -211,7 +211,7 @@ class DjangoNode(entities.DjangoModelEntity[models.DbNode], BackendNode):
             value = clean_value(value)
 
         self._dbmodel.attributes[key] = value
-        self._flush_if_stored()
+        self._flush_if_stored('attributes', updated={key: value})
 
     def set_attribute_many(self, attributes):
         """Set multiple attributes.
@@ -227,7 +227,7 @@ class DjangoNode(entities.DjangoModelEntity[models.DbNode], BackendNode):
             # We need to use `self.dbmodel` without the underscore, because otherwise the second iteration will refetch
             # what is in the database and we lose the initial changes.
             self.dbmodel.attributes[key] = value
-        self._flush_if_stored()
+        self._flush_if_stored('attributes', updated=attributes)
 
     def reset_attributes(self, attributes):
         """Reset the attributes.
@@ -240,7 +240,7 @@ class DjangoNode(entities.DjangoModelEntity[models.DbNode], BackendNode):
             attributes = clean_value(attributes)
 
         self.dbmodel.attributes = attributes
-        self._flush_if_stored()
+        self._flush_if_stored('attributes', updated=attributes, reset=True)
 
     def delete_attribute(self, key):
         """Delete an attribute.
@@ -253,7 +253,7 @@ class DjangoNode(entities.DjangoModelEntity[models.DbNode], BackendNode):
         except KeyError as exception:
             raise AttributeError('attribute `{}` does not exist'.format(exception))
         else:
-            self._flush_if_stored()
+            self._flush_if_stored('attributes', deleted=(key,))
 
     def delete_attribute_many(self, keys):
         """Delete multiple attributes.
@@ -269,12 +269,12 @@ class DjangoNode(entities.DjangoModelEntity[models.DbNode], BackendNode):
         for key in keys:
             self.dbmodel.attributes.pop(key)
 
-        self._flush_if_stored()
+        self._flush_if_stored('attributes', deleted=keys)
 
     def clear_attributes(self):
         """Delete all attributes."""
-        self._dbmodel.attributes = {}
-        self._flush_if_stored()
+        self.dbmodel.attributes = {}
+        self._flush_if_stored('attributes', reset=True)
 
     def attributes_items(self):
         """Return an iterator over the attributes.
@@ -356,7 +356,7 @@ class DjangoNode(entities.DjangoModelEntity[models.DbNode], BackendNode):
             value = clean_value(value)
 
         self._dbmodel.extras[key] = value
-        self._flush_if_stored()
+        self._flush_if_stored('extras', updated={key: value})
 
     def set_extra_many(self, extras):
         """Set multiple extras.
@@ -371,7 +371,7 @@ class DjangoNode(entities.DjangoModelEntity[models.DbNode], BackendNode):
         for key, value in extras.items():
             self.dbmodel.extras[key] = value
 
-        self._flush_if_stored()
+        self._flush_if_stored('extras', updated=extras)
 
     def reset_extras(self, extras):
         """Reset the extras.
@@ -384,7 +384,7 @@ class DjangoNode(entities.DjangoModelEntity[models.DbNode], BackendNode):
             extras = clean_value(extras)
 
         self.dbmodel.extras = extras
-        self._flush_if_stored()
+        self._flush_if_stored('extras', updated=extras, reset=True)
 
     def delete_extra(self, key):
         """Delete an extra.
@@ -397,7 +397,7 @@ class DjangoNode(entities.DjangoModelEntity[models.DbNode], BackendNode):
         except KeyError as exception:
             raise AttributeError('extra `{}` does not exist'.format(exception))
         else:
-            self._flush_if_stored()
+            self._flush_if_stored('extras', deleted=(key,))
 
     def delete_extra_many(self, keys):
         """Delete multiple extras.
@@ -413,12 +413,12 @@ class DjangoNode(entities.DjangoModelEntity[models.DbNode], BackendNode):
         for key in keys:
             self.dbmodel.extras.pop(key)
 
-        self._flush_if_stored()
+        self._flush_if_stored('extras', deleted=keys)
 
     def clear_extras(self):
         """Delete all extras."""
-        self._dbmodel.extras = {}
-        self._flush_if_stored()
+        self.dbmodel.extras = {}
+        self._flush_if_stored('extras', reset=True)
 
     def extras_items(self):
         """Return an iterator over the extras.
@@ -436,7 +436,17 @@ class DjangoNode(entities.DjangoModelEntity[models.DbNode], BackendNode):
         for key in self._dbmodel.extras:
             yield key
 
-    def _flush_if_stored(self):
+    def _flush_if_stored(self, field, updated=None, deleted=(), reset=False):
+        """Flush a changed field of the database model if the node is stored, unless the writing of it is deferred.
+
+        :param field: the database model field that was changed, either `attributes` or `extras`
+        :param updated: a dictionary with the keys that were set and their new values
+        :param deleted: the keys that were deleted
+        :param reset: boolean, True if the whole field was replaced by `updated`
+        """
+        if self._defer_write(field, updated, deleted, reset):
+            return
+
         if self._dbmodel.is_saved():
             self._dbmodel.save()
 
@@ -459,6 +469,22 @@ class DjangoNode(entities.DjangoModelEntity[models.DbNode], BackendNode):
 
         self._add_link(source, link_type, link_label)
 
+    def add_incoming_many(self, links):
+        """Add multiple links from given nodes to ourself, inserting them in a single statement.
+
+        :param links: list of tuples of the node from which the link is coming, the link type and the link label
+        :raise aiida.common.ModificationNotAllowed: if either source or target node is not stored
+        """
+        if not self.is_stored:
+            raise exceptions.ModificationNotAllowed('node has to be stored when adding an incoming link')
+
+        for source, _, _ in links:
+            type_check(source, DjangoNode)
+            if not source.is_stored:
+                raise exceptions.ModificationNotAllowed('source node has to be stored when adding a link from it')
+
+        self._add_links(links)
+
     def _add_link(self, source, link_type, link_label):
         """Add a link of the given type from a given node to ourself.
 
@@ -478,6 +504,27 @@ class DjangoNode(entities.DjangoModelEntity[models.DbNode], BackendNode):
             transaction.savepoint_rollback(savepoint_id)
             raise exceptions.UniquenessError('failed to create the link: {}'.format(exception))
 
+    def _add_links(self, links):
+        """Add multiple links from given nodes to ourself with a single multi-row insert statement.
+
+        :param links: list of tuples of the node from which the link is coming, the link type and the link label
+        """
+        if not links:
+            return
+
+        savepoint_id = None
+
+        try:
+            savepoint_id = transaction.savepoint()
+            self.LINK_CLASS.objects.bulk_create([
+                self.LINK_CLASS(input_id=source.id, output_id=self.id, label=link_label, type=link_type.value)
+                for source, link_type, link_label in links
+            ])
+            transaction.savepoint_commit(savepoint_id)
+        except IntegrityError as exception:
+            transaction.savepoint_rollback(savepoint_id)
+            raise exceptions.UniquenessError('failed to create the links: {}'.format(exception))
+
     def clean_values(self):
         self._dbmodel.attributes = clean_value(self._dbmodel.attributes)
         self._dbmodel.extras = clean_value(self._dbmodel.extras)
@@ -503,8 +550,7 @@ class DjangoNode(entities.DjangoModelEntity[models.DbNode], BackendNode):
                 self.dbmodel.save()
 
                 if links:
-                    for link_triple in links:
-                        self._add_link(*link_triple)
+                    self._add_links(links)
 
         return self
 
@@ -514,6 +560,9 @@ class DjangoNodeCollection(BackendNodeCollection):
 
     ENTITY_CLASS = DjangoNode
 
+    # Maximum number of rows inserted by a single multi-row insert statement in `bulk_store`
+    BULK_STORE_BATCH_SIZE = 1000
+
     def get(self, pk):
         """Return a Node entry from the collection with the given id
 
@@ -533,3 +582,84 @@ class DjangoNodeCollection(BackendNodeCollection):
             models.DbNode.objects.filter(pk=pk).delete()  # pylint: disable=no-member
         except ObjectDoesNotExist:
             raise exceptions.NotExistent("Node with pk '{}' not found".format(pk))
+
+    def _write_deferred(self, deferred_writes):
+        """Write the deferred changes to the attributes and extras of stored nodes in a single transaction.
+
+        Each changed node is updated with a single statement, in which the keys that were deleted are removed from the
+        JSONB field and the keys that were set are merged into it with the `||` operator.
+
+        :param deferred_writes: the `DeferredWrites` to write
+        """
+        from django.db import connection
+        from aiida.common import json, timezone
+
+        table = models.DbNode._meta.db_table  # pylint: disable=protected-access
+        mtime = timezone.now()
+
+        with transaction.atomic(), connection.cursor() as cursor:
+            for node, changes in deferred_writes.items():
+                assignments = []
+                parameters = []
+
+                for field, field_changes in changes.items():
+                    if field_changes.reset:
+                        assignments.append('{} = %s::jsonb'.format(field))
+                        parameters.append(json.dumps(field_changes.updated))
+                        continue
+
+                    expression = "COALESCE({}, '{{}}'::jsonb)".format(field)
+
+                    for key in sorted(field_changes.deleted):
+                        expression += ' - %s::text'
+                        parameters.append(key)
+
+                    if field_changes.updated:
+                        expression = '({}) || %s::jsonb'.format(expression)
+                        parameters.append(json.dumps(field_changes.updated))
+
+                    assignments.append('{} = {}'.format(field, expression))
+
+                # The `auto_now` of the `mtime` column is not triggered by a raw update, so it has to be set explicitly
+                assignments.append('mtime = %s')
+                parameters.extend([mtime, node.id])
+
+                cursor.execute('UPDATE {} SET {} WHERE id = %s'.format(table, ', '.join(assignments)), parameters)
+
+    def bulk_store(self, nodes, links=None):
+        """Store multiple unstored nodes and links between them in a single transaction with bulk insert statements.
+
+        .. note:: the values of the nodes are stored as is, so they should already have been cleaned.
+
+        :param nodes: list of unstored `BackendNode` instances
+        :param links: optional list of tuples of the source node, the target node, the link type and the link label,
+            where the target is one of the nodes and the source is either stored or one of the nodes as well
+        :return: list of the pks of the stored nodes, in the same order as the nodes
+        :raise aiida.common.ModificationNotAllowed: if any of the nodes is already stored
+        """
+        for node in nodes:
+            type_check(node, DjangoNode)
+            if node.is_stored:
+                raise exceptions.ModificationNotAllowed('node<{}> is already stored'.format(node.id))
+
+        dbmodels = [node.dbmodel for node in nodes]
+        link_class = self.ENTITY_CLASS.LINK_CLASS
+
+        with transaction.atomic():
+            # On PostgreSQL the primary keys are returned by the insert and set on the model instances
+            models.DbNode.objects.bulk_create(dbmodels, batch_size=self.BULK_STORE_BATCH_SIZE)
+
+            savepoint_id = None
+
+            try:
+                savepoint_id = transaction.savepoint()
+                link_class.objects.bulk_create([
+                    link_class(input_id=source.id, output_id=target.id, label=link_label, type=link_type.value)
+                    for source, target, link_type, link_label in links or []
+                ], batch_size=self.BULK_STORE_BATCH_SIZE)
+                transaction.savepoint_commit(savepoint_id)
+            except IntegrityError as exception:
+                transaction.savepoint_rollback(savepoint_id)
+                raise exceptions.UniquenessError('failed to create the links: {}'.format(exception))
+
+        return [dbmodel.pk for dbmodel in dbmodels]
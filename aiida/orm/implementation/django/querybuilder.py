@@ -348,6 +348,12 @@ class DjangoQueryBuilder(BackendQueryBuilder):
                 else_=False)
         else:
             raise InputValidationError("Unknown operator {} for filters in JSON field".format(operator))
+
+        if operator in ('==', 'in'):
+            indexable_expr = self.get_indexable_filter_expr(database_entity, [value] if operator == '==' else value)
+            if indexable_expr is not None:
+                expr = and_(indexable_expr, expr)
+
         return expr
 
     def get_projectable_attribute(self, alias, column_name, attrpath, cast=None, **kwargs):  # pylint: disable=redefined-outer-name
@@ -424,6 +430,24 @@ class DjangoQueryBuilder(BackendQueryBuilder):
         with transaction.atomic():
             return query.first()
 
+    def execute_update(self, statement):
+        """
+        Execute an update statement and commit it.
+
+        :param statement: the update statement
+        :returns: the number of updated rows
+        """
+        session = self.get_session()
+
+        try:
+            result = session.execute(statement)
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+
+        return result.rowcount
+
     def iterall(self, query, batch_size, tag_to_index_dict):
         from django.db import transaction
         if not tag_to_index_dict:
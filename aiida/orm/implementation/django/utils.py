@@ -44,6 +44,7 @@ class ModelWrapper(object):
         # Have to do it this way because we overwrite __setattr__
         object.__setattr__(self, '_model', model)
         object.__setattr__(self, '_auto_flush', auto_flush)
+        object.__setattr__(self, '_deferred_fields', set())
 
     def __getattr__(self, item):
         """Get an attribute of the model instance.
@@ -54,7 +55,7 @@ class ModelWrapper(object):
         :param item: the name of the model field
         :return: the value of the model's attribute
         """
-        if self.is_saved() and self._is_mutable_model_field(item):
+        if self._needs_refresh(item):
             self._ensure_model_uptodate(fields=(item,))
 
         return getattr(self._model, item)
@@ -72,6 +73,19 @@ class ModelWrapper(object):
             fields = set((key,) + self._auto_flush)
             self._flush(fields=fields)
 
+    def defer_refresh(self, field):
+        """Stop refreshing the given field from the database when it is accessed, until `undefer_refresh` is called.
+
+        This is used for fields with changes whose writing to the database is deferred, which would otherwise be lost.
+
+        :param field: the name of the model field
+        """
+        self._deferred_fields.add(field)
+
+    def undefer_refresh(self):
+        """Refresh all mutable fields from the database when they are accessed again."""
+        self._deferred_fields.clear()
+
     def is_saved(self):
         """Retun whether the wrapped model instance is saved in the database.
 
@@ -92,6 +106,13 @@ class ModelWrapper(object):
             except IntegrityError as exception:
                 raise exceptions.IntegrityError(str(exception))
 
+    def _needs_refresh(self, field):
+        """Return whether the field has to be refreshed from the database before it is accessed.
+
+        :return: boolean, True if the model is saved and the field is a mutable field whose refresh is not deferred
+        """
+        return self.is_saved() and self._is_mutable_model_field(field) and field not in self._deferred_fields
+
     def _is_mutable_model_field(self, field):
         """Return whether the field is a mutable field of the model.
 
@@ -13,6 +13,10 @@ from __future__ import print_function
 from __future__ import absolute_import
 
 import abc
+import collections
+import contextlib
+import threading
+
 import six
 
 from . import backends
@@ -375,6 +379,36 @@ class BackendNode(backends.BackendEntity):
         :raise ValueError: if the proposed link is invalid
         """
 
+    @abc.abstractmethod
+    def add_incoming_many(self, links):
+        """Add multiple links from given nodes to ourself, inserting them in a single statement.
+
+        :param links: list of tuples of the node from which the link is coming, the link type and the link label
+        :raise aiida.common.ModificationNotAllowed: if either source or target node is not stored
+        """
+
+    def _defer_write(self, field, updated=None, deleted=(), reset=False):
+        """Record a change of the attributes or extras of this node with the active deferred writes, if any.
+
+        The field of the database model is then no longer refreshed from the database when it is accessed, such that the
+        changes that are not yet written are not lost, until the deferred writes are either written or discarded.
+
+        :param field: the database model field that was changed, either `attributes` or `extras`
+        :param updated: a dictionary with the keys that were set and their new values
+        :param deleted: the keys that were deleted
+        :param reset: boolean, True if the whole field was replaced by `updated`
+        :return: boolean, True if the change was deferred, False if it should be flushed straight away
+        """
+        deferred_writes = self.backend.nodes.get_deferred_writes()
+
+        if deferred_writes is None or not self.is_stored:
+            return False
+
+        deferred_writes.record(self, field, updated, deleted, reset)
+        self._dbmodel.defer_refresh(field)
+
+        return True
+
     @abc.abstractmethod
     def store(self, links=None, with_transaction=True, clean=True):
         """Store the node in the database.
@@ -385,6 +419,70 @@ class BackendNode(backends.BackendEntity):
         """
 
 
+class DeferredWrites(object):
+    """The changes to the attributes and extras of stored nodes whose writing to the database is deferred.
+
+    Only the keys that were set, with their new values, and the keys that were deleted are recorded for each field,
+    such that each node can be updated with a single partial update, instead of rewriting its fields completely.
+    """
+
+    # pylint: disable=useless-object-inheritance
+
+    FieldChanges = collections.namedtuple('FieldChanges', ['updated', 'deleted', 'reset'])
+
+    def __init__(self):
+        self._nodes = collections.OrderedDict()
+        self._changes = collections.OrderedDict()
+
+    def __len__(self):
+        return len(self._nodes)
+
+    def record(self, node, field, updated=None, deleted=(), reset=False):
+        """Record a change of the attributes or extras of a stored node.
+
+        :param node: the stored `BackendNode` that was changed
+        :param field: the database model field that was changed, either `attributes` or `extras`
+        :param updated: a dictionary with the keys that were set and their new values
+        :param deleted: the keys that were deleted
+        :param reset: boolean, True if the whole field was replaced by `updated`
+        """
+        updated = updated or {}
+        self._nodes[node.id] = node
+        changes = self._changes.setdefault(node.id, {})
+
+        if reset:
+            changes[field] = self.FieldChanges(dict(updated), set(), True)
+            return
+
+        current = changes.setdefault(field, self.FieldChanges({}, set(), False))
+        current.updated.update(updated)
+        current.deleted.difference_update(updated)
+
+        for key in deleted:
+            current.updated.pop(key, None)
+            current.deleted.add(key)
+
+    def items(self):
+        """Return an iterator over the changed nodes.
+
+        :return: an iterator of tuples of a node and a dictionary of its changed fields and their `FieldChanges`, where
+            for a field that was reset the dictionary of updated keys is its complete new value
+        """
+        for pk, node in self._nodes.items():
+            yield node, self._changes[pk]
+
+    def release(self):
+        """Let the changed fields of the database models be refreshed from the database again and forget the changes.
+
+        Changes that were not yet written are thereby discarded.
+        """
+        for node in self._nodes.values():
+            node._dbmodel.undefer_refresh()  # pylint: disable=protected-access
+
+        self._nodes.clear()
+        self._changes.clear()
+
+
 @six.add_metaclass(abc.ABCMeta)
 class BackendNodeCollection(backends.BackendCollection[BackendNode]):
     """The collection of `BackendNode` entries."""
@@ -393,6 +491,48 @@ class BackendNodeCollection(backends.BackendCollection[BackendNode]):
 
     ENTITY_CLASS = BackendNode
 
+    def __init__(self, backend):
+        super(BackendNodeCollection, self).__init__(backend)
+        self._local = threading.local()
+
+    def get_deferred_writes(self):
+        """Return the deferred writes of the current thread, if a `deferred_writes` block is active.
+
+        :return: the active `DeferredWrites` instance or None
+        """
+        return getattr(self._local, 'deferred_writes', None)
+
+    @contextlib.contextmanager
+    def deferred_writes(self):
+        """Context manager that defers the writing of changes to the attributes and extras of stored nodes.
+
+        Instead of a database round trip that rewrites the whole field for each change, as happens outside of the
+        block, the changes are written at the end of the block, with a single partial update for each changed node, in
+        a single transaction. If an exception is raised within the block, the changes that were made within it are
+        discarded. Nested blocks are merged with the outermost one.
+        """
+        if self.get_deferred_writes() is not None:
+            yield
+            return
+
+        deferred_writes = DeferredWrites()
+        self._local.deferred_writes = deferred_writes
+
+        try:
+            yield
+            self._local.deferred_writes = None
+            self._write_deferred(deferred_writes)
+        finally:
+            self._local.deferred_writes = None
+            deferred_writes.release()
+
+    @abc.abstractmethod
+    def _write_deferred(self, deferred_writes):
+        """Write the deferred changes to the attributes and extras of stored nodes in a single transaction.
+
+        :param deferred_writes: the `DeferredWrites` to write
+        """
+
     @abc.abstractmethod
     def get(self, pk):
         """Return a Node entry from the collection with the given id
@@ -406,3 +546,16 @@ class BackendNodeCollection(backends.BackendCollection[BackendNode]):
 
         :param pk: id of the node to delete
         """
+
+    @abc.abstractmethod
+    def bulk_store(self, nodes, links=None):
+        """Store multiple unstored nodes and links between them in a single transaction with bulk insert statements.
+
+        .. note:: the values of the nodes are stored as is, so they should already have been cleaned.
+
+        :param nodes: list of unstored `BackendNode` instances
+        :param links: optional list of tuples of the source node, the target node, the link type and the link label,
+            where the target is one of the nodes and the source is either stored or one of the nodes as well
+        :return: list of the pks of the stored nodes, in the same order as the nodes
+        :raise aiida.common.ModificationNotAllowed: if any of the nodes is already stored
+        """
@@ -136,6 +136,32 @@ class BackendQueryBuilder(object):
         :returns: An instance of sqlalchemy.sql.elements.BinaryExpression
         """
 
+    @staticmethod
+    def get_indexable_filter_expr(database_entity, values):
+        """
+        Return an expression that compares the JSONB value at the path of an attribute or extra with the given values.
+
+        The filters on attributes and extras check the type of the value before comparing it, in a case expression that
+        cannot be answered with an index. Combined with such a filter, this expression allows the database to use an
+        expression index on the path, as created with :py:mod:`aiida.manage.database.indexes`, instead.
+
+        :param database_entity: the JSONB value at the path of the attribute or extra
+        :param values: the list of values of which the value at the path has to be one
+        :returns: the expression, or None if any of the values is not a string, number or boolean
+        """
+        from sqlalchemy import cast
+        from sqlalchemy.dialects.postgresql import JSONB
+
+        indexable_types = six.string_types + six.integer_types + (float,)
+
+        if not values or not all(isinstance(value, indexable_types) for value in values):
+            return None
+
+        if len(values) == 1:
+            return database_entity == cast(values[0], JSONB)
+
+        return database_entity.in_([cast(value, JSONB) for value in values])
+
     @classmethod
     def get_corresponding_properties(cls, entity_table, given_properties, mapper):
         """
@@ -267,6 +293,62 @@ class BackendQueryBuilder(object):
         :returns: An iterator over all the results of a list of dictionaries.
         """
 
+    def update_extras(self, query, alias, extras):
+        """
+        Merge the given extras into the extras of the nodes matched by the query, with a single update statement.
+
+        :param query: the query that matches the nodes
+        :param alias: the aliased node class of the vertex of the query whose nodes to update
+        :param extras: a dictionary of the extras to set, whose values should already have been cleaned
+        :returns: the number of updated nodes
+        """
+        from sqlalchemy import cast, func
+        from sqlalchemy.dialects.postgresql import JSONB
+        from aiida.common import timezone
+
+        node_table = self.Node.__table__
+        node_ids = query.with_entities(alias.id).statement
+
+        statement = node_table.update().where(node_table.c.id.in_(node_ids)).values(
+            extras=func.coalesce(node_table.c.extras, cast({}, JSONB)).op('||')(cast(extras, JSONB)),
+            mtime=timezone.now())
+
+        return self.execute_update(statement)
+
+    def delete_extras(self, query, alias, keys):
+        """
+        Delete the given extras from the nodes matched by the query that have any of them, with a single update.
+
+        :param query: the query that matches the nodes
+        :param alias: the aliased node class of the vertex of the query whose nodes to update
+        :param keys: the names of the extras to delete
+        :returns: the number of updated nodes
+        """
+        from sqlalchemy import cast, Text
+        from sqlalchemy.dialects.postgresql import array
+        from aiida.common import timezone
+
+        node_table = self.Node.__table__
+        node_ids = query.with_entities(alias.id).statement
+
+        extras = node_table.c.extras
+        for key in keys:
+            extras = extras.op('-')(cast(key, Text))
+
+        statement = node_table.update().where(node_table.c.id.in_(node_ids)).where(
+            node_table.c.extras.has_any(array(keys))).values(extras=extras, mtime=timezone.now())
+
+        return self.execute_update(statement)
+
+    @abc.abstractmethod
+    def execute_update(self, statement):
+        """
+        Execute an update statement and commit it.
+
+        :param statement: the update statement
+        :returns: the number of updated rows
+        """
+
     @abc.abstractmethod
     def get_column_names(self, alias):
         """
@@ -19,7 +19,7 @@ from sqlalchemy.exc import SQLAlchemyError
 
 from aiida.backends.sqlalchemy import get_scoped_session
 from aiida.backends.sqlalchemy.models import node as models
-from aiida.common import exceptions
+from aiida.common import exceptions, timezone
 from aiida.common.lang import type_check
 from aiida.orm.utils.node import clean_value
 
@@ -213,8 +213,7 @@ class SqlaNode(entities.SqlaModelEntity[models.DbNode], BackendNode):
             value = clean_value(value)
 
         self._dbmodel.attributes[key] = value
-        self._flag_field('attributes')
-        self._flush_if_stored()
+        self._flush_if_stored('attributes', updated={key: value})
 
     def set_attribute_many(self, attributes):
         """Set multiple attributes.
@@ -229,8 +228,7 @@ class SqlaNode(entities.SqlaModelEntity[models.DbNode], BackendNode):
         for key, value in attributes.items():
             self.dbmodel.attributes[key] = value
 
-        self._flag_field('attributes')
-        self._flush_if_stored()
+        self._flush_if_stored('attributes', updated=attributes)
 
     def reset_attributes(self, attributes):
         """Reset the attributes.
@@ -243,8 +241,7 @@ class SqlaNode(entities.SqlaModelEntity[models.DbNode], BackendNode):
             attributes = clean_value(attributes)
 
         self.dbmodel.attributes = attributes
-        self._flag_field('attributes')
-        self._flush_if_stored()
+        self._flush_if_stored('attributes', updated=attributes, reset=True)
 
     def delete_attribute(self, key):
         """Delete an attribute.
@@ -257,8 +254,7 @@ class SqlaNode(entities.SqlaModelEntity[models.DbNode], BackendNode):
         except KeyError as exception:
             raise AttributeError('attribute `{}` does not exist'.format(exception))
         else:
-            self._flag_field('attributes')
-            self._flush_if_stored()
+            self._flush_if_stored('attributes', deleted=(key,))
 
     def delete_attribute_many(self, keys):
         """Delete multiple attributes.
@@ -274,12 +270,12 @@ class SqlaNode(entities.SqlaModelEntity[models.DbNode], BackendNode):
         for key in keys:
             self.dbmodel.attributes.pop(key)
 
-        self._flag_field('attributes')
-        self._flush_if_stored()
+        self._flush_if_stored('attributes', deleted=keys)
 
     def clear_attributes(self):
         """Delete all attributes."""
-        self._dbmodel.attributes = {}
+        self.dbmodel.attributes = {}
+        self._flush_if_stored('attributes', reset=True)
 
     def attributes_items(self):
         """Return an iterator over the attributes.
@@ -361,8 +357,7 @@ class SqlaNode(entities.SqlaModelEntity[models.DbNode], BackendNode):
             value = clean_value(value)
 
         self._dbmodel.extras[key] = value
-        self._flag_field('extras')
-        self._flush_if_stored()
+        self._flush_if_stored('extras', updated={key: value})
 
     def set_extra_many(self, extras):
         """Set multiple extras.
@@ -377,8 +372,7 @@ class SqlaNode(entities.SqlaModelEntity[models.DbNode], BackendNode):
         for key, value in extras.items():
             self.dbmodel.extras[key] = value
 
-        self._flag_field('extras')
-        self._flush_if_stored()
+        self._flush_if_stored('extras', updated=extras)
 
     def reset_extras(self, extras):
         """Reset the extras.
@@ -388,8 +382,7 @@ class SqlaNode(entities.SqlaModelEntity[models.DbNode], BackendNode):
         :param extras: a dictionary with the extras to set
         """
         self.dbmodel.extras = extras
-        self._flag_field('extras')
-        self._flush_if_stored()
+        self._flush_if_stored('extras', updated=extras, reset=True)
 
     def delete_extra(self, key):
         """Delete an extra.
@@ -402,8 +395,7 @@ class SqlaNode(entities.SqlaModelEntity[models.DbNode], BackendNode):
         except KeyError as exception:
             raise AttributeError('extra `{}` does not exist'.format(exception))
         else:
-            self._flag_field('extras')
-            self._flush_if_stored()
+            self._flush_if_stored('extras', deleted=(key,))
 
     def delete_extra_many(self, keys):
         """Delete multiple extras.
@@ -419,12 +411,12 @@ class SqlaNode(entities.SqlaModelEntity[models.DbNode], BackendNode):
         for key in keys:
             self.dbmodel.extras.pop(key)
 
-        self._flag_field('extras')
-        self._flush_if_stored()
+        self._flush_if_stored('extras', deleted=keys)
 
     def clear_extras(self):
         """Delete all extras."""
-        self._dbmodel.extras = {}
+        self.dbmodel.extras = {}
+        self._flush_if_stored('extras', reset=True)
 
     def extras_items(self):
         """Return an iterator over the extras.
@@ -446,7 +438,19 @@ class SqlaNode(entities.SqlaModelEntity[models.DbNode], BackendNode):
         from aiida.backends.sqlalchemy.utils import flag_modified
         flag_modified(self._dbmodel, field)
 
-    def _flush_if_stored(self):
+    def _flush_if_stored(self, field, updated=None, deleted=(), reset=False):
+        """Flush a changed field of the database model if the node is stored, unless the writing of it is deferred.
+
+        :param field: the database model field that was changed, either `attributes` or `extras`
+        :param updated: a dictionary with the keys that were set and their new values
+        :param deleted: the keys that were deleted
+        :param reset: boolean, True if the whole field was replaced by `updated`
+        """
+        if self._defer_write(field, updated, deleted, reset):
+            return
+
+        self._flag_field(field)
+
         if self._dbmodel.is_saved():
             self._dbmodel.save()
 
@@ -470,7 +474,31 @@ class SqlaNode(entities.SqlaModelEntity[models.DbNode], BackendNode):
             raise exceptions.ModificationNotAllowed('source node has to be stored when adding a link from it')
 
         self._add_link(source, link_type, link_label)
-        session.commit()
+
+        # Do not commit if we are within a transaction, like `ModelWrapper.save`, or the transaction would be ended
+        if not session.transaction.nested:
+            session.commit()
+
+    def add_incoming_many(self, links):
+        """Add multiple links from given nodes to ourself, inserting them in a single statement.
+
+        :param links: list of tuples of the node from which the link is coming, the link type and the link label
+        :raise aiida.common.ModificationNotAllowed: if either source or target node is not stored
+        """
+        session = get_scoped_session()
+
+        if not self.is_stored:
+            raise exceptions.ModificationNotAllowed('node has to be stored when adding an incoming link')
+
+        for source, _, _ in links:
+            type_check(source, SqlaNode)
+            if not source.is_stored:
+                raise exceptions.ModificationNotAllowed('source node has to be stored when adding a link from it')
+
+        self._add_links(links)
+
+        if not session.transaction.nested:
+            session.commit()
 
     def _add_link(self, source, link_type, link_label):
         """Add a link of the given type from a given node to ourself.
@@ -490,6 +518,31 @@ class SqlaNode(entities.SqlaModelEntity[models.DbNode], BackendNode):
         except SQLAlchemyError as exception:
             raise exceptions.UniquenessError('failed to create the link: {}'.format(exception))
 
+    def _add_links(self, links):
+        """Add multiple links from given nodes to ourself with a single multi-row insert statement.
+
+        :param links: list of tuples of the node from which the link is coming, the link type and the link label
+        """
+        from aiida.backends.sqlalchemy.models.node import DbLink
+
+        if not links:
+            return
+
+        session = get_scoped_session()
+
+        try:
+            # Opening the nested transaction flushes the session, which assigns the id if the node itself is pending
+            with session.begin_nested():
+                rows = [{
+                    'input_id': source.id,
+                    'output_id': self.id,
+                    'label': link_label,
+                    'type': link_type.value
+                } for source, link_type, link_label in links]
+                session.execute(DbLink.__table__.insert().values(rows))
+        except SQLAlchemyError as exception:
+            raise exceptions.UniquenessError('failed to create the links: {}'.format(exception))
+
     def clean_values(self):
         self._dbmodel.attributes = clean_value(self._dbmodel.attributes)
         self._dbmodel.extras = clean_value(self._dbmodel.extras)
@@ -509,12 +562,15 @@ class SqlaNode(entities.SqlaModelEntity[models.DbNode], BackendNode):
         session.add(self._dbmodel)
 
         if links:
-            for link_triple in links:
-                self._add_link(*link_triple)
+            self._add_links(links)
 
         if with_transaction:
             try:
-                session.commit()
+                # Within an enclosing transaction, committing would end it, so only flush to get the primary key
+                if session.transaction.nested:
+                    session.flush()
+                else:
+                    session.commit()
             except SQLAlchemyError:
                 session.rollback()
                 raise
@@ -527,6 +583,9 @@ class SqlaNodeCollection(BackendNodeCollection):
 
     ENTITY_CLASS = SqlaNode
 
+    # Maximum number of rows inserted by a single multi-row insert statement in `bulk_store`
+    BULK_STORE_BATCH_SIZE = 1000
+
     def get(self, pk):
         """Return a Node entry from the collection with the given id
 
@@ -551,3 +610,99 @@ class SqlaNodeCollection(BackendNodeCollection):
             session.commit()
         except NoResultFound:
             raise exceptions.NotExistent("Node with pk '{}' not found".format(pk))
+
+    def _write_deferred(self, deferred_writes):
+        """Write the deferred changes to the attributes and extras of stored nodes in a single transaction.
+
+        Each changed node is updated with a single statement, in which the keys that were deleted are removed from the
+        JSONB field and the keys that were set are merged into it with the `||` operator.
+
+        :param deferred_writes: the `DeferredWrites` to write
+        """
+        from sqlalchemy import cast, func, Text
+        from sqlalchemy.dialects.postgresql import JSONB
+
+        node_table = models.DbNode.__table__
+
+        with self.backend.transaction() as session:
+            for node, changes in deferred_writes.items():
+                values = {}
+
+                for field, field_changes in changes.items():
+                    if field_changes.reset:
+                        values[field] = cast(field_changes.updated, JSONB)
+                        continue
+
+                    expression = func.coalesce(node_table.c[field], cast({}, JSONB))
+
+                    for key in sorted(field_changes.deleted):
+                        expression = expression.op('-')(cast(key, Text))
+
+                    if field_changes.updated:
+                        expression = expression.op('||')(cast(field_changes.updated, JSONB))
+
+                    values[field] = expression
+
+                # The `mtime` is updated automatically through the `onupdate` of its column
+                session.execute(node_table.update().where(node_table.c.id == node.id).values(**values))
+
+    def bulk_store(self, nodes, links=None):
+        """Store multiple unstored nodes and links between them in a single transaction with bulk insert statements.
+
+        .. note:: the values of the nodes are stored as is, so they should already have been cleaned.
+
+        :param nodes: list of unstored `BackendNode` instances
+        :param links: optional list of tuples of the source node, the target node, the link type and the link label,
+            where the target is one of the nodes and the source is either stored or one of the nodes as well
+        :return: list of the pks of the stored nodes, in the same order as the nodes
+        :raise aiida.common.ModificationNotAllowed: if any of the nodes is already stored
+        """
+        from sqlalchemy import inspect
+        from sqlalchemy.orm import make_transient_to_detached
+
+        for node in nodes:
+            type_check(node, SqlaNode)
+            if node.is_stored:
+                raise exceptions.ModificationNotAllowed('node<{}> is already stored'.format(node.id))
+
+        dbmodels = [node.dbmodel for node in nodes]
+        node_table = models.DbNode.__table__
+        link_table = models.DbLink.__table__
+        mtime = timezone.now()
+
+        for dbmodel in dbmodels:
+            dbmodel.mtime = dbmodel.mtime or mtime
+            dbmodel.user_id = dbmodel.user.id
+            dbmodel.dbcomputer_id = dbmodel.dbcomputer.id if dbmodel.dbcomputer is not None else None
+
+        columns = [column.key for column in node_table.columns if column.key != 'id']
+
+        with self.backend.transaction() as session:
+            for start in range(0, len(dbmodels), self.BULK_STORE_BATCH_SIZE):
+                batch = dbmodels[start:start + self.BULK_STORE_BATCH_SIZE]
+                rows = [{column: getattr(dbmodel, column) for column in columns} for dbmodel in batch]
+                result = session.execute(node_table.insert().values(rows).returning(node_table.c.id, node_table.c.uuid))
+                pks = {str(uuid): pk for pk, uuid in result}
+
+                # Turn the models into persistent instances, as if they had been loaded, without emitting any statement
+                for dbmodel in batch:
+                    if inspect(dbmodel).pending:
+                        session.expunge(dbmodel)
+                    dbmodel.id = pks[str(dbmodel.uuid)]
+                    make_transient_to_detached(dbmodel)
+                    session.add(dbmodel)
+
+            rows = [{
+                'input_id': source.id,
+                'output_id': target.id,
+                'label': link_label,
+                'type': link_type.value
+            } for source, target, link_type, link_label in links or []]
+
+            try:
+                for start in range(0, len(rows), self.BULK_STORE_BATCH_SIZE):
+                    session.execute(link_table.insert().values(rows[start:start + self.BULK_STORE_BATCH_SIZE]))
+            except SQLAlchemyError as exception:
+                raise exceptions.UniquenessError('failed to create the links: {}'.format(exception))
+
+        return [dbmodel.id for dbmodel in dbmodels]
@@ -363,6 +363,12 @@ class SqlaQueryBuilder(BackendQueryBuilder):
                 else_=False)
         else:
             raise InputValidationError("Unknown operator {} for filters in JSON field".format(operator))
+
+        if operator in ('==', 'in'):
+            indexable_expr = self.get_indexable_filter_expr(database_entity, [value] if operator == '==' else value)
+            if indexable_expr is not None:
+                expr = and_(indexable_expr, expr)
+
         return expr
 
     def get_projectable_attribute(self, alias, column_name, attrpath, cast=None, **kwargs):
@@ -447,6 +453,16 @@ class SqlaQueryBuilder(BackendQueryBuilder):
             self.get_session().rollback()
             raise
 
+    def execute_update(self, statement):
+        """
+        Execute an update statement and commit it.
+
+        :param statement: the update statement
+        :returns: the number of updated rows
+        """
+        with self._backend.transaction() as session:
+            return session.execute(statement).rowcount
+
     def iterall(self, query, batch_size, tag_to_index_dict):
         if not tag_to_index_dict:
             raise Exception("Got an empty dictionary: {}".format(tag_to_index_dict))
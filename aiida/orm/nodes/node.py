@@ -78,6 +78,107 @@ class Node(Entity):
             self._backend.nodes.delete(node_id)
             repository.erase(force=True)
 
+        def store_many(self, nodes):
+            """Store multiple nodes, together with the links in their incoming link caches, in a single transaction.
+
+            Instead of a database round trip for each node and link, as with calling `store` on each node, the nodes
+            and the links are inserted with bulk insert statements. The source of each cached incoming link has to be
+            either stored or one of the given nodes. Unlike `store`, the nodes are never stored from the cache. The
+            hashes of the nodes are computed once all nodes and links exist and are written in a single transaction.
+
+            :param nodes: list of unstored nodes
+            :return: list of the pks of the stored nodes, in the same order as the nodes
+            :raise aiida.common.StoringNotAllowed: if any of the nodes cannot be stored
+            :raise aiida.common.ModificationNotAllowed: if any of the nodes is already stored or has an incoming link
+                from an unstored node that is not among the nodes
+            :raise ValueError: if the same node is given more than once or the class of a node overrides `store`
+            """
+            # pylint: disable=protected-access
+            from aiida.orm import Group
+            from aiida.orm.autogroup import current_autogroup, Autogroup, VERDIAUTOGROUP_TYPE
+
+            nodes = list(nodes)
+            uuids = {node.uuid for node in nodes}
+
+            if len(uuids) != len(nodes):
+                raise ValueError('the same node was passed more than once')
+
+            for node in nodes:
+                if not node._storable:
+                    raise exceptions.StoringNotAllowed(node._unstorable_message)
+
+                if node.is_stored:
+                    raise exceptions.ModificationNotAllowed('Node<{}> is already stored'.format(node.id))
+
+                if six.get_unbound_function(type(node).store) is not six.get_unbound_function(Node.store):
+                    raise ValueError('{} overrides `store` and so can only be stored by itself'.format(type(node)))
+
+                node._validate()
+
+                for link_triple in node._incoming_cache:
+                    if not link_triple.node.is_stored and link_triple.node.uuid not in uuids:
+                        raise exceptions.ModificationNotAllowed(
+                            'Cannot store because source node of link triple {} is not stored'.format(link_triple))
+
+            links = []
+
+            for node in nodes:
+                node.backend_entity.clean_values()
+                links.extend((link_triple.node.backend_entity, node.backend_entity, link_triple.link_type,
+                              link_triple.link_label) for link_triple in node._incoming_cache)
+
+            # As in `Node._store`, store the repository folders first and put them back if storing in the database fails
+            stored = []
+
+            try:
+                for node in nodes:
+                    node._repository.store()
+                    stored.append(node)
+
+                pks = self._backend.nodes.bulk_store([node.backend_entity for node in nodes], links)
+            except Exception:
+                for node in stored:
+                    node._repository.restore()
+                raise
+
+            for node in nodes:
+                node._incoming_cache = list()
+
+            # The hash of a process node includes the hashes of its inputs, which are queried through its links, so it
+            # can only be computed once all nodes and links exist. The hashes are written with a single update per node.
+            with self.deferred_writes():
+                for node in nodes:
+                    node.set_extra(_HASH_EXTRA_KEY, node.get_hash())
+
+            if current_autogroup is not None:
+                if not isinstance(current_autogroup, Autogroup):
+                    raise exceptions.ValidationError('`current_autogroup` is not of type `Autogroup`')
+
+                grouped = [node for node in nodes if current_autogroup.is_to_be_grouped(node)]
+                group_label = current_autogroup.get_group_name()
+                if grouped and group_label is not None:
+                    group = Group.objects.get_or_create(label=group_label, type_string=VERDIAUTOGROUP_TYPE)[0]
+                    group.add_nodes(grouped)
+
+            return pks
+
+        def deferred_writes(self):
+            """Return a context manager that defers the writing of changes to the attributes and extras of stored nodes.
+
+            Normally, every change to the extras or to the updatable attributes of a stored node is immediately written
+            to the database, rewriting the whole field. Within the block the changes are kept in memory instead and
+            written when the block exits, with a single partial update per changed node, in a single transaction::
+
+                with Node.objects.deferred_writes():
+                    for node in nodes:
+                        node.set_extra('tag', 'done')
+
+            If an exception is raised within the block, the changes made within it are discarded.
+
+            :return: a context manager
+            """
+            return self._backend.nodes.deferred_writes()
+
     # This will be set by the metaclass call
     _logger = None
 
@@ -768,6 +869,39 @@ class Node(Entity):
         else:
             self._add_incoming_cache(source, link_type, link_label)
 
+    def add_incoming_many(self, links):
+        """Add multiple links from given nodes to ourself.
+
+        All links are validated first, taking into account the other links that are being added. If the node and all
+        source nodes are stored, the links are subsequently inserted with a single statement, otherwise they are added
+        to the cache of incoming links, exactly as with `add_incoming`.
+
+        :param links: list of tuples of the node from which the link is coming, the link type and the link label
+        :raise TypeError: if a source is not a Node instance or a link type is not a `LinkType` enum
+        :raise ValueError: if one of the proposed links is invalid
+        """
+        links = [LinkTriple(*link) for link in links]
+
+        if not self.is_stored or not all(link.node.is_stored for link in links):
+            for link in links:
+                self.add_incoming(*link)
+            return
+
+        # Validate the links while temporarily adding them to the cache, such that each link is also validated against
+        # the other links of the batch, for example to detect duplicate labels
+        incoming_cache = list(self._incoming_cache)
+
+        try:
+            for source, link_type, link_label in links:
+                self.validate_incoming(source, link_type, link_label)
+                source.validate_outgoing(self, link_type, link_label)
+                self._incoming_cache.append(LinkTriple(source, link_type, link_label))
+        finally:
+            self._incoming_cache = incoming_cache
+
+        self.backend_entity.add_incoming_many([(link.node.backend_entity, link.link_type, link.link_label)
+                                               for link in links])
+
     def validate_incoming(self, source, link_type, link_label):
         """Validate adding a link of the given type from a given node to ourself.
 
@@ -787,8 +921,9 @@ class Node(Entity):
 
         validate_link(source, self, link_type, link_label)
 
-        # Check if the proposed link would introduce a cycle in the graph following ancestor/descendant rules
-        if link_type in [LinkType.CREATE, LinkType.INPUT_CALC, LinkType.INPUT_WORK]:
+        # Check if the proposed link would introduce a cycle in the graph following ancestor/descendant rules. A node
+        # that is not yet stored cannot have any descendants, so in that case no cycle can be introduced
+        if self.is_stored and link_type in [LinkType.CREATE, LinkType.INPUT_CALC, LinkType.INPUT_WORK]:
             builder = QueryBuilder().append(
                 Node, filters={'id': self.pk}, tag='parent').append(
                 Node, filters={'id': source.pk}, tag='child', with_ancestors='parent')  # yapf:disable
@@ -364,6 +364,9 @@ class ProcessNode(Sealable, Node):
         """
         Return the checkpoint bundle set for the process
 
+        .. note:: checkpoints are written to the checkpoint store of :class:`aiida.engine.persistence.AiiDAPersister`
+            and this only returns checkpoints that were stored in the node attributes by earlier versions.
+
         :returns: checkpoint bundle if it exists, None otherwise
         """
         return self.get_attribute(self.CHECKPOINT_KEY, None)
@@ -24,8 +24,10 @@ from __future__ import absolute_import
 from __future__ import print_function
 # Checking for correct input with the inspect module
 from inspect import isclass as inspect_isclass
+import collections
 import copy
 import logging
+import threading
 import six
 from six.moves import range, zip
 from sqlalchemy import and_, or_, not_, func as sa_func, select, join
@@ -267,6 +269,86 @@ def get_process_type_filter(classifiers, subclassing):
     return filter
 
 
+QueryPlan = collections.namedtuple('QueryPlan', [
+    'query', 'aliased_path', 'tag_to_alias_map', 'tag_to_projected_property_dict', 'attrkeys_as_in_sql_result',
+    'nr_of_projections', 'tags_location_dict'
+])
+
+
+class QueryPlanCache(object):
+    """
+    A least recently used cache of the queries built by the :class:`QueryBuilder`, keyed by the hash of the queryhelp.
+
+    Building the SQLAlchemy query of a queryhelp, with all its joins, filters and projections, can take longer than
+    executing it for simple queries. A query that is built once is therefore stored, together with the aliases and
+    projection mappings that are needed to process its results, such that other instances of the
+    :class:`QueryBuilder` with the same queryhelp can reuse it. The cache is cleared when a query of another backend is
+    stored, since the aliases of the cached queries are specific to the backend they were built for.
+
+    The maximum number of queries in the cache is set by the `querybuilder.plan_cache_size` option, zero disables it.
+    Since the filter values are part of the queryhelp, a query is only reused for identical filter values, so the
+    cache is disabled by default and only of use for applications that repeatedly issue the very same queries.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._plans = collections.OrderedDict()
+        self._backend = None
+
+    def __len__(self):
+        return len(self._plans)
+
+    def get(self, backend, key):
+        """
+        Return the plan that was stored for the given key and backend.
+
+        :param backend: the backend for which the query is built
+        :param key: the hash of the queryhelp
+        :returns: the `QueryPlan` or None if it is not in the cache
+        """
+        with self._lock:
+            if backend is not self._backend:
+                return None
+            try:
+                plan = self._plans.pop(key)
+            except KeyError:
+                return None
+            self._plans[key] = plan
+            return plan
+
+    def set(self, backend, key, plan):
+        """
+        Store the plan for the given key and backend, evicting the least recently used plan if the cache is full.
+
+        :param backend: the backend for which the query is built
+        :param key: the hash of the queryhelp
+        :param plan: the `QueryPlan` to store
+        """
+        from aiida.manage.configuration import get_config_option
+
+        size = get_config_option('querybuilder.plan_cache_size')
+
+        with self._lock:
+            if backend is not self._backend:
+                self._plans.clear()
+                self._backend = backend
+            self._plans.pop(key, None)
+            if size <= 0:
+                return
+            while len(self._plans) >= size:
+                self._plans.popitem(last=False)
+            self._plans[key] = plan
+
+    def clear(self):
+        """Remove all plans from the cache."""
+        with self._lock:
+            self._plans.clear()
+            self._backend = None
+
+
+QUERY_PLAN_CACHE = QueryPlanCache()
+
+
 class QueryBuilder(object):
     """
     The class to query the AiiDA database.
@@ -319,6 +401,7 @@ class QueryBuilder(object):
 
         """
         backend = backend or get_manager().get_backend()
+        self._backend = backend
         self._impl = backend.query()
 
         # A list storing the path being traversed by the query
@@ -2032,17 +2115,53 @@ class QueryBuilder(object):
             need_to_build = True
 
         if need_to_build:
-            query = self._build()
+            query = self._build_or_load_plan(queryhelp_hash)
             self._hash = queryhelp_hash
         else:
             try:
                 query = self._query
             except AttributeError:
                 _LOGGER.warning("AttributeError thrown even though I should have _query as an attribute")
-                query = self._build()
+                query = self._build_or_load_plan(queryhelp_hash)
                 self._hash = queryhelp_hash
         return query
 
+    def _build_or_load_plan(self, queryhelp_hash):
+        """
+        Load the query for the given queryhelp hash from the :class:`QueryPlanCache`, or build and store it.
+
+        When the query is loaded, the aliases and the projection mappings it was built with replace those of this
+        instance, and the query is bound to the current session.
+
+        :param queryhelp_hash: the hash of the json-compatible queryhelp
+        :returns: an instance of sqlalchemy.orm.Query that is specific to the backend used.
+        """
+        plan = QUERY_PLAN_CACHE.get(self._backend, queryhelp_hash)
+
+        if plan is None:
+            query = self._build()
+            QUERY_PLAN_CACHE.set(
+                self._backend, queryhelp_hash,
+                QueryPlan(
+                    query=query,
+                    aliased_path=list(self._aliased_path),
+                    tag_to_alias_map=dict(self.tag_to_alias_map),
+                    tag_to_projected_property_dict=copy.deepcopy(self.tag_to_projected_property_dict),
+                    attrkeys_as_in_sql_result=dict(self._attrkeys_as_in_sql_result),
+                    nr_of_projections=self.nr_of_projections,
+                    tags_location_dict=dict(self.tags_location_dict)))
+            return query
+
+        self._aliased_path = list(plan.aliased_path)
+        self.tag_to_alias_map = dict(plan.tag_to_alias_map)
+        self.tag_to_projected_property_dict = copy.deepcopy(plan.tag_to_projected_property_dict)
+        self._attrkeys_as_in_sql_result = dict(plan.attrkeys_as_in_sql_result)
+        self.nr_of_projections = plan.nr_of_projections
+        self.tags_location_dict = dict(plan.tags_location_dict)
+        self._query = plan.query.with_session(self._impl.get_session())
+
+        return self._query
+
     @staticmethod
     def get_aiida_entity_res(value):
         """Convert a projected query result to front end class if it is an instance of a `BackendEntity`.
@@ -2257,6 +2376,82 @@ class QueryBuilder(object):
         """
         return list(self.iterdict(batch_size=batch_size))
 
+    def _get_node_query(self, tag):
+        """
+        Return the query together with the alias of the vertex with the given tag, which has to be a node.
+
+        :param tag: the tag of the vertex, which can be None if the query has a single vertex
+        :returns: a tuple of the query and the alias
+        :raises InputValidationError: if the tag is not specified for a query with multiple vertices, or if the vertex
+            is not a node
+        """
+        if tag is None:
+            if len(self._path) != 1:
+                raise InputValidationError('the query has more than one vertex, the tag of the vertex has to be given')
+            tag = self._path[0]['tag']
+
+        tag = self._get_tag_from_specification(tag)
+        query = self.get_query()
+        alias = self.tag_to_alias_map[tag]
+
+        if not issubclass(alias._sa_class_manager.class_, self._impl.Node):  # pylint: disable=protected-access
+            raise InputValidationError('the vertex with tag `{}` is not a node'.format(tag))
+
+        return query, alias
+
+    def update_extras(self, extras, tag=None):
+        """
+        Set the given extras on all nodes matched by the query, without loading them.
+
+        The extras are merged into the existing extras of the nodes by a single update statement, which is executed
+        directly, overriding extras with the same keys and leaving the others untouched.
+        Usage::
+
+            qb = QueryBuilder()
+            qb.append(StructureData, filters={'extras.source': 'icsd'})
+            qb.update_extras({'curated': True})
+
+        :param dict extras: the extras to set
+        :param str tag: the tag of the vertex whose nodes to update, can be omitted if the query has a single vertex
+        :returns: the number of updated nodes
+        :raises InputValidationError: if the tag is not specified for a query with multiple vertices, or if the vertex
+            is not a node
+        :raises aiida.common.ValidationError: if any of the keys are invalid, i.e. contain periods
+        """
+        from aiida.orm.utils.node import clean_value, validate_attribute_extra_key
+
+        for key in extras:
+            validate_attribute_extra_key(key)
+
+        query, alias = self._get_node_query(tag)
+        return self._impl.update_extras(query, alias, clean_value(extras))
+
+    def delete_extras(self, keys, tag=None):
+        """
+        Delete the given extras from all nodes matched by the query, without loading them.
+
+        The extras are deleted by a single update statement, which is executed directly and only touches the nodes that
+        have at least one of the extras. Unlike `Node.delete_extra_many`, it is not an error if an extra does not exist.
+        Usage::
+
+            qb = QueryBuilder()
+            qb.append(StructureData, filters={'extras': {'has_key': 'obsolete'}})
+            qb.delete_extras(['obsolete'])
+
+        :param list keys: the names of the extras to delete
+        :param str tag: the tag of the vertex whose nodes to update, can be omitted if the query has a single vertex
+        :returns: the number of updated nodes
+        :raises InputValidationError: if the tag is not specified for a query with multiple vertices, or if the vertex
+            is not a node
+        """
+        keys = list(keys)
+
+        if not keys:
+            return 0
+
+        query, alias = self._get_node_query(tag)
+        return self._impl.delete_extras(query, alias, keys)
+
     def inputs(self, **kwargs):
         """
         Join to inputs of previous vertice in path.
@@ -122,22 +122,24 @@ def validate_link(source, target, link_type, link_label):
     if not isinstance(source, type_source) or not isinstance(target, type_target):
         raise ValueError('cannot add a {} link from {} to {}'.format(link_type, type(source), type(target)))
 
-    # Validate the outdegree of the source node
-    outgoing = source.get_outgoing(link_type=link_type)
-
-    # If the outdegree is `unique` there cannot already be any other incoming links of that type
-    if outdegree == 'unique' and outgoing.all():
-        raise ValueError('node<{}> already has an outgoing {} link'.format(source.uuid, link_type))
-
-    # If the outdegree is `unique_pair` than the link labels for outgoing links of this type should be unique
-    elif outdegree == 'unique_pair' and LinkPair(link_type, link_label) in outgoing.all_link_pairs():
-        raise ValueError('node<{}> already has an outgoing {} link with label "{}"'.format(
-            target.uuid, link_type, link_label))
-
-    # If the outdegree is `unique_triple` than the link triples of link type, link label and target should be unique
-    elif outdegree == 'unique_triple' and LinkTriple(target, link_type, link_label) in outgoing.all():
-        raise ValueError('node<{}> already has an outgoing {} link with label "{}" from node<{}>'.format(
-            source.uuid, link_type, link_label, target.uuid))
+    # Validate the outdegree of the source node. The outgoing links of the source only contain stored target nodes, so
+    # if the outdegree is `unique_triple` and the target is not stored, the outgoing links do not have to be queried.
+    if outdegree != 'unique_triple' or target.is_stored:
+        outgoing = source.get_outgoing(link_type=link_type)
+
+        # If the outdegree is `unique` there cannot already be any other incoming links of that type
+        if outdegree == 'unique' and outgoing.all():
+            raise ValueError('node<{}> already has an outgoing {} link'.format(source.uuid, link_type))
+
+        # If the outdegree is `unique_pair` than the link labels for outgoing links of this type should be unique
+        elif outdegree == 'unique_pair' and LinkPair(link_type, link_label) in outgoing.all_link_pairs():
+            raise ValueError('node<{}> already has an outgoing {} link with label "{}"'.format(
+                target.uuid, link_type, link_label))
+
+        # If the outdegree is `unique_triple` than the link triples of link type, link label and target should be unique
+        elif outdegree == 'unique_triple' and LinkTriple(target, link_type, link_label) in outgoing.all():
+            raise ValueError('node<{}> already has an outgoing {} link with label "{}" from node<{}>'.format(
+                source.uuid, link_type, link_label, target.uuid))
 
     # Validate the indegree of the target node
     incoming = target.get_incoming(link_type=link_type)
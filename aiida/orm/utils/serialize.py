@@ -18,9 +18,16 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import absolute_import
 
+import base64
+import collections
 from functools import partial
 import yaml
 
+try:
+    import msgpack
+except ImportError:  # pragma: no cover
+    msgpack = None
+
 from plumpy import Bundle
 from plumpy.utils import AttributesFrozendict
 
@@ -34,6 +41,18 @@ _ATTRIBUTE_DICT_TAG = '!aiida_attributedict'
 _PLUMPY_ATTRIBUTES_FROZENDICT_TAG = '!plumpy:attributes_frozendict'
 _PLUMPY_BUNDLE = '!plumpy:bundle'
 
+_MSGPACK_CHECKPOINT_PREFIX = u'msgpack:'
+_MSGPACK_EXT_NODE = 1
+_MSGPACK_EXT_GROUP = 2
+_MSGPACK_EXT_COMPUTER = 3
+_MSGPACK_EXT_ATTRIBUTE_DICT = 4
+_MSGPACK_EXT_PLUMPY_ATTRIBUTES_FROZENDICT = 5
+_MSGPACK_EXT_PLUMPY_BUNDLE = 6
+_MSGPACK_EXT_TUPLE = 7
+_MSGPACK_EXT_YAML = 8
+
+CheckpointCodec = collections.namedtuple('CheckpointCodec', ['prefix', 'encode', 'decode'])
+
 
 def represent_node(dumper, node):
     """Represent a node in yaml.
@@ -222,3 +241,148 @@ def deserialize(serialized):
     :return: the deserialized data structure
     """
     return yaml.load(serialized, Loader=AiiDALoader)
+
+
+def _msgpack_default(data):
+    """Convert data that msgpack cannot pack natively into an extension type.
+
+    Nodes, groups and computers are stored by their UUID just as in the yaml representation. Any other type that is not
+    known explicitly is embedded as a yaml dump, so that everything that can be serialized with `serialize` can also be
+    packed into a msgpack checkpoint.
+
+    :param data: the data to convert
+    :return: the extension type
+    :rtype: :class:`msgpack.ExtType`
+    """
+    # pylint: disable=too-many-return-statements
+    if isinstance(data, orm.Node):
+        if not data.is_stored:
+            raise ValueError('node {}<{}> cannot be represented because it is not stored'.format(type(data), data.uuid))
+        return msgpack.ExtType(_MSGPACK_EXT_NODE, data.uuid.encode('utf-8'))
+    if isinstance(data, orm.Group):
+        if not data.is_stored:
+            raise ValueError('group {} cannot be represented because it is not stored'.format(data))
+        return msgpack.ExtType(_MSGPACK_EXT_GROUP, data.uuid.encode('utf-8'))
+    if isinstance(data, orm.Computer):
+        if not data.is_stored:
+            raise ValueError('computer {} cannot be represented because it is not stored'.format(data))
+        return msgpack.ExtType(_MSGPACK_EXT_COMPUTER, data.uuid.encode('utf-8'))
+    if isinstance(data, Bundle):
+        return msgpack.ExtType(_MSGPACK_EXT_PLUMPY_BUNDLE, _msgpack_pack(dict(data)))
+    if isinstance(data, AttributeDict):
+        return msgpack.ExtType(_MSGPACK_EXT_ATTRIBUTE_DICT, _msgpack_pack(dict(data)))
+    if isinstance(data, AttributesFrozendict):
+        return msgpack.ExtType(_MSGPACK_EXT_PLUMPY_ATTRIBUTES_FROZENDICT, _msgpack_pack(dict(data)))
+    if isinstance(data, tuple):
+        return msgpack.ExtType(_MSGPACK_EXT_TUPLE, _msgpack_pack(list(data)))
+
+    return msgpack.ExtType(_MSGPACK_EXT_YAML, serialize(data, encoding='utf-8'))
+
+
+def _msgpack_ext_hook(code, data):
+    """Reconstruct the data from a msgpack extension type created by `_msgpack_default`.
+
+    :param code: the extension type code
+    :param data: the packed data of the extension type
+    :return: the reconstructed data
+    """
+    # pylint: disable=too-many-return-statements
+    if code == _MSGPACK_EXT_NODE:
+        return orm.load_node(uuid=data.decode('utf-8'))
+    if code == _MSGPACK_EXT_GROUP:
+        return orm.load_group(uuid=data.decode('utf-8'))
+    if code == _MSGPACK_EXT_COMPUTER:
+        return orm.Computer.get(uuid=data.decode('utf-8'))
+    if code == _MSGPACK_EXT_PLUMPY_BUNDLE:
+        bundle = Bundle.__new__(Bundle)
+        bundle.update(_msgpack_unpack(data))
+        return bundle
+    if code == _MSGPACK_EXT_ATTRIBUTE_DICT:
+        return AttributeDict(_msgpack_unpack(data))
+    if code == _MSGPACK_EXT_PLUMPY_ATTRIBUTES_FROZENDICT:
+        return AttributesFrozendict(_msgpack_unpack(data))
+    if code == _MSGPACK_EXT_TUPLE:
+        return tuple(_msgpack_unpack(data))
+    if code == _MSGPACK_EXT_YAML:
+        return deserialize(data)
+
+    return msgpack.ExtType(code, data)
+
+
+def _msgpack_pack(data):
+    """Pack the data into msgpack bytes, using extension types for AiiDA entities and non-native types."""
+    return msgpack.packb(data, default=_msgpack_default, use_bin_type=True, strict_types=True)
+
+
+def _msgpack_unpack(packed):
+    """Unpack msgpack bytes created by `_msgpack_pack`."""
+    return msgpack.unpackb(packed, ext_hook=_msgpack_ext_hook, raw=False, strict_map_key=False)
+
+
+def _encode_msgpack_checkpoint(data):
+    """Encode the data into a msgpack checkpoint string.
+
+    Checkpoints are stored as a string attribute, so the packed bytes are base64 encoded and prefixed with a marker
+    that distinguishes them from yaml checkpoints.
+
+    :param data: the data to encode
+    :return: the checkpoint string
+    :raises ImportError: if the `msgpack` package is not installed
+    """
+    if msgpack is None:
+        raise ImportError('the `msgpack` checkpoint codec requires the `msgpack` package to be installed')
+
+    return _MSGPACK_CHECKPOINT_PREFIX + base64.b64encode(_msgpack_pack(data)).decode('ascii')
+
+
+def _decode_msgpack_checkpoint(checkpoint):
+    """Decode a checkpoint string created by `_encode_msgpack_checkpoint`.
+
+    :param checkpoint: the checkpoint string
+    :return: the decoded data
+    :raises ImportError: if the `msgpack` package is not installed
+    """
+    if msgpack is None:
+        raise ImportError('reading a msgpack checkpoint requires the `msgpack` package to be installed')
+
+    return _msgpack_unpack(base64.b64decode(checkpoint[len(_MSGPACK_CHECKPOINT_PREFIX):]))
+
+
+CHECKPOINT_CODECS = {
+    'yaml': CheckpointCodec(None, serialize, deserialize),
+    'msgpack': CheckpointCodec(_MSGPACK_CHECKPOINT_PREFIX, _encode_msgpack_checkpoint, _decode_msgpack_checkpoint),
+}
+
+
+def serialize_checkpoint(data, codec='yaml'):
+    """Serialize the given process checkpoint into a string with the given codec.
+
+    :param data: the checkpoint bundle or general data structure to serialize
+    :param codec: the name of the codec in `CHECKPOINT_CODECS` to use
+    :return: string representation of the checkpoint
+    :raises ValueError: if the codec does not exist
+    :raises ImportError: if the codec requires a package that is not installed
+    """
+    try:
+        encode = CHECKPOINT_CODECS[codec].encode
+    except KeyError:
+        raise ValueError('unknown checkpoint codec `{}`, valid codecs are: {}'.format(
+            codec, ', '.join(sorted(CHECKPOINT_CODECS))))
+
+    return encode(data)
+
+
+def deserialize_checkpoint(checkpoint):
+    """Deserialize a process checkpoint string, independent of the codec that was used to write it.
+
+    The codec is recognized from the prefix of the checkpoint, where checkpoints without known prefix, including all
+    checkpoints written before codecs were introduced, are parsed as yaml.
+
+    :param checkpoint: the checkpoint string
+    :return: the deserialized checkpoint
+    """
+    for codec in CHECKPOINT_CODECS.values():
+        if codec.prefix is not None and checkpoint.startswith(codec.prefix):
+            return codec.decode(checkpoint)
+
+    return deserialize(checkpoint)
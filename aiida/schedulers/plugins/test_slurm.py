@@ -16,6 +16,8 @@ import logging
 import uuid
 import datetime
 
+import mock
+
 from aiida.schedulers.plugins.slurm import *
 
 TEXT_SQUEUE_TO_TEST = """862540^^^PD^^^Dependency^^^n/a^^^user1^^^20^^^640^^^(Dependency)^^^normal^^^1-00:00:00^^^0:00^^^N/A^^^longsqw_L24_q_10_0^^^2013-05-22T01:41:11
@@ -320,5 +322,61 @@ class TestSubmitScript(unittest.TestCase):
                 num_machines=1, num_mpiprocs_per_machine=1, num_cores_per_machine=24, num_cores_per_mpiproc=23)
 
 
+class TestSubmitMany(unittest.TestCase):
+    """Test the batched submission of multiple scripts with a single command."""
+
+    def test_submit_many_command(self):
+        """Test that the batched command submits each script from its working directory."""
+        scheduler = SlurmScheduler()
+        command = scheduler._get_command_many([
+            "cd '/scratch/a' && {}".format(scheduler._get_submit_command("'_aiidasubmit.sh'")),
+            "cd '/scratch/b' && {}".format(scheduler._get_submit_command("'job.sh'")),
+        ])
+
+        self.assertIn("(cd '/scratch/a' && sbatch '_aiidasubmit.sh')", command)
+        self.assertIn("(cd '/scratch/b' && sbatch 'job.sh')", command)
+
+    def test_parse_command_many_output(self):
+        """Test that the output of each command in the batch is parsed individually."""
+        scheduler = SlurmScheduler()
+        marker = scheduler._COMMAND_MANY_MARKER
+
+        stdout = '\n'.join([
+            '{} 0 0'.format(marker), 'Submitted batch job 1001', '', marker, '', marker,
+            '{} 2 1'.format(marker), '', marker, 'sbatch: error: invalid partition', '', marker, ''
+        ])
+        outputs = scheduler._parse_command_many_output(0, stdout, '', 3)
+
+        self.assertEqual(outputs[0], (0, 'Submitted batch job 1001\n', ''))
+        self.assertEqual(outputs[1], None)
+        self.assertEqual(outputs[2], (1, '', 'sbatch: error: invalid partition\n'))
+
+        with self.assertRaises(SchedulerError):
+            scheduler._parse_command_many_output(1, '', 'mktemp: failed', 2)
+
+
+class TestKillMany(unittest.TestCase):
+    """Test killing multiple jobs with a single command."""
+
+    def test_kill_many(self):
+        """Test that the kill output of each job in the batch is parsed individually."""
+        scheduler = SlurmScheduler()
+        marker = scheduler._COMMAND_MANY_MARKER
+        scheduler._logger = logging.getLogger('test_slurm')
+
+        stdout = '\n'.join([
+            '{} 0 0'.format(marker), '', marker, '', marker,
+            '{} 1 1'.format(marker), '', marker, 'scancel: error: Invalid job id', '', marker, ''
+        ])
+        transport = mock.Mock()
+        transport.exec_command_wait.return_value = (0, stdout, '')
+        scheduler.set_transport(transport)
+
+        self.assertEqual(scheduler.kill_many(['1001', '1002']), {'1001': True, '1002': False})
+        command = transport.exec_command_wait.call_args[0][0]
+        self.assertIn('(scancel 1001)', command)
+        self.assertIn('(scancel 1002)', command)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -50,6 +50,9 @@ class Scheduler(object):
     # The class to be used for the job resource.
     _job_resource_class = None
 
+    # Marker used to separate the outputs of the individual commands executed by `_exec_command_many`
+    _COMMAND_MANY_MARKER = '__AIIDA_COMMAND_MANY__'
+
     def __init__(self):
         self._transport = None
 
@@ -306,6 +309,41 @@ class Scheduler(object):
         with self.transport:
             retval, stdout, stderr = self.transport.exec_command_wait(command)
 
+        return self._format_detailed_jobinfo(command, retval, stdout, stderr)
+
+    def get_detailed_jobinfo_many(self, jobids):
+        """
+        Return the output of the detailed_jobinfo command for multiple jobs, retrieved with a single remote command.
+
+        Typically, this function does not need to be modified by the plugins.
+
+        :param list jobids: the job ids for which to get the detailed job information
+        :return: a dictionary with as keys the job ids and as values the strings as returned by `get_detailed_jobinfo`
+        :raises: :class:`aiida.common.exceptions.FeatureNotAvailable`
+        """
+        if not jobids:
+            return {}
+
+        # pylint: disable=assignment-from-no-return
+        commands = [self._get_detailed_jobinfo_command(jobid=jobid) for jobid in jobids]
+
+        with self.transport:
+            outputs = self._exec_command_many(commands)
+
+        detailed_jobinfo = {}
+
+        for jobid, command, output in zip(jobids, commands, outputs):
+            if output is None:
+                output = (None, '', 'No output found in the output of the batched command')
+            detailed_jobinfo[jobid] = self._format_detailed_jobinfo(command, *output)
+
+        return detailed_jobinfo
+
+    @staticmethod
+    def _format_detailed_jobinfo(command, retval, stdout, stderr):
+        """
+        Return the string reporting the output of a detailed_jobinfo command.
+        """
         return u"""Detailed jobinfo obtained with command '{}'
 Return Code: {}
 -------------------------------------------------------------
@@ -406,6 +444,126 @@ stderr:
             self._get_submit_command(escape_for_bash(submit_script)))
         return self._parse_submit_output(retval, stdout, stderr)
 
+    def _get_command_many(self, commands):
+        """
+        Return a single shell command that executes all the given commands one after the other.
+
+        Each command is executed in a subshell, after which its exit status, stdout and stderr are printed between lines
+        starting with `_COMMAND_MANY_MARKER`, such that they can be parsed back by `_parse_command_many_output`.
+
+        Typically, this function does not need to be modified by the plugins.
+
+        :param list commands: the commands to execute
+        :return: the string to execute to run all commands
+        """
+        marker = self._COMMAND_MANY_MARKER
+        lines = ['_aiida_tmp=$(mktemp -d) || exit 1']
+
+        for index, command in enumerate(commands):
+            lines.append('({}) > "$_aiida_tmp/stdout" 2> "$_aiida_tmp/stderr"'.format(command))
+            lines.append('echo "{} {} $?"'.format(marker, index))
+            lines.append('cat "$_aiida_tmp/stdout"; echo')
+            lines.append('echo "{}"'.format(marker))
+            lines.append('cat "$_aiida_tmp/stderr"; echo')
+            lines.append('echo "{}"'.format(marker))
+
+        lines.append('rm -rf "$_aiida_tmp"')
+
+        return '\n'.join(lines)
+
+    def _parse_command_many_output(self, retval, stdout, stderr, num_commands):
+        """
+        Parse the output of the command returned by `_get_command_many`.
+
+        Typically, this function does not need to be modified by the plugins.
+
+        :return: list with for each command a tuple of its exit status, stdout and stderr, or None if its output could
+            not be found
+        :raises SchedulerError: if the batched command failed or its output cannot be parsed
+        """
+        marker = self._COMMAND_MANY_MARKER
+
+        if retval != 0:
+            raise SchedulerError('Error during batched command, retval={}\nstdout={}\nstderr={}'.format(
+                retval, stdout, stderr))
+
+        outputs = [None] * num_commands
+        lines = stdout.split('\n')
+        index = 0
+
+        while index < len(lines):
+            line = lines[index]
+            index += 1
+
+            if not line.startswith(marker + ' '):
+                continue
+
+            try:
+                _, command_index, command_retval = line.split()
+                end_stdout = lines.index(marker, index)
+                end_stderr = lines.index(marker, end_stdout + 1)
+                command_index = int(command_index)
+                command_retval = int(command_retval)
+            except ValueError:
+                raise SchedulerError('Invalid batched command output, stdout={}\nstderr={}'.format(stdout, stderr))
+
+            # Each block was followed by an additional newline, which is consumed by splitting the lines
+            command_stdout = '\n'.join(lines[index:end_stdout])
+            command_stderr = '\n'.join(lines[end_stdout + 1:end_stderr])
+            outputs[command_index] = (command_retval, command_stdout, command_stderr)
+            index = end_stderr + 1
+
+        return outputs
+
+    def _exec_command_many(self, commands):
+        """
+        Execute the given commands with a single remote command.
+
+        Typically, this function does not need to be modified by the plugins.
+
+        :param list commands: the commands to execute
+        :return: list with for each command a tuple of its exit status, stdout and stderr, or None if its output could
+            not be found
+        :raises SchedulerError: if the batched command failed or its output cannot be parsed
+        """
+        retval, stdout, stderr = self.transport.exec_command_wait(self._get_command_many(commands))
+        return self._parse_command_many_output(retval, stdout, stderr, len(commands))
+
+    def submit_from_script_many(self, submissions):
+        """
+        Submit multiple scripts, each from its working directory, with a single remote command.
+
+        Return a list with for each submission either a string with the JobID in a valid format to be used for
+        querying, or the exception that was raised while parsing the output of its submission. This allows the caller
+        to handle failed submissions individually.
+
+        Typically, this function does not need to be modified by the plugins.
+
+        :param submissions: list of tuples of the working directory and the path of the submit script relative to it
+        :return: list of job ids or exceptions, in the same order as the submissions
+        :raises SchedulerError: if the batched submission command itself failed
+        """
+        if not submissions:
+            return []
+
+        commands = [
+            'cd {} && {}'.format(escape_for_bash(working_directory), self._get_submit_command(escape_for_bash(script)))
+            for working_directory, script in submissions
+        ]
+
+        results = []
+
+        for output in self._exec_command_many(commands):
+            if output is None:
+                results.append(SchedulerError('No output found in the output of the batched submission'))
+                continue
+            try:
+                results.append(self._parse_submit_output(*output))
+            except Exception as exception:  # pylint: disable=broad-except
+                results.append(exception)
+
+        return results
+
     def kill(self, jobid):
         """
         Kill a remote job, and try to parse the output message of the scheduler
@@ -421,6 +579,26 @@ stderr:
         retval, stdout, stderr = self.transport.exec_command_wait(self._get_kill_command(jobid))
         return self._parse_kill_output(retval, stdout, stderr)
 
+    def kill_many(self, jobids):
+        """
+        Kill multiple remote jobs with a single remote command, parsing the output of each kill command individually.
+
+        Typically, this function does not need to be modified by the plugins.
+
+        :param list jobids: the job ids to be killed
+        :return: a dictionary with as keys the job ids and as values True if the kill seems ok, False otherwise.
+        """
+        if not jobids:
+            return {}
+
+        outputs = self._exec_command_many([self._get_kill_command(jobid) for jobid in jobids])
+        results = {}
+
+        for jobid, output in zip(jobids, outputs):
+            results[jobid] = output is not None and self._parse_kill_output(*output)
+
+        return results
+
     def _get_kill_command(self, jobid):
         """
         Return the command to kill the job with specified jobid.
@@ -344,6 +344,29 @@ class LocalTransport(Transport):
 
         shutil.copyfile(localpath, the_destination)
 
+    def put_object_from_filelike(self, handle, remotepath, *args, **kwargs):
+        """
+        Copies the content of a file-like object to remotepath.
+
+        :param handle: file-like object opened in binary mode
+        :param remotepath: path to remote file
+        :param overwrite: if True overwrites remotepath
+                                 Default = True
+
+        :raise IOError: if remotepath is not valid
+        :raise OSError: if remotepath exists and overwrite is False
+        """
+        overwrite = kwargs.get('overwrite', args[0] if args else True)
+        if not remotepath:
+            raise IOError("Input remotepath to put_object_from_filelike must be a non empty string")
+
+        the_destination = os.path.join(self.curdir, remotepath)
+        if os.path.exists(the_destination) and not overwrite:
+            raise OSError('Destination already exists: not overwriting it')
+
+        with open(the_destination, 'wb') as destination:
+            shutil.copyfileobj(handle, destination)
+
     def puttree(self, localpath, remotepath, *args, **kwargs):
         """
         Copies a folder recursively from localpath to remotepath.
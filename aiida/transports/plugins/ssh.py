@@ -90,13 +90,17 @@ class SshTransport(Transport):
     # instance
     _valid_auth_options = _valid_connect_options + [
         ('load_system_host_keys', {'switch': True, 'prompt': 'Load system host keys', 'help': 'switch loading system host keys on / off', 'non_interactive_default': True}),
-        ('key_policy', {'type': click.Choice(['RejectPolicy', 'WarningPolicy', 'AutoAddPolicy']), 'prompt': 'Key policy', 'help': 'SSH key policy', 'non_interactive_default': True})
+        ('key_policy', {'type': click.Choice(['RejectPolicy', 'WarningPolicy', 'AutoAddPolicy']), 'prompt': 'Key policy', 'help': 'SSH key policy', 'non_interactive_default': True}),
+        ('transfer_channels', {'type': int, 'prompt': 'Number of SFTP transfer channels', 'help': 'number of SFTP channels over which the files of a folder are transferred concurrently', 'non_interactive_default': True})
     ]
 
     # I set the (default) value here to 5 secs between consecutive SSH checks.
     # This should be incremented to 30, probably.
     _DEFAULT_SAFE_OPEN_INTERVAL = 5
 
+    # By default, the files of a folder are transferred one after the other over the SFTP channel of the transport
+    _DEFAULT_TRANSFER_CHANNELS = 1
+
     @classmethod
     def _get_username_suggestion_string(cls, computer):
         """
@@ -216,6 +220,13 @@ class SshTransport(Transport):
         """
         return "RejectPolicy"
 
+    @classmethod
+    def _get_transfer_channels_suggestion_string(cls, computer):
+        """
+        Return a suggestion for the specific field.
+        """
+        return cls._DEFAULT_TRANSFER_CHANNELS
+
     @classmethod
     def _get_gss_auth_suggestion_string(cls, computer):
         """
@@ -261,6 +272,8 @@ class SshTransport(Transport):
            if False, do not load the system host keys
         :param key_policy: (optional, default = paramiko.RejectPolicy())
            the policy to use for unknown keys
+        :param transfer_channels: (optional, default 1)
+           the number of SFTP channels over which puttree and gettree transfer files concurrently
 
         Other parameters valid for the ssh connect function (see the
         self._valid_connect_params list) are passed to the connect
@@ -282,6 +295,7 @@ class SshTransport(Transport):
             self._client.load_system_host_keys()
 
         self._safe_open_interval = kwargs.pop('safe_interval', self._DEFAULT_SAFE_OPEN_INTERVAL)
+        self._transfer_channels = int(kwargs.pop('transfer_channels', self._DEFAULT_TRANSFER_CHANNELS))
 
         self._missing_key_policy = kwargs.pop('key_policy', 'RejectPolicy')  # This is paramiko default
         if self._missing_key_policy == 'RejectPolicy':
@@ -360,6 +374,30 @@ class SshTransport(Transport):
         self._client.close()
         self._is_open = False
 
+    def is_alive(self):
+        """
+        Return whether the transport is open and the underlying SSH connection is still active.
+
+        :rtype: bool
+        """
+        if not self._is_open:
+            return False
+
+        transport = self._client.get_transport()
+        return transport is not None and transport.is_active()
+
+    def set_keepalive(self, interval):
+        """
+        Send keepalive packets over the SSH connection every `interval` seconds, zero disables them.
+
+        :param interval: the interval in seconds between keepalive packets
+        :type interval: float
+        """
+        if not self._is_open:
+            raise TransportInternalError("Error, cannot set keepalive for SshTransport without opening it first")
+
+        self._client.get_transport().set_keepalive(int(interval))
+
     @property
     def sshclient(self):
         if not self._is_open:
@@ -686,6 +724,22 @@ class SshTransport(Transport):
 
         return self.sftp.put(localpath, remotepath, callback=callback)
 
+    def put_object_from_filelike(self, handle, remotepath, callback=None, overwrite=True):
+        """
+        Put the content of a file-like object to a remote file, streaming it over the SFTP channel.
+
+        :param handle: file-like object opened in binary mode
+        :param remotepath: a remote path
+        :param overwrite: if True overwrites the remote file (boolean).
+            Default = True.
+
+        :raise OSError: if unintentionally overwriting
+        """
+        if self.isfile(remotepath) and not overwrite:
+            raise OSError('Destination already exists: not overwriting it')
+
+        return self.sftp.putfo(handle, remotepath, callback=callback)
+
     def puttree(self, localpath, remotepath, callback=None, dereference=True, overwrite=True):  # by default overwrite
         """
         Put a folder recursively from local to remote.
@@ -731,6 +785,9 @@ class SshTransport(Transport):
             remotepath = os.path.join(remotepath, os.path.split(localpath)[1])
             self.mkdir(remotepath)  # create a nested folder
 
+        # The folders are created first, the files are then transferred, possibly over concurrent channels
+        transfers = []
+
         # TODO, NOTE: we are not using 'onerror' because we checked above that
         # the folder exists, but it would be better to use it
         for this_source in os.walk(localpath):
@@ -749,7 +806,9 @@ class SshTransport(Transport):
             for this_file in this_source[2]:
                 this_local_file = os.path.join(localpath, this_basename, this_file)
                 this_remote_file = os.path.join(remotepath, this_basename, this_file)
-                self.putfile(this_local_file, this_remote_file)
+                transfers.append((this_local_file, this_remote_file))
+
+        self._transfer_files(transfers, upload=True)
 
     def get(self, remotepath, localpath, callback=None, dereference=True, overwrite=True, ignore_nonexisting=False):
         """
@@ -892,16 +951,113 @@ class SshTransport(Transport):
             localpath = os.path.join(localpath, os.path.split(remotepath)[1])
             os.mkdir(localpath)  # create a nested folder
 
-        item_list = self.listdir(remotepath)
-        dest = str(localpath)
+        # The folders are created first, the files are then transferred, possibly over concurrent channels
+        transfers = []
+        self._collect_gettree(remotepath, str(localpath), transfers)
+        self._transfer_files(transfers, upload=False)
 
-        for item in item_list:
+    def _collect_gettree(self, remotepath, localpath, transfers):
+        """
+        Create the local folders of the remote tree and collect the files to retrieve.
+
+        :param remotepath: a remote path of an existing folder
+        :param localpath: an (absolute) local path of an existing folder
+        :param transfers: list to which the tuples of remote and local file paths are appended
+        """
+        for item in self.listdir(remotepath):
             item = str(item)
 
             if self.isdir(os.path.join(remotepath, item)):
-                self.gettree(os.path.join(remotepath, item), os.path.join(dest, item))
+                os.mkdir(os.path.join(localpath, item))
+                self._collect_gettree(os.path.join(remotepath, item), os.path.join(localpath, item), transfers)
             else:
-                self.getfile(os.path.join(remotepath, item), os.path.join(dest, item))
+                transfers.append((os.path.join(remotepath, item), os.path.join(localpath, item)))
+
+    def _transfer_files(self, transfers, upload):
+        """
+        Transfer a list of files, concurrently over multiple SFTP channels if more than one transfer channel is set.
+
+        The additional SFTP channels are opened on the SSH connection of the transport and use the same working
+        directory. Each channel is served by its own thread that takes the next file from a shared queue. If the server
+        refuses to open additional channels, the files are transferred over those that could be opened. All files are
+        attempted also if some fail, after which the error of the first failed file in the list is raised.
+
+        Note that paramiko already pipelines the writes and prefetches the reads of every single file.
+
+        :param transfers: list of tuples of source and destination paths, local and remote respectively if `upload`
+        :param upload: if True put the files from local to remote, otherwise get them from remote to local
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        from six.moves import queue
+
+        num_channels = min(self._transfer_channels, len(transfers))
+
+        if num_channels <= 1:
+            for source, destination in transfers:
+                if upload:
+                    self.putfile(source, destination)
+                else:
+                    self.getfile(source, destination)
+            return
+
+        pending = queue.Queue()
+        for index, transfer in enumerate(transfers):
+            pending.put((index, transfer))
+
+        errors = []
+
+        def transfer_files(sftp):
+            """Transfer files from the queue over the given SFTP channel until the queue is empty."""
+            while True:
+                try:
+                    index, (source, destination) = pending.get_nowait()
+                except queue.Empty:
+                    return
+                try:
+                    if upload:
+                        sftp.put(source, destination)
+                    else:
+                        self._get_with_sftp(sftp, source, destination)
+                except Exception as exception:  # pylint: disable=broad-except
+                    errors.append((index, exception))
+
+        channels = [self.sftp]
+        try:
+            for _ in range(num_channels - 1):
+                try:
+                    channel = self._client.open_sftp()
+                except Exception as exception:  # pylint: disable=broad-except
+                    # The server may limit the number of sessions per connection, so use the channels opened so far
+                    self.logger.warning('could not open additional SFTP channel: {}'.format(exception))
+                    break
+                channel.chdir(self.sftp.getcwd())
+                channels.append(channel)
+
+            with ThreadPoolExecutor(max_workers=len(channels)) as executor:
+                for future in [executor.submit(transfer_files, channel) for channel in channels]:
+                    future.result()
+        finally:
+            for channel in channels[1:]:
+                channel.close()
+
+        if errors:
+            errors.sort(key=lambda error: error[0])
+            for index, exception in errors[1:]:
+                self.logger.error('transfer of {} failed: {}'.format(transfers[index][0], exception))
+            raise errors[0][1]
+
+    @staticmethod
+    def _get_with_sftp(sftp, remotepath, localpath):
+        """Get a file over the given SFTP channel, removing the local file if the transfer fails."""
+        # Workaround for bug #724 in paramiko -- remove localpath on IOError
+        try:
+            return sftp.get(remotepath, localpath)
+        except IOError:
+            try:
+                os.remove(localpath)
+            except OSError:
+                pass
+            raise
 
     def get_attribute(self, path):
         """
@@ -597,6 +597,34 @@ class TestPutGetFile(unittest.TestCase):
             t.chdir('..')
             t.rmdir(directory)
 
+    @run_for_all_plugins
+    def test_put_object_from_filelike(self, custom_transport):
+        import os
+        import random
+        import string
+
+        remote_dir = os.path.join('/', 'tmp')
+        directory = 'tmp_try'
+
+        with custom_transport as t:
+            t.chdir(remote_dir)
+            while t.isdir(directory):
+                # I append a random letter/number until it is unique
+                directory += random.choice(string.ascii_uppercase + string.digits)
+
+            t.mkdir(directory)
+            t.chdir(directory)
+
+            content = b'Viva Verdi\n\x00\xff'
+            t.put_object_from_filelike(io.BytesIO(content), 'file_remote.bin')
+
+            with io.open(os.path.join(remote_dir, directory, 'file_remote.bin'), 'rb') as fhandle:
+                self.assertEqual(fhandle.read(), content)
+
+            t.remove('file_remote.bin')
+            t.chdir('..')
+            t.rmdir(directory)
+
     @run_for_all_plugins
     def test_put_get_abs_path(self, custom_transport):
         """
@@ -61,5 +61,49 @@ class TestBasicConnection(unittest.TestCase):
         logging.disable(logging.NOTSET)
 
 
+class TestConcurrentTransfer(unittest.TestCase):
+    """
+    Test the transfer of folders over multiple SFTP channels.
+    """
+
+    def test_puttree_gettree(self):
+        """Put and get a nested folder over multiple channels and verify that all files arrive intact."""
+        import io
+        import os
+        import shutil
+        import tempfile
+
+        local_dir = tempfile.mkdtemp()
+        remote_dir = tempfile.mkdtemp()
+        retrieved_dir = tempfile.mkdtemp()
+
+        try:
+            source = os.path.join(local_dir, 'source')
+            os.makedirs(os.path.join(source, 'nested'))
+            for index in range(10):
+                for folder in [source, os.path.join(source, 'nested')]:
+                    with io.open(os.path.join(folder, 'file_{}'.format(index)), 'w', encoding='utf8') as handle:
+                        handle.write(u'content {}'.format(index))
+
+            with SshTransport(
+                    machine='localhost',
+                    timeout=30,
+                    load_system_host_keys=True,
+                    key_policy='AutoAddPolicy',
+                    transfer_channels=4) as transport:
+                transport.chdir(remote_dir)
+                transport.puttree(source, 'remote')
+                transport.gettree('remote', os.path.join(retrieved_dir, 'retrieved'))
+
+            for folder in ['', 'nested']:
+                for index in range(10):
+                    filepath = os.path.join(retrieved_dir, 'retrieved', folder, 'file_{}'.format(index))
+                    with io.open(filepath, encoding='utf8') as handle:
+                        self.assertEqual(handle.read(), u'content {}'.format(index))
+        finally:
+            for directory in [local_dir, remote_dir, retrieved_dir]:
+                shutil.rmtree(directory)
+
+
 if __name__ == '__main__':
     unittest.main()
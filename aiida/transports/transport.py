@@ -235,6 +235,30 @@ class Transport(object):
         """
         return self._safe_open_interval
 
+    def is_alive(self):
+        """
+        Return whether the transport is open and its connection is still usable.
+
+        This is used to health-check transports that are kept open for a longer time, for example by the
+        :py:class:`~aiida.engine.transports.TransportQueue` when pooling. In the main class this is equivalent to
+        `is_open`, plugins that maintain a connection that can be dropped by the remote should override it.
+
+        :return: True if the transport can be used, False otherwise
+        :rtype: bool
+        """
+        return self.is_open
+
+    def set_keepalive(self, interval):  # pylint: disable=unused-argument,no-self-use
+        """
+        Request that keepalive packets are sent over the open connection every `interval` seconds.
+
+        In the main class this is a no-op, plugins that maintain a connection that can time out should override it.
+
+        :param interval: the interval in seconds between keepalive packets, zero disables them
+        :type interval: float
+        """
+        return
+
     def chdir(self, path):
         """
         Change directory to 'path'
@@ -594,6 +618,24 @@ class Transport(object):
         """
         raise NotImplementedError
 
+    def put_object_from_filelike(self, handle, remotepath, *args, **kwargs):
+        """
+        Put the content of a file-like object to a remote file.
+
+        The default implementation writes the content to a local temporary file and puts that with `putfile`. Plugins
+        that can stream the content directly should override this method.
+
+        :param handle: file-like object opened in binary mode
+        :param str remotepath: path to remote file
+        """
+        import shutil
+        import tempfile
+
+        with tempfile.NamedTemporaryFile(mode='wb+') as temporary:
+            shutil.copyfileobj(handle, temporary)
+            temporary.flush()
+            self.putfile(temporary.name, remotepath, *args, **kwargs)
+
     def remove(self, path):
         """
         Remove the file at the given path. This only works on files;
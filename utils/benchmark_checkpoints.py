@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida_core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Benchmark the codecs that can be used to write process checkpoints.
+
+For each codec a synthetic checkpoint, resembling that of a work chain with a context of the given size, is serialized
+and deserialized a number of times, and the average time per checkpoint and the size of the stored string are printed.
+Node references are not included, such that the benchmark does not require a configured profile.
+"""
+from __future__ import division
+from __future__ import print_function
+from __future__ import absolute_import
+
+import functools
+import timeit
+
+import click
+import tabulate
+
+
+def generate_checkpoint(size):
+    """Return a data structure resembling the checkpoint bundle of a work chain.
+
+    :param size: the number of entries in the context of the work chain
+    """
+    from aiida.common import AttributeDict
+
+    context = AttributeDict()
+    for index in range(size):
+        context['iteration_{}'.format(index)] = {
+            'energies': [float(value) / 3. for value in range(20)],
+            'label': 'calculation number {}'.format(index),
+            'converged': bool(index % 2),
+            'parameters': {'cutoff': 30 + index, 'kpoints': (4, 4, 4)},
+        }
+
+    return {
+        'CLASS_NAME': 'aiida.workflows.benchmark.BenchmarkWorkChain',
+        '_state': {'in_state': 'waiting', 'awaiting': 'on_awaiting'},
+        '_pid': 1,
+        '_paused': None,
+        '_context': context,
+        '_stepper_state': {'_position': 2},
+    }
+
+
+@click.command()
+@click.option('-s', '--size', type=int, default=100, show_default=True, help='Number of entries in the context.')
+@click.option('-r', '--repeat', type=int, default=20, show_default=True, help='Number of checkpoints per codec.')
+def benchmark(size, repeat):
+    """Print the save and load time per checkpoint for all available checkpoint codecs."""
+    from aiida.orm.utils import serialize
+
+    checkpoint = generate_checkpoint(size)
+    rows = []
+
+    for codec in sorted(serialize.CHECKPOINT_CODECS):
+        try:
+            serialized = serialize.serialize_checkpoint(checkpoint, codec=codec)
+        except ImportError as exception:
+            click.echo('skipping codec `{}`: {}'.format(codec, exception))
+            continue
+
+        save = functools.partial(serialize.serialize_checkpoint, checkpoint, codec=codec)
+        load = functools.partial(serialize.deserialize_checkpoint, serialized)
+        time_save = timeit.timeit(save, number=repeat)
+        time_load = timeit.timeit(load, number=repeat)
+
+        rows.append([codec, 1000. * time_save / repeat, 1000. * time_load / repeat, len(serialized) / 1024.])
+
+    click.echo(tabulate.tabulate(rows, headers=['Codec', 'Save [ms]', 'Load [ms]', 'Size [kB]'], floatfmt='.2f'))
+
+
+if __name__ == '__main__':
+    benchmark()  # pylint: disable=no-value-for-parameter